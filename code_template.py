@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+import re
+
+PLACEHOLDER = re.compile(r'\$\{([^}]*)\}')
+IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+class CodeTemplate(object):
+	'''A `${name}` template parsed once into literal and slot segments'''
+	def __init__(self, text):
+		self.literals = []
+		self.slots = []
+		pos = 0
+		for m in PLACEHOLDER.finditer(text):
+			name = m.group(1)
+			if not IDENTIFIER.match(name):
+				raise ValueError('Invalid placeholder ${%s} in template:\n%s' % (name, text))
+			self.literals.append(text[pos:m.start()])
+			self.slots.append(name)
+			pos = m.end()
+		tail = text[pos:]
+		if '${' in tail:
+			raise ValueError('Unterminated placeholder in template:\n%s' % text)
+		self.literals.append(tail)
+
+	def render(self, values):
+		parts = [self.literals[0]]
+		for i in range(len(self.slots)):
+			name = self.slots[i]
+			if name not in values:
+				raise KeyError('Placeholder ${%s} is not filled' % name)
+			parts.append(values[name])
+			parts.append(self.literals[i + 1])
+		return ''.join(parts)
+
+compiled_templates = {}
+
+def compile_template(text):
+	template = compiled_templates.get(text)
+	if template is None:
+		template = CodeTemplate(text)
+		compiled_templates[text] = template
+	return template
+
+def apply_pattern(template, values):
+	return compile_template(template).render(values)
+
+def apply_pattern_to_object(obj, values):
+	'''Return a copy of a JSON like object with every string rendered as a template'''
+	if isinstance(obj, dict):
+		return dict((k, apply_pattern_to_object(obj[k], values)) for k in obj)
+	if isinstance(obj, list):
+		return [apply_pattern_to_object(v, values) for v in obj]
+	if isinstance(obj, str):
+		return apply_pattern(obj, values)
+	return obj
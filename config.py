@@ -1,5 +1,10 @@
 def can_build(env, platform):
 	return True
 
+def get_opts(platform):
+	return [
+		('ecmascript_hot_classes', 'Comma separated engine classes bound with generated method thunks, empty for the default list', ''),
+	]
+
 def configure(env):
 	pass
@@ -1,6 +1,7 @@
 #include "ecmascript.h"
 #include "core/config/engine.h"
 #include "core/io/file_access_encrypted.h"
+#include "ecmascript_bytecode_cache.h"
 #include "ecmascript_instance.h"
 #include "ecmascript_language.h"
 #include "scene/resources/resource_format_text.h"
@@ -25,28 +26,30 @@ bool ECMAScript::can_instantiate() const {
 }
 
 bool ECMAScript::inherits_script(const Ref<Script> &p_script) const {
+	const BasicECMAClassInfo *cls = get_ecma_class();
 	Ref<ECMAScript> es = p_script;
 	
 	if (es.is_null()) {
 		return false;
 	}
 
-	if (ecma_class == NULL || es->ecma_class == NULL) {
+	if (cls == NULL || es->get_ecma_class() == NULL) {
 		return false;
 	}
 
-	if (ecma_class == es->ecma_class) {
+	if (cls == es->get_ecma_class()) {
 		return true;
 	}
 
-	return ClassDB::is_parent_class(ecma_class->native_class->name, es->ecma_class->native_class->name);
+	return ClassDB::is_parent_class(cls->native_class->name, es->get_ecma_class()->native_class->name);
 }
 
 StringName ECMAScript::get_instance_base_type() const {
+	const BasicECMAClassInfo *cls = get_ecma_class();
 	static StringName empty;
-	ERR_FAIL_NULL_V(ecma_class, empty);
-	ERR_FAIL_NULL_V(ecma_class->native_class, empty);
-	return ecma_class->native_class->name;
+	ERR_FAIL_NULL_V(cls, empty);
+	ERR_FAIL_NULL_V(cls->native_class, empty);
+	return cls->native_class->name;
 }
 
 ScriptInstance *ECMAScript::instance_create(Object *p_this) {
@@ -100,8 +103,24 @@ bool ECMAScript::is_placeholder_fallback_enabled() const {
 #endif
 }
 
+void ECMAScript::parse_pending_script() {
+	if (Thread::get_caller_id() != Thread::get_main_id()) return;
+	MutexLock lock(parse_mutex);
+	if (parse_pending.is_set()) {
+#ifdef TOOLS_ENABLED
+		// Registered here as the script list is only used by the main thread
+		if (reload() == OK) {
+			ECMAScriptLanguage::get_singleton()->get_scripts().insert(Ref<ECMAScript>(this));
+		}
+#else
+		reload();
+#endif
+	}
+}
+
 Error ECMAScript::reload(bool p_keep_state) {
 	ecma_class = NULL;
+	parse_pending.clear();
 	Error err = OK;
 	ECMAScriptBinder *binder = ECMAScriptLanguage::get_thread_binder(Thread::get_caller_id());
 	ERR_FAIL_COND_V_MSG(binder == NULL, ERR_INVALID_DATA, "Cannot load script in this thread");
@@ -173,46 +192,52 @@ void ECMAScript::_placeholder_erased(PlaceHolderScriptInstance *p_placeholder) {
 #endif
 
 bool ECMAScript::has_method(const StringName &p_method) const {
-	if (!ecma_class) return false;
-	return ecma_class->methods.getptr(p_method) != NULL;
+	const BasicECMAClassInfo *cls = get_ecma_class();
+	if (!cls) return false;
+	return cls->methods.getptr(p_method) != NULL;
 }
 
 MethodInfo ECMAScript::get_method_info(const StringName &p_method) const {
+	const BasicECMAClassInfo *cls = get_ecma_class();
 	MethodInfo mi;
-	ERR_FAIL_NULL_V(ecma_class, mi);
-	if (const MethodInfo *ptr = ecma_class->methods.getptr(p_method)) {
+	ERR_FAIL_NULL_V(cls, mi);
+	if (const MethodInfo *ptr = cls->methods.getptr(p_method)) {
 		mi = *ptr;
 	}
 	return mi;
 }
 
 bool ECMAScript::is_tool() const {
-	if (!ecma_class) return false;
-	return ecma_class->tool;
+	const BasicECMAClassInfo *cls = get_ecma_class();
+	if (!cls) return false;
+	return cls->tool;
 }
 
 void ECMAScript::get_script_method_list(List<MethodInfo> *p_list) const {
-	if (!ecma_class) return;
-	const StringName *key = ecma_class->methods.next(NULL);
+	const BasicECMAClassInfo *cls = get_ecma_class();
+	if (!cls) return;
+	const StringName *key = cls->methods.next(NULL);
 	while (key) {
-		p_list->push_back(ecma_class->methods.get(*key));
-		key = ecma_class->methods.next(key);
+		p_list->push_back(cls->methods.get(*key));
+		key = cls->methods.next(key);
 	}
 }
 
 void ECMAScript::get_script_property_list(List<PropertyInfo> *p_list) const {
-	if (!ecma_class) return;
-	for (const StringName *name = ecma_class->properties.next(NULL); name; name = ecma_class->properties.next(name)) {
-		const ECMAPropertyInfo &pi = ecma_class->properties.get(*name);
+	const BasicECMAClassInfo *cls = get_ecma_class();
+	if (!cls) return;
+	for (const StringName *name = cls->properties.next(NULL); name; name = cls->properties.next(name)) {
+		const ECMAPropertyInfo &pi = cls->properties.get(*name);
 		p_list->push_back(pi);
 	}
 }
 
 bool ECMAScript::get_property_default_value(const StringName &p_property, Variant &r_value) const {
-	if (!ecma_class)
+	const BasicECMAClassInfo *cls = get_ecma_class();
+	if (!cls)
 		return false;
 
-	if (const ECMAPropertyInfo *pi = ecma_class->properties.getptr(p_property)) {
+	if (const ECMAPropertyInfo *pi = cls->properties.getptr(p_property)) {
 		r_value = pi->default_value;
 		return true;
 	}
@@ -223,12 +248,13 @@ bool ECMAScript::get_property_default_value(const StringName &p_property, Varian
 void ECMAScript::update_exports() {
 
 #ifdef TOOLS_ENABLED
-	if (!ecma_class) return;
+	const BasicECMAClassInfo *cls = get_ecma_class();
+	if (!cls) return;
 
 	List<PropertyInfo> props;
 	Map<StringName, Variant> values;
-	for (const StringName *name = ecma_class->properties.next(NULL); name; name = ecma_class->properties.next(name)) {
-		const ECMAPropertyInfo pi = ecma_class->properties.get(*name);
+	for (const StringName *name = cls->properties.next(NULL); name; name = cls->properties.next(name)) {
+		const ECMAPropertyInfo pi = cls->properties.get(*name);
 		props.push_back(pi);
 		values[*name] = pi.default_value;
 	}
@@ -240,19 +266,21 @@ void ECMAScript::update_exports() {
 }
 
 bool ECMAScript::has_script_signal(const StringName &p_signal) const {
-	if (!ecma_class) return false;
-	return ecma_class->signals.has(p_signal);
+	const BasicECMAClassInfo *cls = get_ecma_class();
+	if (!cls) return false;
+	return cls->signals.has(p_signal);
 }
 
 void ECMAScript::get_script_signal_list(List<MethodInfo> *r_signals) const {
-	if (!ecma_class) return;
-	for (const StringName *name = ecma_class->signals.next(NULL); name; name = ecma_class->signals.next(name)) {
-		r_signals->push_back(ecma_class->signals.get(*name));
+	const BasicECMAClassInfo *cls = get_ecma_class();
+	if (!cls) return;
+	for (const StringName *name = cls->signals.next(NULL); name; name = cls->signals.next(name)) {
+		r_signals->push_back(cls->signals.get(*name));
 	}
 }
 
 bool ECMAScript::is_valid() const {
-	return ecma_class != NULL;
+	return get_ecma_class() != NULL;
 }
 
 void ECMAScript::_bind_methods() {
@@ -266,14 +294,21 @@ RES ResourceFormatLoaderECMAScript::load(const String &p_path, const String &p_o
 	Ref<ECMAScript> script;
 	script.instantiate();
 	script->set_script_path(p_path);
-	script->bytecode = module->get_bytecode();
 	script->set_source_code(module->get_source_code());
-	err = script->reload();
-	if (err) *r_error = err;
-	ERR_FAIL_COND_V_MSG(err != OK, RES(), "Parse source code from file '" + p_path + "' failed.");
+	script->bytecode = module->get_bytecode();
+	if (ECMAScriptLanguage::get_thread_binder(Thread::get_caller_id()) == NULL) {
+		// Loaded by the threaded resource loader, the class is parsed once the main thread uses the script.
+		// Syntax errors are only reported then, the load itself succeeds.
+		// The script is registered to the language at the same time.
+		script->parse_pending.set();
+	} else {
+		err = script->reload();
+		if (err) *r_error = err;
+		ERR_FAIL_COND_V_MSG(err != OK, RES(), "Parse source code from file '" + p_path + "' failed.");
 #ifdef TOOLS_ENABLED
-	ECMAScriptLanguage::get_singleton()->get_scripts().insert(script);
+		ECMAScriptLanguage::get_singleton()->get_scripts().insert(script);
 #endif
+	}
 	return script;
 }
 
@@ -378,6 +413,12 @@ RES ResourceFormatLoaderECMAScriptModule::load_static(const String &p_path, cons
 		if (err) *r_error = err;
 		ERR_FAIL_COND_V_MSG(err != OK, RES(), "Cannot load source code from file '" + p_path + "'.");
 		module->set_source_code(code);
+		if (!p_path.ends_with("." EXT_JSON)) {
+			Vector<uint8_t> bytecode;
+			if (ECMAScriptBytecodeCache::load(p_path, code, bytecode)) {
+				module->set_bytecode(bytecode);
+			}
+		}
 	} else if (p_path.ends_with("." EXT_JSMODULE_BYTECODE) || p_path.ends_with("." EXT_JSCLASS_BYTECODE)) {
 		module->set_bytecode(FileAccess::get_file_as_array(p_path, &err));
 		if (err) *r_error = err;
@@ -4,6 +4,8 @@
 #include "core/io/resource_loader.h"
 #include "core/io/resource_saver.h"
 #include "core/object/script_language.h"
+#include "core/os/mutex.h"
+#include "core/templates/safe_refcount.h"
 #include "ecmascript_binder.h"
 #include "scene/resources/text_file.h"
 
@@ -29,7 +31,20 @@ private:
 	String script_path;
 	Vector<uint8_t> bytecode;
 
-	const BasicECMAClassInfo *ecma_class;
+	const BasicECMAClassInfo *ecma_class = NULL;
+	// Set when the script was loaded by a thread without binder, see get_ecma_class()
+	SafeFlag parse_pending;
+	Mutex parse_mutex;
+
+	void parse_pending_script();
+	// Scripts loaded by a background thread are parsed by the main binder the first time the main thread uses them,
+	// the class stays NULL for the other threads until then as its values must belong to the main runtime
+	_FORCE_INLINE_ const BasicECMAClassInfo *get_ecma_class() const {
+		if (unlikely(parse_pending.is_set())) {
+			const_cast<ECMAScript *>(this)->parse_pending_script();
+		}
+		return ecma_class;
+	}
 
 #ifdef TOOLS_ENABLED
 	Set<PlaceHolderScriptInstance *> placeholders;
@@ -67,7 +82,11 @@ public:
 	virtual bool has_source_code() const override { return true; }
 	virtual String get_source_code() const override { return code; }
 
-	virtual void set_source_code(const String &p_code) override { code = p_code; }
+	virtual void set_source_code(const String &p_code) override {
+		// Bytecode compiled from another version of the source is stale
+		if (p_code != code) bytecode.clear();
+		code = p_code;
+	}
 	virtual Error reload(bool p_keep_state = true) override;
 
 	virtual bool has_method(const StringName &p_method) const override;
@@ -5,6 +5,7 @@
 #include "core/variant/variant.h"
 #include "core/variant/callable.h"
 #include "ecmascript_gc_handler.h"
+#include "ecmascript_profiler.h"
 
 typedef ECMAScriptGCHandler ECMAMethodInfo;
 
@@ -33,6 +34,9 @@ struct BasicECMAClassInfo {
 struct ECMAClassInfo : public BasicECMAClassInfo {
 	ECMAScriptGCHandler constructor;
 	ECMAScriptGCHandler prototype;
+	// Script file of the class, used in the profiler signatures
+	String path;
+	mutable HashMap<StringName, ECMAScriptProfiler::Function *> method_profiles;
 };
 
 struct GlobalNumberConstant {
@@ -51,6 +55,7 @@ protected:
 	// Path ==> ECMA Class
 	HashMap<String, ECMAClassInfo> ecma_classes;
 	HashMap<int64_t, ECMAScriptGCHandler> frame_callbacks;
+	ECMAScriptProfiler profiler;
 	static String BINDING_SCRIPT_CONTENT;
 
 public:
@@ -64,6 +69,7 @@ public:
 
 	virtual ECMAScriptBinder *get_context_binder(void *p_context) = 0;
 	virtual Thread::ID get_thread_id() const = 0;
+	_FORCE_INLINE_ ECMAScriptProfiler &get_profiler() { return profiler; }
 
 	virtual void clear_classes() { ecma_classes.clear(); }
 
@@ -94,7 +100,7 @@ public:
 	virtual const ECMAClassInfo *parse_ecma_class(const Vector<uint8_t> &p_bytecode, const String &p_path, bool ignore_cacehe, ECMAScriptScriptError *r_error) = 0;
 
 	virtual ECMAScriptGCHandler create_ecma_instance_for_godot_object(const ECMAClassInfo *p_class, Object *p_object) = 0;
-	virtual Variant call_method(const ECMAScriptGCHandler &p_object, const StringName &p_method, const Variant **p_args, int p_argcount, Callable::CallError &r_error) = 0;
+	virtual Variant call_method(const ECMAScriptGCHandler &p_object, const ECMAClassInfo *p_class, const StringName &p_method, const Variant **p_args, int p_argcount, Callable::CallError &r_error) = 0;
 	virtual bool get_instance_property(const ECMAScriptGCHandler &p_object, const StringName &p_name, Variant &r_ret) = 0;
 	virtual bool set_instance_property(const ECMAScriptGCHandler &p_object, const StringName &p_name, const Variant &p_value) = 0;
 	virtual bool has_method(const ECMAScriptGCHandler &p_object, const StringName &p_name) = 0;
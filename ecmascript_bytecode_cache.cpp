@@ -0,0 +1,163 @@
+#include "ecmascript_bytecode_cache.h"
+#include "core/config/project_settings.h"
+#include "core/io/dir_access.h"
+#include "core/io/file_access.h"
+#include "core/object/class_db.h"
+#include "core/os/mutex.h"
+#include "core/version.h"
+
+#define CACHE_FILE_MAGIC 0x424D4345 // ECMB
+#define CACHE_FILE_FORMAT 1
+#define CACHE_FILE_EXTENSION "jsbc"
+
+static Mutex cache_mutex;
+
+bool ECMAScriptBytecodeCache::initialized = false;
+bool ECMAScriptBytecodeCache::enabled = false;
+int64_t ECMAScriptBytecodeCache::max_size = 0;
+int64_t ECMAScriptBytecodeCache::cache_size = 0;
+String ECMAScriptBytecodeCache::cache_dir;
+
+void ECMAScriptBytecodeCache::initialize() {
+	if (initialized) return;
+	initialized = true;
+#ifdef TOOLS_ENABLED
+	// Exported projects are read only and ship their scripts compiled or encrypted
+	enabled = GLOBAL_DEF("JavaScript/bytecode_cache/enabled", true);
+	max_size = int64_t(GLOBAL_DEF("JavaScript/bytecode_cache/max_size_mb", 64)) * 1024 * 1024;
+	if (!enabled) return;
+
+	String root = ProjectSettings::get_singleton()->get_project_data_path().plus_file("ecmascript_cache");
+	cache_dir = root.plus_file(get_signature());
+	DirAccessRef da = DirAccess::create(DirAccess::ACCESS_RESOURCES);
+	if (da->make_dir_recursive(cache_dir) != OK) {
+		enabled = false;
+		ERR_FAIL_MSG("Cannot create the bytecode cache directory '" + cache_dir + "'.");
+	}
+	remove_stale_caches(root);
+	enforce_size_limit();
+#endif
+}
+
+String ECMAScriptBytecodeCache::get_signature() {
+	String signature = VERSION_FULL_BUILD;
+#ifdef QUICKJS_CONFIG_VERSION
+	signature += String("|quickjs ") + QUICKJS_CONFIG_VERSION;
+#endif
+	signature += "|" + itos(ClassDB::get_api_hash(ClassDB::API_CORE));
+#ifdef TOOLS_ENABLED
+	signature += "|" + itos(ClassDB::get_api_hash(ClassDB::API_EDITOR));
+#endif
+	return signature.md5_text();
+}
+
+String ECMAScriptBytecodeCache::get_entry_path(const String &p_path) {
+	return cache_dir.plus_file(p_path.md5_text() + "." CACHE_FILE_EXTENSION);
+}
+
+void ECMAScriptBytecodeCache::remove_stale_caches(const String &p_root) {
+	// Caches written by other engine or QuickJS versions can never be loaded again
+	DirAccessRef da = DirAccess::open(p_root);
+	ERR_FAIL_COND(!da);
+	List<String> stale_dirs;
+	da->list_dir_begin();
+	for (String name = da->get_next(); !name.is_empty(); name = da->get_next()) {
+		if (da->current_is_dir() && name != "." && name != ".." && p_root.plus_file(name) != cache_dir) {
+			stale_dirs.push_back(name);
+		}
+	}
+	da->list_dir_end();
+
+	for (List<String>::Element *E = stale_dirs.front(); E; E = E->next()) {
+		DirAccessRef stale = DirAccess::open(p_root.plus_file(E->get()));
+		if (stale) {
+			stale->erase_contents_recursive();
+			da->remove(E->get());
+		}
+	}
+}
+
+struct CacheEntry {
+	String path;
+	uint64_t modified_time;
+	int64_t size;
+	_FORCE_INLINE_ bool operator<(const CacheEntry &p_other) const { return modified_time < p_other.modified_time; }
+};
+
+void ECMAScriptBytecodeCache::enforce_size_limit() {
+	DirAccessRef da = DirAccess::open(cache_dir);
+	ERR_FAIL_COND(!da);
+	Vector<CacheEntry> entries;
+	cache_size = 0;
+	da->list_dir_begin();
+	for (String name = da->get_next(); !name.is_empty(); name = da->get_next()) {
+		if (da->current_is_dir() || name.get_extension() != CACHE_FILE_EXTENSION) continue;
+		CacheEntry entry;
+		entry.path = cache_dir.plus_file(name);
+		entry.modified_time = FileAccess::get_modified_time(entry.path);
+		FileAccessRef f = FileAccess::open(entry.path, FileAccess::READ);
+		entry.size = f ? f->get_length() : 0;
+		cache_size += entry.size;
+		entries.push_back(entry);
+	}
+	da->list_dir_end();
+
+	if (cache_size <= max_size) return;
+	// Remove the least recently written entries first
+	entries.sort();
+	for (int i = 0; i < entries.size() && cache_size > max_size; i++) {
+		if (da->remove(entries[i].path) == OK) {
+			cache_size -= entries[i].size;
+		}
+	}
+}
+
+bool ECMAScriptBytecodeCache::load(const String &p_path, const String &p_source, Vector<uint8_t> &r_bytecode) {
+	String source_hash = p_source.sha256_text();
+	MutexLock lock(cache_mutex);
+	initialize();
+	if (!enabled) return false;
+
+	FileAccessRef f = FileAccess::open(get_entry_path(p_path), FileAccess::READ);
+	if (!f) return false;
+	if (f->get_32() != CACHE_FILE_MAGIC || f->get_32() != CACHE_FILE_FORMAT) return false;
+	// The entry is stale if the source code was modified since it was written
+	if (f->get_pascal_string() != source_hash) return false;
+	uint32_t size = f->get_32();
+	r_bytecode.resize(size);
+	if (f->get_buffer(r_bytecode.ptrw(), size) != size) {
+		r_bytecode.clear();
+		return false;
+	}
+	return true;
+}
+
+void ECMAScriptBytecodeCache::store(const String &p_path, const String &p_source, const Vector<uint8_t> &p_bytecode) {
+	String source_hash = p_source.sha256_text();
+	MutexLock lock(cache_mutex);
+	initialize();
+	if (!enabled || p_bytecode.is_empty()) return;
+
+	String entry_path = get_entry_path(p_path);
+	String temp_path = entry_path + ".tmp";
+	{
+		FileAccessRef f = FileAccess::open(temp_path, FileAccess::WRITE);
+		ERR_FAIL_COND_MSG(!f, "Cannot write the bytecode cache file '" + temp_path + "'.");
+		f->store_32(CACHE_FILE_MAGIC);
+		f->store_32(CACHE_FILE_FORMAT);
+		f->store_pascal_string(source_hash);
+		f->store_32(p_bytecode.size());
+		f->store_buffer(p_bytecode.ptr(), p_bytecode.size());
+	}
+	// Written to a temporary file first so an interrupted write never leaves a truncated entry
+	DirAccessRef da = DirAccess::create(DirAccess::ACCESS_RESOURCES);
+	if (da->file_exists(entry_path)) {
+		da->remove(entry_path);
+	}
+	ERR_FAIL_COND(da->rename(temp_path, entry_path) != OK);
+
+	cache_size += p_bytecode.size();
+	if (cache_size > max_size) {
+		enforce_size_limit();
+	}
+}
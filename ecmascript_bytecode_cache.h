@@ -0,0 +1,28 @@
+#ifndef ECMASCRIPT_BYTECODE_CACHE_H
+#define ECMASCRIPT_BYTECODE_CACHE_H
+
+#include "core/string/ustring.h"
+#include "core/templates/vector.h"
+
+// Persistent cache of compiled module bytecode stored under `.godot/ecmascript_cache/`.
+// Entries are keyed by the script path and the hash of its source code, the cache
+// directory by the engine version, the QuickJS version and the engine API hash.
+class ECMAScriptBytecodeCache {
+	static bool initialized;
+	static bool enabled;
+	static int64_t max_size;
+	static int64_t cache_size;
+	static String cache_dir;
+
+	static void initialize();
+	static String get_signature();
+	static String get_entry_path(const String &p_path);
+	static void remove_stale_caches(const String &p_root);
+	static void enforce_size_limit();
+
+public:
+	static bool load(const String &p_path, const String &p_source, Vector<uint8_t> &r_bytecode);
+	static void store(const String &p_path, const String &p_source, const Vector<uint8_t> &p_bytecode);
+};
+
+#endif // ECMASCRIPT_BYTECODE_CACHE_H
@@ -54,7 +54,7 @@ Variant ECMAScriptInstance::call(const StringName &p_method, const Variant **p_a
 		r_error.error = Callable::CallError::CALL_ERROR_INSTANCE_IS_NULL;
 		ERR_FAIL_V(Variant());
 	}
-	return binder->call_method(ecma_object, p_method, p_args, p_argcount, r_error);
+	return binder->call_method(ecma_object, ecma_class, p_method, p_args, p_argcount, r_error);
 }
 
 ScriptLanguage *ECMAScriptInstance::get_language() {
@@ -321,6 +321,7 @@ bool ECMAScriptLanguage::refcount_decremented_instance_binding(Object *p_object)
 }
 
 void ECMAScriptLanguage::frame() {
+	main_binder->get_profiler().frame();
 	main_binder->frame();
 }
 
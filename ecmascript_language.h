@@ -116,11 +116,12 @@ public:
 	/* TODO */ virtual void get_public_functions(List<MethodInfo> *p_functions) const override {}
 	/* TODO */ virtual void get_public_constants(List<Pair<String, Variant> > *p_constants) const override {}
 
-	/* TODO */ virtual void profiling_start() override {}
-	/* TODO */ virtual void profiling_stop() override {}
+	// Only the calls made on the main thread are profiled
+	virtual void profiling_start() override { main_binder->get_profiler().start(); }
+	virtual void profiling_stop() override { main_binder->get_profiler().stop(); }
 
-	/* TODO */ virtual int profiling_get_accumulated_data(ProfilingInfo *p_info_arr, int p_info_max) override { return -1; }
-	/* TODO */ virtual int profiling_get_frame_data(ProfilingInfo *p_info_arr, int p_info_max) override { return -1; }
+	virtual int profiling_get_accumulated_data(ProfilingInfo *p_info_arr, int p_info_max) override { return main_binder->get_profiler().get_accumulated_data(p_info_arr, p_info_max); }
+	virtual int profiling_get_frame_data(ProfilingInfo *p_info_arr, int p_info_max) override { return main_binder->get_profiler().get_frame_data(p_info_arr, p_info_max); }
 
 	virtual void *alloc_instance_binding_data(Object *p_object) override; //optional, not used by all languages
 	virtual void free_instance_binding_data(void *p_data) override; //optional, not used by all languages
@@ -0,0 +1,100 @@
+#include "ecmascript_module_index.h"
+#include "core/io/dir_access.h"
+#include "core/io/file_access.h"
+#include "core/os/rw_lock.h"
+#include "ecmascript_language.h"
+
+static RWLock index_lock;
+
+bool ECMAScriptModuleIndex::built = false;
+HashMap<String, String> ECMAScriptModuleIndex::resolved;
+
+void ECMAScriptModuleIndex::scan_dir(const String &p_dir, const List<String> &p_extensions) {
+	DirAccessRef da = DirAccess::open(p_dir);
+	ERR_FAIL_COND(!da);
+	da->list_dir_begin();
+	for (String name = da->get_next(); !name.is_empty(); name = da->get_next()) {
+		// Skips the project data folder and other hidden folders
+		if (name.begins_with(".")) continue;
+		String path = p_dir.plus_file(name);
+		if (da->current_is_dir()) {
+			scan_dir(path, p_extensions);
+		} else if (p_extensions.find(name.get_extension())) {
+			resolved.set(path, path);
+		}
+	}
+	da->list_dir_end();
+}
+
+void ECMAScriptModuleIndex::build() {
+	resolved.clear();
+	List<String> extensions;
+	ECMAScriptLanguage::get_singleton()->get_recognized_extensions(&extensions);
+	scan_dir("res://", extensions);
+	built = true;
+}
+
+bool ECMAScriptModuleIndex::file_exists(const String &p_path, const List<String> &p_extensions) {
+	if (p_path.begins_with("res://") && p_extensions.find(p_path.get_extension())) {
+		// Every script file under res:// is indexed, the other resources are checked on the file system
+		const String *path = resolved.getptr(p_path);
+		return path && *path == p_path;
+	}
+	return FileAccess::exists(p_path);
+}
+
+String ECMAScriptModuleIndex::resolve(const String &p_file) {
+	{
+		RWLockRead read_lock(index_lock);
+		if (built) {
+			if (const String *ptr = resolved.getptr(p_file)) {
+				return *ptr;
+			}
+		}
+	}
+
+	RWLockWrite write_lock(index_lock);
+	if (!built) {
+		build();
+	}
+	if (const String *ptr = resolved.getptr(p_file)) {
+		return *ptr;
+	}
+
+	String path;
+	List<String> extensions;
+	ECMAScriptLanguage::get_singleton()->get_recognized_extensions(&extensions);
+	const bool is_script = extensions.find(p_file.get_extension()) != NULL;
+	if (file_exists(p_file, extensions)) {
+		path = p_file;
+	} else {
+		// add extensions to try
+		if (!is_script) {
+			for (List<String>::Element *E = extensions.front(); E && path.is_empty(); E = E->next()) {
+				String candidate = p_file + "." + E->get();
+				if (file_exists(candidate, extensions)) {
+					path = candidate;
+				}
+			}
+		}
+		// try index file under the folder
+		for (List<String>::Element *E = extensions.front(); E && path.is_empty(); E = E->next()) {
+			String candidate = p_file + "/index." + E->get();
+			if (file_exists(candidate, extensions)) {
+				path = candidate;
+			}
+		}
+	}
+	// Only the failed resolutions of the indexed script files are kept,
+	// the other files may be written at runtime or imported by the editor later
+	if (!path.is_empty() || (p_file.begins_with("res://") && is_script)) {
+		resolved.set(p_file, path);
+	}
+	return path;
+}
+
+void ECMAScriptModuleIndex::invalidate() {
+	RWLockWrite write_lock(index_lock);
+	resolved.clear();
+	built = false;
+}
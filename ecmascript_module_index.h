@@ -0,0 +1,24 @@
+#ifndef ECMASCRIPT_MODULE_INDEX_H
+#define ECMASCRIPT_MODULE_INDEX_H
+
+#include "core/string/ustring.h"
+#include "core/templates/hash_map.h"
+
+// Maps module specifiers to script files without probing the file system for every import.
+// The script files under `res://` are indexed once, resolutions including the failed
+// ones are cached. Safe to use from the worker threads.
+class ECMAScriptModuleIndex {
+	static bool built;
+	// Every indexed file resolves to itself, an empty path marks a failed resolution
+	static HashMap<String, String> resolved;
+
+	static void build();
+	static void scan_dir(const String &p_dir, const List<String> &p_extensions);
+	static bool file_exists(const String &p_path, const List<String> &p_extensions);
+
+public:
+	static String resolve(const String &p_file);
+	static void invalidate();
+};
+
+#endif // ECMASCRIPT_MODULE_INDEX_H
@@ -0,0 +1,72 @@
+#include "ecmascript_profiler.h"
+
+ECMAScriptProfiler::Function *ECMAScriptProfiler::get_function(const StringName &p_signature) {
+	if (Function *function = functions.getptr(p_signature)) {
+		return function;
+	}
+	Function function;
+	function.signature = p_signature;
+	functions.set(p_signature, function);
+	return functions.getptr(p_signature);
+}
+
+void ECMAScriptProfiler::start() {
+	const StringName *key = NULL;
+	while ((key = functions.next(key))) {
+		Function &function = functions.get(*key);
+		StringName signature = function.signature;
+		function = Function();
+		function.signature = signature;
+	}
+	calls.clear();
+	profiling = true;
+}
+
+void ECMAScriptProfiler::stop() {
+	profiling = false;
+	calls.clear();
+}
+
+void ECMAScriptProfiler::frame() {
+	if (!profiling) return;
+	const StringName *key = NULL;
+	while ((key = functions.next(key))) {
+		Function &function = functions.get(*key);
+		function.last_frame_call_count = function.frame_call_count;
+		function.last_frame_total_time = function.frame_total_time;
+		function.last_frame_self_time = function.frame_self_time;
+		function.frame_call_count = 0;
+		function.frame_total_time = 0;
+		function.frame_self_time = 0;
+	}
+}
+
+int ECMAScriptProfiler::get_accumulated_data(ScriptLanguage::ProfilingInfo *p_info_arr, int p_info_max) const {
+	int count = 0;
+	const StringName *key = NULL;
+	while ((key = functions.next(key)) && count < p_info_max) {
+		const Function &function = functions.get(*key);
+		if (!function.call_count) continue;
+		p_info_arr[count].signature = function.signature;
+		p_info_arr[count].call_count = function.call_count;
+		p_info_arr[count].total_time = function.total_time;
+		p_info_arr[count].self_time = function.self_time;
+		count++;
+	}
+	return count;
+}
+
+int ECMAScriptProfiler::get_frame_data(ScriptLanguage::ProfilingInfo *p_info_arr, int p_info_max) const {
+	int count = 0;
+	const StringName *key = NULL;
+	while ((key = functions.next(key)) && count < p_info_max) {
+		const Function &function = functions.get(*key);
+		if (!function.last_frame_call_count) continue;
+		p_info_arr[count].signature = function.signature;
+		p_info_arr[count].call_count = function.last_frame_call_count;
+		p_info_arr[count].total_time = function.last_frame_total_time;
+		p_info_arr[count].self_time = function.last_frame_self_time;
+		count++;
+	}
+	return count;
+}
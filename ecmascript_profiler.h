@@ -0,0 +1,77 @@
+#ifndef ECMASCRIPT_PROFILER_H
+#define ECMASCRIPT_PROFILER_H
+
+#include "core/object/script_language.h"
+#include "core/os/os.h"
+#include "core/templates/hash_map.h"
+#include "core/templates/local_vector.h"
+
+// Call counts and times of the functions called by the engine, or calling into the engine, from a binder.
+// Nothing is measured unless the engine profiler is running, so it is available in release builds too.
+class ECMAScriptProfiler {
+public:
+	struct Function {
+		StringName signature;
+		uint64_t call_count = 0;
+		uint64_t total_time = 0;
+		uint64_t self_time = 0;
+		uint64_t frame_call_count = 0;
+		uint64_t frame_total_time = 0;
+		uint64_t frame_self_time = 0;
+		uint64_t last_frame_call_count = 0;
+		uint64_t last_frame_total_time = 0;
+		uint64_t last_frame_self_time = 0;
+	};
+
+private:
+	struct Call {
+		Function *function;
+		uint64_t start_time;
+		uint64_t child_time;
+	};
+
+	bool profiling = false;
+	// The functions are never erased so their addresses can be cached by the callers
+	HashMap<StringName, Function> functions;
+	LocalVector<Call> calls;
+
+public:
+	_FORCE_INLINE_ bool is_profiling() const { return profiling; }
+
+	// The signature is `path::line::name` as expected by the script profiler of the editor
+	Function *get_function(const StringName &p_signature);
+
+	_FORCE_INLINE_ void enter(Function *p_function) {
+		Call call;
+		call.function = p_function;
+		call.start_time = OS::get_singleton()->get_ticks_usec();
+		call.child_time = 0;
+		calls.push_back(call);
+	}
+
+	_FORCE_INLINE_ void exit() {
+		if (calls.is_empty()) return;
+		const Call &call = calls[calls.size() - 1];
+		const uint64_t total_time = OS::get_singleton()->get_ticks_usec() - call.start_time;
+		const uint64_t self_time = total_time - MIN(call.child_time, total_time);
+		Function *function = call.function;
+		function->call_count++;
+		function->total_time += total_time;
+		function->self_time += self_time;
+		function->frame_call_count++;
+		function->frame_total_time += total_time;
+		function->frame_self_time += self_time;
+		calls.resize(calls.size() - 1);
+		if (calls.size()) {
+			calls[calls.size() - 1].child_time += total_time;
+		}
+	}
+
+	void start();
+	void stop();
+	void frame();
+	int get_accumulated_data(ScriptLanguage::ProfilingInfo *p_info_arr, int p_info_max) const;
+	int get_frame_data(ScriptLanguage::ProfilingInfo *p_info_arr, int p_info_max) const;
+};
+
+#endif // ECMASCRIPT_PROFILER_H
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
-import json, os, sys
+import json, os, sys, hashlib
 import xml.etree.ElementTree as ET
+import code_template
+from code_template import apply_pattern_to_object
 
 BUILTIN_CLASSES = [
 	'Vector2',
@@ -25,6 +27,21 @@ BUILTIN_CLASSES = [
 	"PackedColorArray",
 ]
 
+# Engine classes whose methods get typed thunks generated by quickjs/builtin_binding_generator.py
+# The list can be replaced with the ecmascript_hot_classes build option
+HOT_ENGINE_CLASSES = [
+	'Object',
+	'Node',
+	'CanvasItem',
+	'Node2D',
+	'Node3D',
+	'Control',
+	'Sprite2D',
+	'CharacterBody2D',
+	'CharacterBody3D',
+	'Input',
+]
+
 MAX_CONSTRUCTOR_ARGC = {
 	'Vector2': 2,
 	'Rect2': 4,
@@ -288,6 +305,17 @@ IGNORED_PROPS = {
 	"PackedByteArray": ['compress', 'decompress', 'decompress_dynamic', 'get_string_from_ascii', 'get_string_from_utf8', 'get_string_from_utf16', 'get_string_from_utf32', 'hex_encode'],
 }
 
+# methods returning a copy of the object that also get `name_in_place(...)` and `name_to(out, ...)` bindings
+IN_PLACE_METHODS = {
+	"Vector2": ['abs', 'bounce', 'ceil', 'floor', 'lerp', 'move_toward', 'normalized', 'project', 'reflect', 'rotated', 'round', 'slerp', 'slide'],
+	"Vector3": ['abs', 'bounce', 'ceil', 'cross', 'floor', 'lerp', 'move_toward', 'normalized', 'project', 'reflect', 'rotated', 'round', 'slerp', 'slide'],
+	"Color": ['darkened', 'inverted', 'lerp', 'lightened'],
+	"Quaternion": ['inverse', 'normalized', 'slerp', 'slerpni'],
+	"Basis": ['inverse', 'orthonormalized', 'rotated', 'scaled', 'slerp', 'transposed'],
+	"Transform2D": ['affine_inverse', 'interpolate_with', 'inverse', 'orthonormalized', 'rotated', 'scaled', 'translated'],
+	"Transform3D": ['affine_inverse', 'interpolate_with', 'inverse', 'orthonormalized', 'rotated', 'scaled', 'translated'],
+}
+
 PROPERTY_REMAP = {
 	"Transform2D": {
 		"x": "elements[0]",
@@ -344,7 +372,7 @@ OPERATOR_METHODS = {
 		METHOD_OP_MUL,
 		METHOD_OP_MUL_ASSIGN,
 	],
-	"Quataternion": [
+	"Quaternion": [
 		METHOD_OP_NEG,
 		METHOD_OP_EQUALS,
 		METHOD_OP_ADD,
@@ -392,11 +420,6 @@ OPERATOR_METHODS = {
 	]
 }
 
-def apply_pattern(template, values):
-	for key in values:
-		template = template.replace( '${' + key + '}', values[key])
-	return template
-
 def parse_class(cls):
 	class_name = cls.get('name')
 	ret = {'name': class_name}
@@ -458,34 +481,137 @@ def parse_class(cls):
 			'arguments': arguments,
 			'variant_call': variant_call
 		})
+	method_names = set([m['name'] for m in methods])
+	for m in methods:
+		if class_name in IN_PLACE_METHODS and m['name'] in IN_PLACE_METHODS[class_name] and m['return'] == class_name and not m['variant_call']:
+			m['in_place'] = (m['name'] + '_in_place') not in method_names and (m['name'] + '_to') not in method_names
 	if class_name.startswith("Packed") and class_name.endswith("Array"):
-		methods.append(METHOD_PACKED_ARRAY_GET)
+		methods.append(apply_pattern_to_object(METHOD_PACKED_ARRAY_GET, {'class_name': class_name}))
 	# add operator methods
 	if class_name in OPERATOR_METHODS:
 		for em in OPERATOR_METHODS[class_name]:
-			operators.append(em)
+			operators.append(apply_pattern_to_object(em, {'class_name': class_name}))
 	
 	for c in (cls.find("constants") if cls.find("constants") is not None else []):
 		const_name = c.get("name")
 		if class_name in IGNORED_PROPS and const_name in IGNORED_PROPS[class_name]:
 			continue
 		constants.append(dict(c.attrib))
-	return json.loads(apply_pattern(json.dumps(ret), {
-		'class_name': class_name,
-	}))
+	return ret
+
+def file_digest(path):
+	if not os.path.isfile(path):
+		return None
+	with open(path, 'rb') as f:
+		return hashlib.sha256(f.read()).hexdigest()
+
+def load_manifest(path):
+	try:
+		with open(path, 'r') as f:
+			return json.load(f)
+	except (IOError, OSError, ValueError):
+		return {}
+
+def save_manifest(path, manifest):
+	with open(path, 'w') as f:
+		json.dump(manifest, f, indent=2, sort_keys=True)
+
+def compute_inputs_digest(DOCS_DIR):
+	hasher = hashlib.sha256()
+	# the generator source and its tables change the output as much as the docs do
+	for module in [__file__, code_template.__file__]:
+		with open(os.path.splitext(os.path.abspath(module))[0] + '.py', 'rb') as f:
+			hasher.update(f.read())
+	tables = [BUILTIN_CLASSES, MAX_CONSTRUCTOR_ARGC, TYPE_MAP, IGNORED_PROPS, IN_PLACE_METHODS, PROPERTY_REMAP, OPERATOR_METHODS, METHOD_PACKED_ARRAY_GET]
+	hasher.update(json.dumps(tables, sort_keys=True).encode('utf8'))
+	for cls in BUILTIN_CLASSES:
+		hasher.update(cls.encode('utf8'))
+		with open(os.path.join(DOCS_DIR, cls + '.xml'), 'rb') as f:
+			hasher.update(f.read())
+	return hasher.hexdigest()
 
 def generate_api_json(MODULE_DIR, ENGINE_DIR):
 	DOCS_DIR = os.path.abspath(os.path.join(ENGINE_DIR, "doc/classes"))
 	print(MODULE_DIR)
 	print(DOCS_DIR)
 	OUTPUT_FILE = os.path.join(MODULE_DIR, "builtin_api.gen.json")
+	MANIFEST_FILE = os.path.join(MODULE_DIR, "builtin_api.gen.manifest")
+
+	inputs = compute_inputs_digest(DOCS_DIR)
+	manifest = load_manifest(MANIFEST_FILE)
+	if manifest.get('inputs') == inputs and manifest.get('output') == file_digest(OUTPUT_FILE):
+		return False # up to date, keep the output and its mtime untouched
 
 	classes = []
 	for cls in BUILTIN_CLASSES:
 		tree = ET.parse(open(os.path.join(DOCS_DIR, cls + '.xml'), 'r'))
 		data = tree.getroot()
 		classes.append(parse_class(data))
-	json.dump(classes, open(OUTPUT_FILE, 'w'), ensure_ascii=False, indent=2, sort_keys=True)
-	
+	output = json.dumps(classes, ensure_ascii=False, indent=2, sort_keys=True).encode('utf8')
+	digest = hashlib.sha256(output).hexdigest()
+	changed = file_digest(OUTPUT_FILE) != digest
+	if changed:
+		with open(OUTPUT_FILE, 'wb') as f:
+			f.write(output)
+	save_manifest(MANIFEST_FILE, {'inputs': inputs, 'output': digest})
+	return changed
+
+def parse_engine_class(cls):
+	class_name = cls.get('name')
+	methods = []
+	for m in (cls.find("methods") if cls.find("methods") is not None else []):
+		qualifiers = m.get('qualifiers', '').split(' ')
+		if 'vararg' in qualifiers or 'virtual' in qualifiers:
+			continue # left to the generic call
+		return_type = m.find("return").attrib["type"] if m.find("return") != None else "void"
+		arguments = [{'name': arg.get('name'), 'type': arg.get('type'), 'index': int(arg.get('index'))} for arg in m.iter('argument')]
+		arguments.sort(key=lambda arg: arg['index'])
+		methods.append({
+			'name': m.get('name'),
+			'return': return_type,
+			'arguments': [{'name': arg['name'], 'type': arg['type']} for arg in arguments],
+		})
+	return {'name': class_name, 'methods': methods}
+
+def compute_engine_inputs_digest(DOCS_DIR, classes):
+	hasher = hashlib.sha256()
+	with open(os.path.splitext(os.path.abspath(__file__))[0] + '.py', 'rb') as f:
+		hasher.update(f.read())
+	for cls in classes:
+		hasher.update(cls.encode('utf8'))
+		path = os.path.join(DOCS_DIR, cls + '.xml')
+		if os.path.isfile(path):
+			with open(path, 'rb') as f:
+				hasher.update(f.read())
+	return hasher.hexdigest()
+
+def generate_engine_api_json(MODULE_DIR, ENGINE_DIR, classes = None):
+	DOCS_DIR = os.path.abspath(os.path.join(ENGINE_DIR, "doc/classes"))
+	OUTPUT_FILE = os.path.join(MODULE_DIR, "engine_api.gen.json")
+	MANIFEST_FILE = os.path.join(MODULE_DIR, "engine_api.gen.manifest")
+	classes = classes if classes else HOT_ENGINE_CLASSES
+
+	inputs = compute_engine_inputs_digest(DOCS_DIR, classes)
+	manifest = load_manifest(MANIFEST_FILE)
+	if manifest.get('inputs') == inputs and manifest.get('output') == file_digest(OUTPUT_FILE):
+		return False # up to date, keep the output and its mtime untouched
+
+	api = []
+	for cls in classes:
+		path = os.path.join(DOCS_DIR, cls + '.xml')
+		if not os.path.isfile(path):
+			print("No documentation found for the engine class " + cls + ", its methods keep the generic binding")
+			continue
+		tree = ET.parse(open(path, 'r'))
+		api.append(parse_engine_class(tree.getroot()))
+	output = json.dumps(api, ensure_ascii=False, indent=2, sort_keys=True).encode('utf8')
+	digest = hashlib.sha256(output).hexdigest()
+	changed = file_digest(OUTPUT_FILE) != digest
+	if changed:
+		with open(OUTPUT_FILE, 'wb') as f:
+			f.write(output)
+	save_manifest(MANIFEST_FILE, {'inputs': inputs, 'output': digest})
+	return changed
+
 if __name__ == "__main__":
 	generate_api_json()
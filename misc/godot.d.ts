@@ -18,6 +18,50 @@ declare module globalThis {
 	 * @param request_id The ID value returned by the call to `godot.requestAnimationFrame()` that requested the callback.
 	 */
 	function cancelAnimationFrame(request_id: FrameRequestID): void;
+
+	/** A non-zero id that identifies an idle callback, pass it to `cancelIdleCallback()` to cancel the callback. */
+	type IdleRequestID = number;
+
+	interface IdleDeadline {
+		/** `true` if the callback runs because its `timeout` expired rather than because there was time left in the frame */
+		readonly didTimeout: boolean;
+		/** Milliseconds left in the frame budget, at most 50 */
+		timeRemaining(): number;
+	}
+
+	/**
+	 * Queue a function to be called once with the time left in a frame after the animation frame callbacks.
+	 *
+	 * The callbacks which do not fit the frame budget (`JavaScript/scheduler/frame_budget_usec` in the project settings) wait for the next frames.
+	 * @param callback The function to call, check `deadline.timeRemaining()` to split long work across frames.
+	 * @param options `timeout` in milliseconds after which the callback runs even if the frames have no time left.
+	 */
+	function requestIdleCallback(callback: (deadline: IdleDeadline) => void, options?: { timeout?: number }): IdleRequestID;
+
+	/**
+	 * Cancel an idle callback previously queued with `requestIdleCallback()`.
+	 * @param request_id The ID returned by `requestIdleCallback()`.
+	 */
+	function cancelIdleCallback(request_id: IdleRequestID): void;
+
+	/**
+	 * - `user-blocking` tasks run at the start of every frame whatever the frame budget
+	 * - `user-visible` tasks run after the animation frame callbacks within the frame budget
+	 * - `background` tasks run with the idle callbacks in the budget left
+	 */
+	type TaskPriority = "user-blocking" | "user-visible" | "background";
+
+	const scheduler: {
+		/**
+		 * Queue a task to run in a later frame.
+		 *
+		 * The tasks which do not fit the frame budget keep their place for the next frame.
+		 * @param callback The task to run
+		 * @param options The lane of the task, `user-visible` by default
+		 * @returns A promise settled with the result of the task
+		 */
+		postTask<T>(callback: () => T, options?: { priority?: TaskPriority }): Promise<T>;
+	}
 	
 	/**
 	 * The Console API provides functionality to allow developers to perform debugging tasks, such as logging messages or the values of variables at set points in your code, or timing how long an operation takes to complete.
@@ -60,6 +104,8 @@ declare module globalThis {
 	 * 
 	 * Data is sent between workers and the main thread via a system of messages — both sides send their messages using the `postMessage()` method, and respond to messages via the `onmessage` event handler (the message is contained within the Message event's data attribute.) The data is copied rather than shared.
 	 *
+	 * A `SharedArrayBuffer`, or a typed array over one, is posted without copy: both contexts see the same memory and can synchronize with `Atomics`. `Atomics.wait` is only allowed inside workers.
+	 *
 	 * You can **transfer** value with `Worker.abandonValue` and `Worker.adoptValue`. After a value is abandoned you cannot using it anymore in the context.
 	 *
 	 * Workers may, in turn, spawn new workers, all sub-worker will be stopped when the host context stop.
@@ -75,15 +121,18 @@ declare module globalThis {
 		/**
 		 * The `onmessage` property of the Worker interface represents an event handler, that is a function to be called when the message event occurs.
 		 * It will be called when the worker's parent receives a message from the worker context by `postMessage` method.
+		 *
+		 * If the project setting `JavaScript/worker/batch_messages` is enabled it is called once per frame with the array of all the messages received since the last call.
 		 */
 		onmessage(message: any): void;
 		
 		/**
 		 * Sends a message to the worker's inner scope. This accepts a single parameter, which is the data to send to the worker.
 		 * @param message The object to deliver to the worker; this will be in the data field in the event delivered to the `onmessage` handler.
+		 * @param transfer ArrayBuffers, typed arrays and packed arrays moved to the worker without copy. They are detached or emptied in the current context, the typed arrays of the message viewing a transferred buffer view it again in the receiver.
 		 * @note The data cannot be instance of `godot.Object` or any other JavaScript object conains functions.
 		 */
-		postMessage(message: any): void;
+		postMessage(message: any, transfer?: (ArrayBuffer | ArrayBufferView | PackedByteArray | PackedInt32Array | PackedInt64Array | PackedFloat32Array | PackedFloat64Array | PackedStringArray | PackedVector2Array | PackedVector3Array | PackedColorArray)[]): void;
 		
 		/**
 		 * Stop the worker thread
@@ -100,6 +149,8 @@ declare module globalThis {
 	/** **Worker context only**
 	 * 
 	 * The message handler to handle messages send from the host context
+	 *
+	 * If the project setting `JavaScript/worker/batch_messages` is enabled it is called with the array of all the messages received since the last call.
 	 */
 	//@ts-ignore
 	function onmessage(message: any): void;
@@ -109,8 +160,9 @@ declare module globalThis {
 	 * Sends a message to the host thread context that spawned it.
 	 *
 	 * @param {*} message The message to send
+	 * @param transfer ArrayBuffers, typed arrays and packed arrays moved to the host without copy. They are detached or emptied in the current context, the typed arrays of the message viewing a transferred buffer view it again in the receiver.
 	 */
-	function postMessage(message: any): void;
+	function postMessage(message: any, transfer?: (ArrayBuffer | ArrayBufferView | PackedByteArray | PackedInt32Array | PackedInt64Array | PackedFloat32Array | PackedFloat64Array | PackedStringArray | PackedVector2Array | PackedVector3Array | PackedColorArray)[]): void;
 	
 	/** **Worker context only**
 	 * 
@@ -227,6 +279,110 @@ declare module godot {
 	* @param value_id The ID of the abandoned value
 	*/
 	function adopt_value(value_id: number): any;
+
+	interface BuiltinPoolStats {
+		/** Number of handles currently alive */
+		live: number;
+		/** Number of slabs allocated for the type */
+		slabs: number;
+		/** Number of handles the slabs can hold */
+		capacity: number;
+		/** `live / capacity` */
+		occupancy: number;
+		/** Number of handles allocated since the context started */
+		allocations: number;
+	}
+
+	/**
+	 * Returns the usage of the pools holding builtin values (`Vector2`, `Color`, `Transform3D`...) in this context.
+	 *
+	 * `allocation_rate` is the number of allocations per second since the previous call.
+	 */
+	function get_builtin_pool_stats(): { types: { [type: string]: BuiltinPoolStats }, allocations: number, allocation_rate: number };
+
+	interface CacheStats {
+		hits: number;
+		misses: number;
+		/** `hits / (hits + misses)` */
+		hit_rate: number;
+	}
+
+	/**
+	 * Returns the hit rates of the caches used when the engine calls into scripts of this context.
+	 *
+	 * `atoms` caches the names of methods and properties.
+	 */
+	function get_call_cache_stats(): { atoms: CacheStats & { size: number } };
+
+	interface SchedulerStats {
+		/** `JavaScript/scheduler/frame_budget_usec` of the project settings, 0 for no budget */
+		frame_budget_usec: number;
+		/** Time spent in the last frame running jobs and callbacks */
+		frame_usec: number;
+		/** Promise jobs run in the last frame */
+		executed_jobs: number;
+		/** Promise jobs carried over to the next frame by the last frame */
+		deferred_jobs: number;
+		/** Tasks and idle callbacks run in the last frame */
+		executed_tasks: number;
+		/** Tasks and idle callbacks carried over to the next frame by the last frame */
+		deferred_tasks: number;
+		total_deferred_jobs: number;
+		total_deferred_tasks: number;
+		/** Tasks waiting in each lane */
+		queued: { [priority in TaskPriority]: number };
+	}
+
+	/**
+	 * Returns the counters of the frame scheduler of this context, which runs the promise jobs, `scheduler.postTask()` tasks and idle callbacks.
+	 */
+	function get_scheduler_stats(): SchedulerStats;
+
+	interface WorkerPoolMetrics {
+		/** Number of threads of the pool */
+		threads: number;
+		/** Tasks waiting for a thread */
+		queued: number;
+		/** Tasks started but not settled yet */
+		running: number;
+		completed: number;
+		failed: number;
+		/** Tasks run by another thread than the one they were queued to */
+		stolen: number;
+		/** Average time between `run` and the start of the task */
+		average_wait_usec: number;
+		/** Average time between `run` and the settlement of the promise */
+		average_latency_usec: number;
+		max_latency_usec: number;
+	}
+
+	/**
+	 * A set of worker threads which run exported functions of modules.
+	 *
+	 * Every thread keeps its runtime and the modules it loaded between the tasks.
+	 * The arguments and the results are copied like the messages of a `Worker`.
+	 */
+	class WorkerPool {
+		/**
+		 * Starts the threads of the pool
+		 * @param threads Number of threads, defaults to the number of processors
+		 */
+		constructor(threads?: number);
+
+		/**
+		 * Calls a function exported by a module on a thread of the pool.
+		 * The promise is resolved with the value returned by the function, or the value it resolves to if it returns a promise.
+		 * @param module The path of the module
+		 * @param name The name of the exported function
+		 * @param args The arguments of the call
+		 */
+		run(module: string, name: string, args?: any[]): Promise<any>;
+
+		/** Stops the threads of the pool, the promises of the unfinished tasks are rejected */
+		terminate(): void;
+
+		get_metrics(): WorkerPoolMetrics;
+	}
 	
 	/**
 	 * Wait a signal of an object
@@ -267,6 +423,12 @@ declare module godot {
 		/** Returns a new vector with all components in absolute values (i.e. positive). */
 		abs() : Vector2;
 
+		/** Same as `abs` but stores the result in this object and returns it. */
+		abs_in_place() : Vector2;
+
+		/** Same as `abs` but stores the result in `out` and returns it. */
+		abs_to(out: Vector2) : Vector2;
+
 		/** Returns the vector's angle in radians with respect to the X axis, or `(1, 0)` vector.
 
 		 Equivalent to the result of `@GDScript.atan2` when called with the vector's `x` and `y` as parameters: `atan2(x, y)`. */
@@ -284,9 +446,21 @@ declare module godot {
 		/** Returns the vector "bounced off" from a plane defined by the given normal. */
 		bounce(n: Vector2) : Vector2;
 
+		/** Same as `bounce` but stores the result in this object and returns it. */
+		bounce_in_place(n: Vector2) : Vector2;
+
+		/** Same as `bounce` but stores the result in `out` and returns it. */
+		bounce_to(out: Vector2, n: Vector2) : Vector2;
+
 		/** Returns the vector with all components rounded up. */
 		ceil() : Vector2;
 
+		/** Same as `ceil` but stores the result in this object and returns it. */
+		ceil_in_place() : Vector2;
+
+		/** Same as `ceil` but stores the result in `out` and returns it. */
+		ceil_to(out: Vector2) : Vector2;
+
 		/** Returns the vector with a maximum length. */
 		clamped(length: number) : Vector2;
 
@@ -311,6 +485,12 @@ declare module godot {
 		/** Returns the vector with all components rounded down. */
 		floor() : Vector2;
 
+		/** Same as `floor` but stores the result in this object and returns it. */
+		floor_in_place() : Vector2;
+
+		/** Same as `floor` but stores the result in `out` and returns it. */
+		floor_to(out: Vector2) : Vector2;
+
 		/**  */
 		is_equal_approx(v: Vector2) : boolean;
 
@@ -323,15 +503,36 @@ declare module godot {
 		/** Returns the vector's length squared. Prefer this method over `length` if you need to sort vectors or need the squared length for some formula. */
 		length_squared() : number;
 
+		/** Returns the result of the linear interpolation between this vector and `to` by amount `weight`. `weight` is in the range of `0.0 - 1.0`, representing the amount of interpolation. */
+		lerp(to: Vector2, weight: number) : Vector2;
+
+		/** Same as `lerp` but stores the result in this object and returns it. */
+		lerp_in_place(to: Vector2, weight: number) : Vector2;
+
+		/** Same as `lerp` but stores the result in `out` and returns it. */
+		lerp_to(out: Vector2, to: Vector2, weight: number) : Vector2;
+
 		/** Returns the result of the linear interpolation between this vector and `b` by amount `t`. `t` is in the range of `0.0 - 1.0`, representing the amount of interpolation. */
 		linear_interpolate(b: Vector2, t: number) : Vector2;
 
 		/** Moves the vector toward `to` by the fixed `delta` amount. */
 		move_toward(to: Vector2, delta: number) : Vector2;
 
+		/** Same as `move_toward` but stores the result in this object and returns it. */
+		move_toward_in_place(to: Vector2, delta: number) : Vector2;
+
+		/** Same as `move_toward` but stores the result in `out` and returns it. */
+		move_toward_to(out: Vector2, to: Vector2, delta: number) : Vector2;
+
 		/** Returns the vector scaled to unit length. Equivalent to `v / v.length()`. */
 		normalized() : Vector2;
 
+		/** Same as `normalized` but stores the result in this object and returns it. */
+		normalized_in_place() : Vector2;
+
+		/** Same as `normalized` but stores the result in `out` and returns it. */
+		normalized_to(out: Vector2) : Vector2;
+
 		/** Returns a vector composed of the `fposmod` of this vector's components and `mod`. */
 		posmod(mod: number) : Vector2;
 
@@ -341,15 +542,39 @@ declare module godot {
 		/** Returns the vector projected onto the vector `b`. */
 		project(b: Vector2) : Vector2;
 
+		/** Same as `project` but stores the result in this object and returns it. */
+		project_in_place(b: Vector2) : Vector2;
+
+		/** Same as `project` but stores the result in `out` and returns it. */
+		project_to(out: Vector2, b: Vector2) : Vector2;
+
 		/** Returns the vector reflected from a plane defined by the given normal. */
 		reflect(n: Vector2) : Vector2;
 
+		/** Same as `reflect` but stores the result in this object and returns it. */
+		reflect_in_place(n: Vector2) : Vector2;
+
+		/** Same as `reflect` but stores the result in `out` and returns it. */
+		reflect_to(out: Vector2, n: Vector2) : Vector2;
+
 		/** Returns the vector rotated by `phi` radians. See also `@GDScript.deg2rad`. */
 		rotated(phi: number) : Vector2;
 
+		/** Same as `rotated` but stores the result in this object and returns it. */
+		rotated_in_place(phi: number) : Vector2;
+
+		/** Same as `rotated` but stores the result in `out` and returns it. */
+		rotated_to(out: Vector2, phi: number) : Vector2;
+
 		/** Returns the vector with all components rounded to the nearest integer, with halfway cases rounded away from zero. */
 		round() : Vector2;
 
+		/** Same as `round` but stores the result in this object and returns it. */
+		round_in_place() : Vector2;
+
+		/** Same as `round` but stores the result in `out` and returns it. */
+		round_to(out: Vector2) : Vector2;
+
 		/** Returns the vector with each component set to one or negative one, depending on the signs of the components. */
 		sign() : Vector2;
 
@@ -358,9 +583,21 @@ declare module godot {
 		 **Note:** Both vectors must be normalized. */
 		slerp(b: Vector2, t: number) : Vector2;
 
+		/** Same as `slerp` but stores the result in this object and returns it. */
+		slerp_in_place(b: Vector2, t: number) : Vector2;
+
+		/** Same as `slerp` but stores the result in `out` and returns it. */
+		slerp_to(out: Vector2, b: Vector2, t: number) : Vector2;
+
 		/** Returns the component of the vector along a plane defined by the given normal. */
 		slide(n: Vector2) : Vector2;
 
+		/** Same as `slide` but stores the result in this object and returns it. */
+		slide_in_place(n: Vector2) : Vector2;
+
+		/** Same as `slide` but stores the result in `out` and returns it. */
+		slide_to(out: Vector2, n: Vector2) : Vector2;
+
 		/** Returns the vector snapped to a grid with the given size. */
 		snapped(by: Vector2) : Vector2;
 
@@ -491,18 +728,42 @@ declare module godot {
 		/** Returns a new vector with all components in absolute values (i.e. positive). */
 		abs() : Vector3;
 
+		/** Same as `abs` but stores the result in this object and returns it. */
+		abs_in_place() : Vector3;
+
+		/** Same as `abs` but stores the result in `out` and returns it. */
+		abs_to(out: Vector3) : Vector3;
+
 		/** Returns the minimum angle to the given vector. */
 		angle_to(to: Vector3) : number;
 
 		/** Returns the vector "bounced off" from a plane defined by the given normal. */
 		bounce(n: Vector3) : Vector3;
 
+		/** Same as `bounce` but stores the result in this object and returns it. */
+		bounce_in_place(n: Vector3) : Vector3;
+
+		/** Same as `bounce` but stores the result in `out` and returns it. */
+		bounce_to(out: Vector3, n: Vector3) : Vector3;
+
 		/** Returns a new vector with all components rounded up. */
 		ceil() : Vector3;
 
+		/** Same as `ceil` but stores the result in this object and returns it. */
+		ceil_in_place() : Vector3;
+
+		/** Same as `ceil` but stores the result in `out` and returns it. */
+		ceil_to(out: Vector3) : Vector3;
+
 		/** Returns the cross product with `b`. */
 		cross(b: Vector3) : Vector3;
 
+		/** Same as `cross` but stores the result in this object and returns it. */
+		cross_in_place(b: Vector3) : Vector3;
+
+		/** Same as `cross` but stores the result in `out` and returns it. */
+		cross_to(out: Vector3, b: Vector3) : Vector3;
+
 		/** Performs a cubic interpolation between vectors `pre_a`, `a`, `b`, `post_b` (`a` is current), by the given amount `t`. `t` is in the range of `0.0 - 1.0`, representing the amount of interpolation. */
 		cubic_interpolate(b: Vector3, pre_a: Vector3, post_b: Vector3, t: number) : Vector3;
 
@@ -521,6 +782,12 @@ declare module godot {
 		/** Returns a new vector with all components rounded down. */
 		floor() : Vector3;
 
+		/** Same as `floor` but stores the result in this object and returns it. */
+		floor_in_place() : Vector3;
+
+		/** Same as `floor` but stores the result in `out` and returns it. */
+		floor_to(out: Vector3) : Vector3;
+
 		/** Returns the inverse of the vector. This is the same as `Vector3( 1.0 / v.x, 1.0 / v.y, 1.0 / v.z )`. */
 		inverse() : Vector3;
 
@@ -536,6 +803,15 @@ declare module godot {
 		/** Returns the vector's length squared. Prefer this function over `length` if you need to sort vectors or need the squared length for some formula. */
 		length_squared() : number;
 
+		/** Returns the result of the linear interpolation between this vector and `to` by amount `weight`. `weight` is in the range of `0.0 - 1.0`, representing the amount of interpolation. */
+		lerp(to: Vector3, weight: number) : Vector3;
+
+		/** Same as `lerp` but stores the result in this object and returns it. */
+		lerp_in_place(to: Vector3, weight: number) : Vector3;
+
+		/** Same as `lerp` but stores the result in `out` and returns it. */
+		lerp_to(out: Vector3, to: Vector3, weight: number) : Vector3;
+
 		/** Returns the result of the linear interpolation between this vector and `b` by amount `t`. `t` is in the range of `0.0 - 1.0`, representing the amount of interpolation.. */
 		linear_interpolate(b: Vector3, t: number) : Vector3;
 
@@ -548,9 +824,21 @@ declare module godot {
 		/** Moves the vector toward `to` by the fixed `delta` amount. */
 		move_toward(to: Vector3, delta: number) : Vector3;
 
+		/** Same as `move_toward` but stores the result in this object and returns it. */
+		move_toward_in_place(to: Vector3, delta: number) : Vector3;
+
+		/** Same as `move_toward` but stores the result in `out` and returns it. */
+		move_toward_to(out: Vector3, to: Vector3, delta: number) : Vector3;
+
 		/** Returns the vector scaled to unit length. Equivalent to `v / v.length()`. */
 		normalized() : Vector3;
 
+		/** Same as `normalized` but stores the result in this object and returns it. */
+		normalized_in_place() : Vector3;
+
+		/** Same as `normalized` but stores the result in `out` and returns it. */
+		normalized_to(out: Vector3) : Vector3;
+
 		/** Returns the outer product with `b`. */
 		outer(b: Vector3) : Basis;
 
@@ -563,15 +851,39 @@ declare module godot {
 		/** Returns the vector projected onto the vector `b`. */
 		project(b: Vector3) : Vector3;
 
+		/** Same as `project` but stores the result in this object and returns it. */
+		project_in_place(b: Vector3) : Vector3;
+
+		/** Same as `project` but stores the result in `out` and returns it. */
+		project_to(out: Vector3, b: Vector3) : Vector3;
+
 		/** Returns the vector reflected from a plane defined by the given normal. */
 		reflect(n: Vector3) : Vector3;
 
+		/** Same as `reflect` but stores the result in this object and returns it. */
+		reflect_in_place(n: Vector3) : Vector3;
+
+		/** Same as `reflect` but stores the result in `out` and returns it. */
+		reflect_to(out: Vector3, n: Vector3) : Vector3;
+
 		/** Rotates the vector around a given axis by `phi` radians. The axis must be a normalized vector. */
 		rotated(axis: Vector3, phi: number) : Vector3;
 
+		/** Same as `rotated` but stores the result in this object and returns it. */
+		rotated_in_place(axis: Vector3, phi: number) : Vector3;
+
+		/** Same as `rotated` but stores the result in `out` and returns it. */
+		rotated_to(out: Vector3, axis: Vector3, phi: number) : Vector3;
+
 		/** Returns the vector with all components rounded to the nearest integer, with halfway cases rounded away from zero. */
 		round() : Vector3;
 
+		/** Same as `round` but stores the result in this object and returns it. */
+		round_in_place() : Vector3;
+
+		/** Same as `round` but stores the result in `out` and returns it. */
+		round_to(out: Vector3) : Vector3;
+
 		/** Returns the vector with each component set to one or negative one, depending on the signs of the components. */
 		sign() : Vector3;
 
@@ -580,9 +892,21 @@ declare module godot {
 		 **Note:** Both vectors must be normalized. */
 		slerp(b: Vector3, t: number) : Vector3;
 
+		/** Same as `slerp` but stores the result in this object and returns it. */
+		slerp_in_place(b: Vector3, t: number) : Vector3;
+
+		/** Same as `slerp` but stores the result in `out` and returns it. */
+		slerp_to(out: Vector3, b: Vector3, t: number) : Vector3;
+
 		/** Returns the component of the vector along a plane defined by the given normal. */
 		slide(n: Vector3) : Vector3;
 
+		/** Same as `slide` but stores the result in this object and returns it. */
+		slide_in_place(n: Vector3) : Vector3;
+
+		/** Same as `slide` but stores the result in `out` and returns it. */
+		slide_to(out: Vector3, n: Vector3) : Vector3;
+
 		/** Returns a copy of the vector snapped to the lowest neared multiple. */
 		snapped(by: Vector3) : Vector3;
 
@@ -679,21 +1003,51 @@ declare module godot {
 		/** Returns the inverse of the matrix. */
 		inverse() : Basis;
 
+		/** Same as `inverse` but stores the result in this object and returns it. */
+		inverse_in_place() : Basis;
+
+		/** Same as `inverse` but stores the result in `out` and returns it. */
+		inverse_to(out: Basis) : Basis;
+
 		/**  */
 		is_equal_approx(b: Basis) : boolean;
 
 		/** Returns the orthonormalized version of the matrix (useful to call from time to time to avoid rounding error for orthogonal matrices). This performs a Gram-Schmidt orthonormalization on the basis of the matrix. */
 		orthonormalized() : Basis;
 
+		/** Same as `orthonormalized` but stores the result in this object and returns it. */
+		orthonormalized_in_place() : Basis;
+
+		/** Same as `orthonormalized` but stores the result in `out` and returns it. */
+		orthonormalized_to(out: Basis) : Basis;
+
 		/** Introduce an additional rotation around the given axis by phi (radians). The axis must be a normalized vector. */
 		rotated(axis: Vector3, phi: number) : Basis;
 
+		/** Same as `rotated` but stores the result in this object and returns it. */
+		rotated_in_place(axis: Vector3, phi: number) : Basis;
+
+		/** Same as `rotated` but stores the result in `out` and returns it. */
+		rotated_to(out: Basis, axis: Vector3, phi: number) : Basis;
+
 		/** Introduce an additional scaling specified by the given 3D scaling factor. */
 		scaled(scale: Vector3) : Basis;
 
+		/** Same as `scaled` but stores the result in this object and returns it. */
+		scaled_in_place(scale: Vector3) : Basis;
+
+		/** Same as `scaled` but stores the result in `out` and returns it. */
+		scaled_to(out: Basis, scale: Vector3) : Basis;
+
 		/** Assuming that the matrix is a proper rotation matrix, slerp performs a spherical-linear interpolation with another rotation matrix. */
 		slerp(b: Basis, t: number) : Basis;
 
+		/** Same as `slerp` but stores the result in this object and returns it. */
+		slerp_in_place(b: Basis, t: number) : Basis;
+
+		/** Same as `slerp` but stores the result in `out` and returns it. */
+		slerp_to(out: Basis, b: Basis, t: number) : Basis;
+
 		/** Transposed dot product with the X axis of the matrix. */
 		tdotx(p_with: Vector3) : number;
 
@@ -706,6 +1060,12 @@ declare module godot {
 		/** Returns the transposed version of the matrix. */
 		transposed() : Basis;
 
+		/** Same as `transposed` but stores the result in this object and returns it. */
+		transposed_in_place() : Basis;
+
+		/** Same as `transposed` but stores the result in `out` and returns it. */
+		transposed_to(out: Basis) : Basis;
+
 		/** Returns a vector transformed (multiplied) by the matrix. */
 		xform(v: Vector3) : Vector3;
 
@@ -750,12 +1110,30 @@ declare module godot {
 		/** Returns the inverse of the transform, under the assumption that the transformation is composed of rotation, scaling and translation. */
 		affine_inverse() : Transform;
 
+		/** Same as `affine_inverse` but stores the result in this object and returns it. */
+		affine_inverse_in_place() : Transform;
+
+		/** Same as `affine_inverse` but stores the result in `out` and returns it. */
+		affine_inverse_to(out: Transform) : Transform;
+
 		/** Interpolates the transform to other Transform by weight amount (0-1). */
 		interpolate_with(transform: Transform, weight: number) : Transform;
 
+		/** Same as `interpolate_with` but stores the result in this object and returns it. */
+		interpolate_with_in_place(transform: Transform, weight: number) : Transform;
+
+		/** Same as `interpolate_with` but stores the result in `out` and returns it. */
+		interpolate_with_to(out: Transform, transform: Transform, weight: number) : Transform;
+
 		/** Returns the inverse of the transform, under the assumption that the transformation is composed of rotation and translation (no scaling, use affine_inverse for transforms with scaling). */
 		inverse() : Transform;
 
+		/** Same as `inverse` but stores the result in this object and returns it. */
+		inverse_in_place() : Transform;
+
+		/** Same as `inverse` but stores the result in `out` and returns it. */
+		inverse_to(out: Transform) : Transform;
+
 		/**  */
 		is_equal_approx(transform: Transform) : boolean;
 
@@ -769,15 +1147,39 @@ declare module godot {
 		/** Returns the transform with the basis orthogonal (90 degrees), and normalized axis vectors. */
 		orthonormalized() : Transform;
 
+		/** Same as `orthonormalized` but stores the result in this object and returns it. */
+		orthonormalized_in_place() : Transform;
+
+		/** Same as `orthonormalized` but stores the result in `out` and returns it. */
+		orthonormalized_to(out: Transform) : Transform;
+
 		/** Rotates the transform around given axis by phi. The axis must be a normalized vector. */
 		rotated(axis: Vector3, phi: number) : Transform;
 
+		/** Same as `rotated` but stores the result in this object and returns it. */
+		rotated_in_place(axis: Vector3, phi: number) : Transform;
+
+		/** Same as `rotated` but stores the result in `out` and returns it. */
+		rotated_to(out: Transform, axis: Vector3, phi: number) : Transform;
+
 		/** Scales the transform by the specified 3D scaling factors. */
 		scaled(scale: Vector3) : Transform;
 
+		/** Same as `scaled` but stores the result in this object and returns it. */
+		scaled_in_place(scale: Vector3) : Transform;
+
+		/** Same as `scaled` but stores the result in `out` and returns it. */
+		scaled_to(out: Transform, scale: Vector3) : Transform;
+
 		/** Translates the transform by the specified offset. */
 		translated(ofs: Vector3) : Transform;
 
+		/** Same as `translated` but stores the result in this object and returns it. */
+		translated_in_place(ofs: Vector3) : Transform;
+
+		/** Same as `translated` but stores the result in `out` and returns it. */
+		translated_to(out: Transform, ofs: Vector3) : Transform;
+
 		/** Transforms the given `Vector3`, `Plane`, `AABB`, or `PackedVector3Array` by this transform. */
 		xform<T extends Vector3|Plane|AABB >(v: T) : T;
 
@@ -825,6 +1227,12 @@ declare module godot {
 		/** Returns the inverse of the matrix. */
 		affine_inverse() : Transform2D;
 
+		/** Same as `affine_inverse` but stores the result in this object and returns it. */
+		affine_inverse_in_place() : Transform2D;
+
+		/** Same as `affine_inverse` but stores the result in `out` and returns it. */
+		affine_inverse_to(out: Transform2D) : Transform2D;
+
 		/** Transforms the given vector by this transform's basis (no translation). */
 		basis_xform(v: Vector2) : Vector2;
 
@@ -843,24 +1251,60 @@ declare module godot {
 		/** Returns a transform interpolated between this transform and another by a given weight (0-1). */
 		interpolate_with(transform: Transform2D, weight: number) : Transform2D;
 
+		/** Same as `interpolate_with` but stores the result in this object and returns it. */
+		interpolate_with_in_place(transform: Transform2D, weight: number) : Transform2D;
+
+		/** Same as `interpolate_with` but stores the result in `out` and returns it. */
+		interpolate_with_to(out: Transform2D, transform: Transform2D, weight: number) : Transform2D;
+
 		/** Returns the inverse of the transform, under the assumption that the transformation is composed of rotation and translation (no scaling, use affine_inverse for transforms with scaling). */
 		inverse() : Transform2D;
 
+		/** Same as `inverse` but stores the result in this object and returns it. */
+		inverse_in_place() : Transform2D;
+
+		/** Same as `inverse` but stores the result in `out` and returns it. */
+		inverse_to(out: Transform2D) : Transform2D;
+
 		/**  */
 		is_equal_approx(transform: Transform2D) : boolean;
 
 		/** Returns the transform with the basis orthogonal (90 degrees), and normalized axis vectors. */
 		orthonormalized() : Transform2D;
 
+		/** Same as `orthonormalized` but stores the result in this object and returns it. */
+		orthonormalized_in_place() : Transform2D;
+
+		/** Same as `orthonormalized` but stores the result in `out` and returns it. */
+		orthonormalized_to(out: Transform2D) : Transform2D;
+
 		/** Rotates the transform by the given angle (in radians). */
 		rotated(phi: number) : Transform2D;
 
+		/** Same as `rotated` but stores the result in this object and returns it. */
+		rotated_in_place(phi: number) : Transform2D;
+
+		/** Same as `rotated` but stores the result in `out` and returns it. */
+		rotated_to(out: Transform2D, phi: number) : Transform2D;
+
 		/** Scales the transform by the given factor. */
 		scaled(scale: Vector2) : Transform2D;
 
+		/** Same as `scaled` but stores the result in this object and returns it. */
+		scaled_in_place(scale: Vector2) : Transform2D;
+
+		/** Same as `scaled` but stores the result in `out` and returns it. */
+		scaled_to(out: Transform2D, scale: Vector2) : Transform2D;
+
 		/** Translates the transform by the given offset. */
 		translated(offset: Vector2) : Transform2D;
 
+		/** Same as `translated` but stores the result in this object and returns it. */
+		translated_in_place(offset: Vector2) : Transform2D;
+
+		/** Same as `translated` but stores the result in `out` and returns it. */
+		translated_to(out: Transform2D, offset: Vector2) : Transform2D;
+
 		/** Transforms the given `Vector2`, `Rect2`, or `PackedVector2Array` by this transform. */
 		xform<T extends Vector2 | Rect2 >(v: T) : T;
 
@@ -955,6 +1399,12 @@ declare module godot {
 		  */
 		darkened(amount: number) : Color;
 
+		/** Same as `darkened` but stores the result in this object and returns it. */
+		darkened_in_place(amount: number) : Color;
+
+		/** Same as `darkened` but stores the result in `out` and returns it. */
+		darkened_to(out: Color, amount: number) : Color;
+
 		/** Constructs a color from an HSV profile. `h`, `s`, and `v` are values between 0 and 1.
 
 		 
@@ -983,6 +1433,12 @@ declare module godot {
 		  */
 		inverted() : Color;
 
+		/** Same as `inverted` but stores the result in this object and returns it. */
+		inverted_in_place() : Color;
+
+		/** Same as `inverted` but stores the result in `out` and returns it. */
+		inverted_to(out: Color) : Color;
+
 		/**  */
 		is_equal_approx(color: Color) : boolean;
 
@@ -995,6 +1451,21 @@ declare module godot {
 		  */
 		lightened(amount: number) : Color;
 
+		/** Same as `lightened` but stores the result in this object and returns it. */
+		lightened_in_place(amount: number) : Color;
+
+		/** Same as `lightened` but stores the result in `out` and returns it. */
+		lightened_to(out: Color, amount: number) : Color;
+
+		/** Returns the linear interpolation with another color. The interpolation factor `weight` is between 0 and 1. */
+		lerp(to: Color, weight: number) : Color;
+
+		/** Same as `lerp` but stores the result in this object and returns it. */
+		lerp_in_place(to: Color, weight: number) : Color;
+
+		/** Same as `lerp` but stores the result in `out` and returns it. */
+		lerp_to(out: Color, to: Color, weight: number) : Color;
+
 		/** Returns the linear interpolation with another color. The interpolation factor `t` is between 0 and 1.
 
 		 
@@ -1775,6 +2246,12 @@ declare module godot {
 		/** Returns the inverse of the quaternion. */
 		inverse() : Quat;
 
+		/** Same as `inverse` but stores the result in this object and returns it. */
+		inverse_in_place() : Quat;
+
+		/** Same as `inverse` but stores the result in `out` and returns it. */
+		inverse_to(out: Quat) : Quat;
+
 		/**  */
 		is_equal_approx(quat: Quat) : boolean;
 
@@ -1790,6 +2267,12 @@ declare module godot {
 		/** Returns a copy of the quaternion, normalized to unit length. */
 		normalized() : Quat;
 
+		/** Same as `normalized` but stores the result in this object and returns it. */
+		normalized_in_place() : Quat;
+
+		/** Same as `normalized` but stores the result in `out` and returns it. */
+		normalized_to(out: Quat) : Quat;
+
 		/** Sets the quaternion to a rotation which rotates around axis by the specified angle, in radians. The axis must be a normalized vector. */
 		set_axis_angle(axis: Vector3, angle: number) : void;
 
@@ -1799,9 +2282,21 @@ declare module godot {
 		/** Performs a spherical-linear interpolation with another quaternion. */
 		slerp(b: Quat, t: number) : Quat;
 
+		/** Same as `slerp` but stores the result in this object and returns it. */
+		slerp_in_place(b: Quat, t: number) : Quat;
+
+		/** Same as `slerp` but stores the result in `out` and returns it. */
+		slerp_to(out: Quat, b: Quat, t: number) : Quat;
+
 		/** Performs a spherical-linear interpolation with another quaterion without checking if the rotation path is not bigger than 90°. */
 		slerpni(b: Quat, t: number) : Quat;
 
+		/** Same as `slerpni` but stores the result in this object and returns it. */
+		slerpni_in_place(b: Quat, t: number) : Quat;
+
+		/** Same as `slerpni` but stores the result in `out` and returns it. */
+		slerpni_to(out: Quat, b: Quat, t: number) : Quat;
+
 		/** Transforms the vector `v` by this quaternion. */
 		xform(v: Vector3) : Vector3;
 
@@ -1959,6 +2454,11 @@ declare module godot {
 		
 		/** Returns the content of the array as an `ArrayBuffer` */
 		get_buffer() : ArrayBuffer;
+
+		/** Returns a `Uint8Array` over the memory of this array without copying it.
+		 *
+		 * The memory is moved to the typed array and this array is left empty. Construct a packed array from its `buffer` to pass the data back to the engine. */
+		asTypedArray() : Uint8Array;
 	}
 
 	/** A packed `Array` of `Color`.
@@ -2009,6 +2509,11 @@ declare module godot {
 
 		/** Returns the content of the array as an `ArrayBuffer` */
 		get_buffer() : ArrayBuffer;
+
+		/** Returns a `Float32Array` over the memory of this array without copying it. Colors are stored as interleaved `r, g, b, a` components.
+		 *
+		 * The memory is moved to the typed array and this array is left empty. Construct a packed array from its `buffer` to pass the data back to the engine. */
+		asTypedArray() : Float32Array;
 	}
 
 	/** A packed `Array` of integers (`int`).
@@ -2061,6 +2566,11 @@ declare module godot {
 
 		/** Returns the content of the array as an `ArrayBuffer` */
 		get_buffer() : ArrayBuffer;
+
+		/** Returns a `Int32Array` over the memory of this array without copying it.
+		 *
+		 * The memory is moved to the typed array and this array is left empty. Construct a packed array from its `buffer` to pass the data back to the engine. */
+		asTypedArray() : Int32Array;
 	}
 
 	//**Note:** This type is limited to signed 32-bit integers, which means it can only take values in the interval ``-2^31, 2^31 - 1``, i.e. ``-2147483648, 2147483647``. Exceeding those bounds will wrap around. In comparison, `int` uses signed 64-bit integers which can hold much larger values. */
@@ -2108,6 +2618,11 @@ declare module godot {
 
 		/** Returns the content of the array as an `ArrayBuffer` */
 		get_buffer() : ArrayBuffer;
+
+		/** Returns a `BigInt64Array` over the memory of this array without copying it.
+		 *
+		 * The memory is moved to the typed array and this array is left empty. Construct a packed array from its `buffer` to pass the data back to the engine. */
+		asTypedArray() : BigInt64Array;
 	}
 
 	/** A packed `Array` of reals (`float`).
@@ -2157,6 +2672,11 @@ declare module godot {
 
 		/** Returns the content of the array as an `ArrayBuffer` */
 		get_buffer() : ArrayBuffer;
+
+		/** Returns a `Float32Array` over the memory of this array without copying it.
+		 *
+		 * The memory is moved to the typed array and this array is left empty. Construct a packed array from its `buffer` to pass the data back to the engine. */
+		asTypedArray() : Float32Array;
 	}
 
 	/** A packed `Array` of reals (`float`).
@@ -2206,6 +2726,11 @@ declare module godot {
 
 		/** Returns the content of the array as an `ArrayBuffer` */
 		get_buffer() : ArrayBuffer;
+
+		/** Returns a `Float64Array` over the memory of this array without copying it.
+		 *
+		 * The memory is moved to the typed array and this array is left empty. Construct a packed array from its `buffer` to pass the data back to the engine. */
+		asTypedArray() : Float64Array;
 	}
 
 	/** A packed `Array` of `String`.
@@ -2303,6 +2828,11 @@ declare module godot {
 		
 		/** Returns the content of the array as an `ArrayBuffer` */
 		get_buffer() : ArrayBuffer;
+
+		/** Returns a `Float32Array` over the memory of this array without copying it. Vectors are stored as interleaved `x, y` components (`Float64Array` if the engine is built with double precision).
+		 *
+		 * The memory is moved to the typed array and this array is left empty. Construct a packed array from its `buffer` to pass the data back to the engine. */
+		asTypedArray() : Float32Array;
 	}
 
 	/** A packed `Array` of `Vector3`.
@@ -2352,5 +2882,10 @@ declare module godot {
 		
 		/** Returns the content of the array as an `ArrayBuffer` */
 		get_buffer() : ArrayBuffer;
+
+		/** Returns a `Float32Array` over the memory of this array without copying it. Vectors are stored as interleaved `x, y, z` components (`Float64Array` if the engine is built with double precision).
+		 *
+		 * The memory is moved to the typed array and this array is left empty. Construct a packed array from its `buffer` to pass the data back to the engine. */
+		asTypedArray() : Float32Array;
 	}
 }
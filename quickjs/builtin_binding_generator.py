@@ -1,9 +1,20 @@
 #!/usr/bin/env python
-import json, os
+import json, os, sys, hashlib, multiprocessing
 
 DIR = os.path.abspath( os.path.dirname(__file__) )
+if os.path.join(DIR, '..') not in sys.path:
+	sys.path.append(os.path.join(DIR, '..'))
+import code_template
+from code_template import apply_pattern
 OUTPUT_FILE = os.path.join(DIR, "quickjs_builtin_binder.gen.cpp")
-API = json.load(open(os.path.join(DIR, '..', 'builtin_api.gen.json'), 'r'))
+SHARDS_DIR = os.path.join(DIR, "builtin_binder")
+MANIFEST_FILE = os.path.join(DIR, "quickjs_builtin_binder.gen.manifest")
+API_FILE = os.path.join(DIR, '..', 'builtin_api.gen.json')
+ENGINE_OUTPUT_FILE = os.path.join(DIR, "quickjs_engine_binder.gen.cpp")
+ENGINE_MANIFEST_FILE = os.path.join(DIR, "quickjs_engine_binder.gen.manifest")
+ENGINE_API_FILE = os.path.join(DIR, '..', 'engine_api.gen.json')
+# Must match QuickJSBinder::EngineMethodThunk::MAX_ARGUMENT_COUNT
+MAX_THUNK_ARGUMENT_COUNT = 8
 
 VariantTypes = {
 	"boolean": "Variant::BOOL",
@@ -113,12 +124,6 @@ GodotToJSTemplates = {
 	"Variant": 'QuickJSBinder::variant_to_var(ctx, ${arg})',
 }
 
-def apply_pattern(template, values):
-	for key in values:
-		template = template.replace( '${' + key + '}', values[key])
-	return template
-
-
 def generate_constructor(cls):
 	TemplateConstructorName = '${class}_constructor'
 	TemplateConstructorDeclare = 'static JSValue ${class}_constructor(JSContext *ctx, JSValueConst new_target, int argc, JSValueConst *argv);\n'
@@ -448,67 +453,56 @@ def generate_property_bindings(cls):
 	TemplateDeclar = 'static void bind_${class}_properties(JSContext *ctx);\n'
 	TemplateBind = '\tbind_${class}_properties(ctx);\n'
 	def generate_members(cls):
-		Template = '''
-	JSCFunctionMagic *getter = [](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int magic) -> JSValue {
-		ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
-		const ${class} *ptr = bind->get${class}();
-		switch (magic) {\
-${getters}
-		}
-		return JS_UNDEFINED;
-	};
-	
-	JSCFunctionMagic *setter = [](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int magic) -> JSValue {
-		ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
-		${class} *ptr = bind->get${class}();\
-${validation}
-		switch (magic) {\
-${setters}
-		}
-		return JS_DupValue(ctx, argv[0]);
-	};
-${bindings}
-		'''
-		TemplateGetterItem = '''
-			case ${index}:
-				return ${value};'''
-		TemplateSetterItem = '''
-			case ${index}:
+		TemplateGetter = '''
+static JSValue ${class}_get_${name}(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int magic) {
+	ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+	const ${class} *ptr = bind->get${class}();
+	return ${value};
+}
+'''
+		TemplateSetter = '''
+static JSValue ${class}_set_${name}(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int magic) {
+	ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+	${class} *ptr = bind->get${class}();\
+${fast_path}
 #ifdef DEBUG_METHODS_ENABLED
-				ERR_FAIL_COND_V(!QuickJSBinder::validate_type(ctx, ${type}, argv[0]), (JS_ThrowTypeError(ctx, "${type_name} expected for ${class}.${name}")));
+	ERR_FAIL_COND_V(!QuickJSBinder::validate_type(ctx, ${type}, argv[0]), (JS_ThrowTypeError(ctx, "${type_name} expected for ${class}.${name}")));
 #endif
-				ptr->${native} = ${value};
-				break;'''
-		TemplateItemBinding = '\tbinder->get_builtin_binder().register_property(${type}, "${name}", getter, setter, ${index});\n'
-		getters = ''
-		setters = ''
-		bindings = ''
+	ptr->${native} = ${value};
+	return JS_DupValue(ctx, argv[0]);
+}
+'''
+		# numbers are read straight from the value tag, the generic conversion is only for other values
+		TemplateNumberFastPath = '''
+	real_t number;
+	if (QuickJSBinder::js_to_number_fast(argv[0], number)) {
+		ptr->${native} = number;
+		return JS_DupValue(ctx, argv[0]);
+	}'''
+		TemplateItemBinding = '\tbinder->get_builtin_binder().register_property(${type}, "${name}", ${class}_get_${name}, ${class}_set_${name}, ${index});\n'
+		accessors = []
+		bindings = []
 		for i in range(len(cls['properties'])):
 			p = cls['properties'][i]
 			type = p['type']
 			name = p['name']
 			native_name = p['native']
-			getters += apply_pattern(TemplateGetterItem, {
-				'index': str(i),
+			accessors.append(apply_pattern(TemplateGetter, {
+				'class': class_name,
+				'name': name,
 				'value': apply_pattern(GodotToJSTemplates[type], { 'arg': apply_pattern('ptr->${native}', {'native': native_name}) })
-			})
-			setters += apply_pattern(TemplateSetterItem, {
-				'index': str(i),
+			}))
+			accessors.append(apply_pattern(TemplateSetter, {
 				'name': name,
 				'native': native_name,
 				'type': VariantTypes[type],
 				'type_name': type,
 				'class': class_name,
+				'fast_path': apply_pattern(TemplateNumberFastPath, {'native': native_name}) if type == 'number' else '',
 				'value': apply_pattern(JSToGodotTemplates[type], {'arg': 'argv[0]'})
-			})
-			bindings += apply_pattern(TemplateItemBinding, {'index': str(i), 'name': name, 'type': VariantTypes[class_name]})
-		return apply_pattern(Template, {
-			'class': class_name,
-			'getters': getters,
-			'setters': setters,
-			'bindings': bindings,
-			'validation': ''
-		})
+			}))
+			bindings.append(apply_pattern(TemplateItemBinding, {'index': str(i), 'name': name, 'class': class_name, 'type': VariantTypes[class_name]}))
+		return ''.join(accessors), ''.join(bindings)
 	
 	def generate_methods(cls):
 		TemplateMethod = '''
@@ -525,32 +519,46 @@ ${arg_declares}
 		${argc});'''
 		TemplateArgDeclare = '''
 #ifdef DEBUG_METHODS_ENABLED
-			ERR_FAIL_COND_V(!QuickJSBinder::validate_type(ctx, ${type}, argv[${index}]), (JS_ThrowTypeError(ctx, "${type_name} expected for argument ${index} of ${class}.${name}")));
+			ERR_FAIL_COND_V(!QuickJSBinder::validate_type(ctx, ${type}, argv[${slot}]), (JS_ThrowTypeError(ctx, "${type_name} expected for argument ${slot} of ${class}.${name}")));
 #endif
 			const ${godot_type} &arg${index} = ${arg};
 '''
+		TemplateInPlaceCall = '*ptr = ptr->${native_method}(${args});'
+		TemplateOutDeclare = '''
+#ifdef DEBUG_METHODS_ENABLED
+			ERR_FAIL_COND_V(!QuickJSBinder::validate_type(ctx, ${type}, argv[0]), (JS_ThrowTypeError(ctx, "${class} expected for argument 0 of ${class}.${name}")));
+#endif
+			${class} *out = BINDING_DATA_FROM_JS(ctx, argv[0])->get${class}();\
+'''
+		TemplateOutCall = '*out = ptr->${native_method}(${args});'
 		TemplateReturnValue = '${godot_type} ret = '
-		bindings = ''
-		for m in cls['methods']:
+
+		def declare_arguments(m, name, offset):
 			args = ''
-			arg_declares = ''
+			arg_declares = []
 			for i in range(len(m['arguments'])):
 				arg = m['arguments'][i]
 				arg_type = arg['type']
 				templateArgDeclare = TemplateArgDeclare if VariantTypes[arg_type] != "Variant" else '''
 			const ${godot_type} &arg${index} = ${arg};
 '''
-				arg_declares += apply_pattern(templateArgDeclare, {
+				arg_declares.append(apply_pattern(templateArgDeclare, {
 					'index': str(i),
+					'slot': str(i + offset),
 					'type': VariantTypes[arg_type],
 					'type_name': arg_type,
 					'class': class_name,
-					'name': m['name'],
-					'arg': apply_pattern(JSToGodotTemplates[arg_type], {'arg': 'argv[' + str(i) +']'}),
+					'name': name,
+					'arg': apply_pattern(JSToGodotTemplates[arg_type], {'arg': 'argv[' + str(i + offset) +']'}),
 					'godot_type': GodotTypeNames[arg_type],
-				})
+				}))
 				if i > 0: args += ', '
 				args += 'arg' + str(i)
+			return ''.join(arg_declares), args
+
+		bindings = []
+		for m in cls['methods']:
+			arg_declares, args = declare_arguments(m, m['name'], 0)
 
 			CallTemplate = ''
 			native_method = m['native_method']
@@ -568,7 +576,7 @@ ${arg_declares}
 			else:
 				CallTemplate = ('' if m['return'] == 'void' else (apply_pattern(TemplateReturnValue, {"godot_type": GodotTypeNames[m['return']]}))) + 'ptr->${native_method}(${args});'
 			call = apply_pattern(CallTemplate, {'native_method': native_method, 'args': args})
-			bindings += apply_pattern(TemplateMethod, {
+			bindings.append(apply_pattern(TemplateMethod, {
 				"class": class_name,
 				"type": VariantTypes[class_name],
 				"name": m['name'],
@@ -576,19 +584,44 @@ ${arg_declares}
 				"arg_declares": arg_declares,
 				"argc": str(len(m['arguments'])),
 				"return": 'JS_UNDEFINED' if m['return'] == 'void' else apply_pattern(GodotToJSTemplates[m['return']], {'arg': 'ret'}),
-			})
-		return bindings
+			}))
+
+			if m.get('in_place'):
+				# name_in_place(...) overwrites this, name_to(out, ...) writes into out, none of them allocates a new object
+				name = m['name'] + '_in_place'
+				arg_declares, args = declare_arguments(m, name, 0)
+				bindings.append(apply_pattern(TemplateMethod, {
+					"class": class_name,
+					"type": VariantTypes[class_name],
+					"name": name,
+					"call": apply_pattern(TemplateInPlaceCall, {'native_method': native_method, 'args': args}),
+					"arg_declares": arg_declares,
+					"argc": str(len(m['arguments'])),
+					"return": 'JS_DupValue(ctx, this_val)',
+				}))
+				name = m['name'] + '_to'
+				arg_declares, args = declare_arguments(m, name, 1)
+				bindings.append(apply_pattern(TemplateMethod, {
+					"class": class_name,
+					"type": VariantTypes[class_name],
+					"name": name,
+					"call": apply_pattern(TemplateOutCall, {'native_method': native_method, 'args': args}),
+					"arg_declares": apply_pattern(TemplateOutDeclare, {'class': class_name, 'type': VariantTypes[class_name], 'name': name}) + arg_declares,
+					"argc": str(len(m['arguments']) + 1),
+					"return": 'JS_DupValue(ctx, argv[0])',
+				}))
+		return ''.join(bindings)
 		
 	def generate_constants(cls):
 		ConstTemplate = '\tbinder->get_builtin_binder().register_constant(${type}, "${name}", ${value});\n'
-		bindings = ''
+		bindings = []
 		for c in cls['constants']:
-			bindings += apply_pattern(ConstTemplate, {
+			bindings.append(apply_pattern(ConstTemplate, {
 				"name": c['name'],
 				"type": VariantTypes[class_name],
 				"value": c['value']
-			})
-		return bindings
+			}))
+		return ''.join(bindings)
 	
 	def genertate_operators(cls):
 		OperatorMap = {
@@ -620,10 +653,10 @@ ${target_declare}
 	);
 	'''
 		TemplateReturnValue = '${godot_type} ret = '
-		bindings = '''\
+		bindings = ['''\
 	Vector<JSValue> operators;
 	JSValue base_operators = JS_NewObject(ctx);
-'''
+''']
 		for o in cls['operators']:
 			op = o['native_method']
 			assign = o.get('assign')
@@ -636,6 +669,7 @@ ${target_declare}
 					
 				args = ''
 				target_declare = ''
+				arg_class = None
 				if argc > 1:
 					arg_class = o['arguments'][0]['type']
 					target_declare = apply_pattern(TargetDeclareTemplate, {
@@ -646,7 +680,11 @@ ${target_declare}
 					})
 					args = '*target'
 				
-				EvaluateOperator = ('*ptr = ' if assign else '') + 'Variant::evaluate(${op}, Variant(*ptr), Variant(${args}));'
+				# every builtin class implements the mapped operators natively for operands of its own type
+				if arg_class == class_name:
+					EvaluateOperator = ('*ptr = ' if assign else '') + '*ptr ' + OperatorMap[op] + ' ${args};'
+				else:
+					EvaluateOperator = ('*ptr = ' if assign else '') + 'Variant::evaluate(${op}, Variant(*ptr), Variant(${args}));'
 
 				if o['return'] == 'void':
 					CallTemplate = ''
@@ -664,7 +702,7 @@ ${target_declare}
 				else:
 					return_str = apply_pattern(GodotToJSTemplates[o['return']], {'arg': 'ret'})
 
-				bindings += apply_pattern(OperatorTemplate, {
+				bindings.append(apply_pattern(OperatorTemplate, {
 					'type': VariantTypes[class_name],
 					'class': class_name,
 					'js_op': js_op,
@@ -673,15 +711,15 @@ ${target_declare}
 					'target_declare': target_declare,
 					"return": return_str,
 					'argc': str(argc)
-				})
-		bindings += apply_pattern('''
+				}))
+		bindings.append(apply_pattern('''
 	operators.push_back(base_operators);
 	binder->get_builtin_binder().get_cross_type_operators(${type}, operators);
 	binder->get_builtin_binder().register_operators(${type}, operators);
-''', {'type': VariantTypes[class_name]})
-		return bindings
+''', {'type': VariantTypes[class_name]}))
+		return ''.join(bindings)
 	
-	TemplateBindDefine = '''
+	TemplateBindDefine = '''${accessors}
 static void bind_${class}_properties(JSContext *ctx) {
 	QuickJSBinder *binder = QuickJSBinder::get_context_binder(ctx);
 ${members}
@@ -692,9 +730,11 @@ ${methods}
 '''
 	class_name = cls['name']
 	property_declare = apply_pattern(TemplateDeclar, {"class": class_name})
+	accessors, members = generate_members(cls)
 	property_defines = apply_pattern(TemplateBindDefine, {
 		"class": class_name,
-		"members": generate_members(cls) if len(cls['properties']) else '',
+		"accessors": accessors,
+		"members": members,
 		"methods": generate_methods(cls),
 		"constants": generate_constants(cls),
 		"operators": genertate_operators(cls),
@@ -704,7 +744,7 @@ ${methods}
 
 
 def generate_class_bind_action(cls, constructor):
-	Template = '\tregister_builtin_class(${type}, "${class}", ${constructor}, ${argc});\n'
+	Template = '\tbuiltin_binder->register_builtin_class(${type}, "${class}", ${constructor}, ${argc});\n'
 	return apply_pattern(Template, {
 		'class': cls['name'],
 		'constructor': constructor,
@@ -714,11 +754,46 @@ def generate_class_bind_action(cls, constructor):
 
 
 
-def generate_builtin_bindings():
+def file_digest(path):
+	if not os.path.isfile(path):
+		return None
+	with open(path, 'rb') as f:
+		return hashlib.sha256(f.read()).hexdigest()
+
+def load_manifest(path):
+	try:
+		with open(path, 'r') as f:
+			return json.load(f)
+	except (IOError, OSError, ValueError):
+		return {}
+
+def save_manifest(path, manifest):
+	with open(path, 'w') as f:
+		json.dump(manifest, f, indent=2, sort_keys=True)
+
+def compute_inputs_digest():
+	hasher = hashlib.sha256()
+	for module in [__file__, code_template.__file__]:
+		with open(os.path.splitext(os.path.abspath(module))[0] + '.py', 'rb') as f:
+			hasher.update(f.read())
+	with open(API_FILE, 'rb') as f:
+		hasher.update(f.read())
+	return hasher.hexdigest()
+
+def write_if_changed(path, content):
+	content = content.encode('utf8')
+	digest = hashlib.sha256(content).hexdigest()
+	if file_digest(path) != digest:
+		with open(path, 'wb') as f:
+			f.write(content)
+	return digest
+
+def generate_class_shard(cls):
 	Template = '''\
+/* THIS FILE IS GENERATED DO NOT EDIT */
 #include "core/variant/variant.h"
-#include "quickjs_binder.h"
-#include "quickjs_builtin_binder.h"
+#include "../quickjs_binder.h"
+#include "../quickjs_builtin_binder.h"
 
 #ifndef inf
 #define inf INFINITY
@@ -726,35 +801,264 @@ def generate_builtin_bindings():
 
 ${declarations}
 
+void bind_${class}_builtin_class(QuickJSBuiltinBinder *builtin_binder, JSContext *ctx) {
+${bindings}}
+${definitions}
+'''
+	constructor_name, constructor_declare, consturctor = generate_constructor(cls)
+	property_declare, property_defines, property_bind = generate_property_bindings(cls)
+	output = apply_pattern(Template, {
+		'class': cls['name'],
+		'declarations': ''.join([constructor_declare, property_declare]),
+		'bindings': ''.join([generate_class_bind_action(cls, constructor_name), property_bind]),
+		'definitions': ''.join([consturctor, property_defines]),
+	})
+	return cls['name'], output
+
+def generate_class_shards(api):
+	jobs = min(len(api), multiprocessing.cpu_count())
+	if jobs > 1:
+		try:
+			pool = multiprocessing.Pool(jobs)
+			try:
+				return pool.map(generate_class_shard, api)
+			finally:
+				pool.close()
+				pool.join()
+		except Exception:
+			pass # fall back to generate in this process, generator errors are raised there again
+	return [generate_class_shard(cls) for cls in api]
+
+def generate_builtin_bindings():
+	inputs = compute_inputs_digest()
+	manifest = load_manifest(MANIFEST_FILE)
+	outputs = manifest.get('outputs', {})
+	if manifest.get('inputs') == inputs and outputs and all(file_digest(os.path.join(DIR, f)) == outputs[f] for f in outputs):
+		return False # up to date, keep the outputs and their mtime untouched
+	API = json.load(open(API_FILE, 'r'))
+
+	Template = '''\
+/* THIS FILE IS GENERATED DO NOT EDIT */
+#include "quickjs_builtin_binder.h"
+
+${declarations}
 void QuickJSBuiltinBinder::bind_builtin_classes_gen() {
+${pools}
+${bindings}}
+'''
+	TemplateDeclare = 'void bind_${class}_builtin_class(QuickJSBuiltinBinder *builtin_binder, JSContext *ctx);\n'
+	TemplateBind = '\tbind_${class}_builtin_class(this, ctx);\n'
+	TemplatePool = '\tsetup_handle_pool(${type}, sizeof(${class}));\n'
 
-${bindings}
+	if not os.path.isdir(SHARDS_DIR):
+		os.makedirs(SHARDS_DIR)
+	outputs = {}
+	declarations = []
+	bindings = []
+	# pools must be ready before any class binding creates a value
+	pools = [apply_pattern(TemplatePool, {'class': GodotTypeNames[cls['name']], 'type': VariantTypes[cls['name']]}) for cls in API]
+	for class_name, shard in generate_class_shards(API):
+		shard_file = os.path.join(os.path.basename(SHARDS_DIR), class_name + '.gen.cpp')
+		outputs[shard_file] = write_if_changed(os.path.join(DIR, shard_file), shard)
+		declarations.append(apply_pattern(TemplateDeclare, {'class': class_name}))
+		bindings.append(apply_pattern(TemplateBind, {'class': class_name}))
+	output = apply_pattern(Template, {
+		'declarations': ''.join(declarations),
+		'pools': ''.join(pools),
+		'bindings': ''.join(bindings),
+	})
+	outputs[os.path.basename(OUTPUT_FILE)] = write_if_changed(OUTPUT_FILE, output)
+
+	# remove shards of classes no longer in the API
+	for f in os.listdir(SHARDS_DIR):
+		if f.endswith('.gen.cpp') and os.path.join(os.path.basename(SHARDS_DIR), f) not in outputs:
+			os.remove(os.path.join(SHARDS_DIR, f))
+	changed = outputs != manifest.get('outputs')
+	save_manifest(MANIFEST_FILE, {'inputs': inputs, 'outputs': outputs})
+	return changed
+
+# Engine types the thunks convert directly: C++ type of the ptrcall slot, variant type, type check of the JavaScript value,
+# statement converting the JavaScript value and expression converting the returned value
+EngineThunkTypes = {
+	"bool": {
+		'native': 'bool',
+		'variant': 'Variant::BOOL',
+		'check': '(JS_IsBool(${arg}) || JS_IsNumber(${arg}))',
+		'from_js': 'bool ${name} = QuickJSBinder::js_to_bool(ctx, ${arg});',
+		'to_js': 'QuickJSBinder::to_js_bool(ctx, ${value})',
+	},
+	"int": {
+		'native': 'int64_t',
+		'variant': 'Variant::INT',
+		'check': '(JS_IsNumber(${arg}) || JS_IsBool(${arg}))',
+		'from_js': 'int64_t ${name} = QuickJSBinder::js_to_int64(ctx, ${arg});',
+		'to_js': 'JS_NewInt64(ctx, ${value})',
+	},
+	"float": {
+		'native': 'double',
+		'variant': 'Variant::FLOAT',
+		'check': '(JS_IsNumber(${arg}) || JS_IsBool(${arg}))',
+		'from_js': 'double ${name};\n\tJS_ToFloat64(ctx, &${name}, ${arg});',
+		'to_js': 'JS_NewFloat64(ctx, ${value})',
+	},
+	"String": {
+		'native': 'String',
+		'variant': 'Variant::STRING',
+		'check': 'JS_IsString(${arg})',
+		'from_js': 'String ${name} = QuickJSBinder::js_to_string(ctx, ${arg});',
+		'to_js': 'QuickJSBinder::to_js_string(ctx, ${value})',
+	},
+	"StringName": {
+		'native': 'StringName',
+		'variant': 'Variant::STRING_NAME',
+		'check': 'JS_IsString(${arg})',
+		'from_js': 'StringName ${name} = QuickJSBinder::js_to_string(ctx, ${arg});',
+		'to_js': 'QuickJSBinder::to_js_string(ctx, ${value})',
+	},
+	"NodePath": {
+		'native': 'NodePath',
+		'variant': 'Variant::NODE_PATH',
+		'check': 'JS_IsString(${arg})',
+		'from_js': 'NodePath ${name} = QuickJSBinder::js_to_string(ctx, ${arg});',
+		'to_js': 'QuickJSBinder::to_js_string(ctx, String(${value}))',
+	},
 }
+# Value types of the builtin binder, the packed arrays are left to the generic call as they are copied anyway
+for builtin_type in ["Vector2", "Rect2", "Color", "RID", "AABB", "Plane", "Quaternion", "Transform2D", "Vector3", "Basis", "Transform3D"]:
+	EngineThunkTypes[builtin_type] = {
+		'native': GodotTypeNames[builtin_type],
+		'variant': VariantTypes[builtin_type],
+		'check': 'QuickJSBinder::validate_type(ctx, ' + VariantTypes[builtin_type] + ', ${arg})',
+		'from_js': 'const ' + GodotTypeNames[builtin_type] + ' &${name} = ' + apply_pattern(JSToGodotTemplates[builtin_type], {'arg': '${arg}'}) + ';',
+		'to_js': apply_pattern(GodotToJSTemplates[builtin_type], {'arg': '${value}'}),
+	}
 
-${definitions}
-'''
-	
-	declarations = ''
-	definitions = ''
-	bindings = ''
+def engine_method_thunk_name(class_name, method):
+	return class_name + '_' + method['name'] + '_thunk'
+
+def can_generate_engine_method_thunk(method):
+	if len(method['arguments']) > MAX_THUNK_ARGUMENT_COUNT:
+		return False
+	if method['return'] != 'void' and method['return'] not in EngineThunkTypes:
+		return False # objects keep the generic call which handles their reference counting
+	return all(arg['type'] in EngineThunkTypes for arg in method['arguments'])
+
+def generate_engine_method_thunk(class_name, method):
+	Template = """
+static JSValue ${func}(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int method_id) {
+	Object *obj = QuickJSBinder::get_thunk_receiver(ctx, this_val);
+	if (obj == NULL${checks}) {
+		return QuickJSBinder::object_method(ctx, this_val, argc, argv, method_id);
+	}
+${arguments}	${return_declare}QuickJSBinder::get_context_binder(ctx)->get_godot_method(method_id)->ptrcall(obj, ${ptr_args}, ${return_ptr});
+	return ${return_value};
+}
+"""
+	checks = [' || argc < ' + str(len(method['arguments']))] if method['arguments'] else []
+	arguments = []
+	pointers = []
+	for i in range(len(method['arguments'])):
+		arg_type = EngineThunkTypes[method['arguments'][i]['type']]
+		js_arg = 'argv[' + str(i) + ']'
+		name = 'arg' + str(i)
+		checks.append(' || !' + apply_pattern(arg_type['check'], {'arg': js_arg}))
+		arguments.append('\t' + apply_pattern(arg_type['from_js'], {'arg': js_arg, 'name': name}) + '\n')
+		pointers.append('&' + name)
+	if pointers:
+		arguments.append('\tconst void *ptr_args[] = { ' + ', '.join(pointers) + ' };\n')
+	return_declare = ''
+	return_ptr = 'NULL'
+	return_value = 'JS_UNDEFINED'
+	if method['return'] != 'void':
+		return_type = EngineThunkTypes[method['return']]
+		return_declare = return_type['native'] + ' ret;\n\t'
+		return_ptr = '&ret'
+		return_value = apply_pattern(return_type['to_js'], {'value': 'ret'})
+	return apply_pattern(Template, {
+		'func': engine_method_thunk_name(class_name, method),
+		'checks': ''.join(checks),
+		'arguments': ''.join(arguments),
+		'ptr_args': 'ptr_args' if pointers else 'NULL',
+		'return_declare': return_declare,
+		'return_ptr': return_ptr,
+		'return_value': return_value,
+	})
+
+def generate_engine_method_thunk_entry(class_name, method):
+	Template = '\t{ "${class}", "${method}", ${func}, ${has_return}, ${return_type}, ${argc}, { ${arguments} } },\n'
+	TemplateNoArguments = '\t{ "${class}", "${method}", ${func}, ${has_return}, ${return_type}, 0, {} },\n'
+	has_return = method['return'] != 'void'
+	return apply_pattern(Template if method['arguments'] else TemplateNoArguments, {
+		'class': class_name,
+		'method': method['name'],
+		'func': engine_method_thunk_name(class_name, method),
+		'has_return': 'true' if has_return else 'false',
+		'return_type': EngineThunkTypes[method['return']]['variant'] if has_return else 'Variant::NIL',
+		'argc': str(len(method['arguments'])),
+		'arguments': ', '.join([EngineThunkTypes[arg['type']]['variant'] for arg in method['arguments']]),
+	})
+
+def generate_engine_bindings():
+	hasher = hashlib.sha256()
+	for module in [__file__, code_template.__file__]:
+		with open(os.path.splitext(os.path.abspath(module))[0] + '.py', 'rb') as f:
+			hasher.update(f.read())
+	if os.path.isfile(ENGINE_API_FILE):
+		with open(ENGINE_API_FILE, 'rb') as f:
+			hasher.update(f.read())
+	inputs = hasher.hexdigest()
+	manifest = load_manifest(ENGINE_MANIFEST_FILE)
+	if manifest.get('inputs') == inputs and manifest.get('output') == file_digest(ENGINE_OUTPUT_FILE):
+		return False # up to date, keep the output and its mtime untouched
+	API = json.load(open(ENGINE_API_FILE, 'r')) if os.path.isfile(ENGINE_API_FILE) else []
+
+	Template = """\
+/* THIS FILE IS GENERATED DO NOT EDIT */
+#include "quickjs_binder.h"
+#include "quickjs_builtin_binder.h"
+${thunks}
+// Sorted by class and method names for the binary search below
+static const QuickJSBinder::EngineMethodThunk engine_method_thunks[] = {
+${entries}	{ NULL, NULL, NULL, false, Variant::NIL, 0, {} },
+};
+
+const QuickJSBinder::EngineMethodThunk *QuickJSBinder::find_engine_method_thunk(const char *p_class, const char *p_method) {
+	int low = 0;
+	int high = ${count} - 1;
+	while (low <= high) {
+		const int middle = (low + high) / 2;
+		const EngineMethodThunk &thunk = engine_method_thunks[middle];
+		int cmp = strcmp(thunk.class_name, p_class);
+		if (cmp == 0) {
+			cmp = strcmp(thunk.method, p_method);
+		}
+		if (cmp == 0) {
+			return &thunk;
+		} else if (cmp < 0) {
+			low = middle + 1;
+		} else {
+			high = middle - 1;
+		}
+	}
+	return NULL;
+}
+"""
+	methods = []
 	for cls in API:
-		constructor_name, constructor_declare, consturctor = generate_constructor(cls)
-		declarations += constructor_declare
-		definitions += consturctor
-		bindings += generate_class_bind_action(cls, constructor_name)
-		
-		property_declare, property_defines, property_bind= generate_property_bindings(cls)
-		declarations += property_declare
-		definitions += property_defines
-		bindings += property_bind
-	
+		for method in cls['methods']:
+			if can_generate_engine_method_thunk(method):
+				methods.append((cls['name'], method))
+	# strcmp order, the names are ASCII
+	methods.sort(key=lambda m: (m[0].encode('utf8'), m[1]['name'].encode('utf8')))
 	output = apply_pattern(Template, {
-		'declarations': declarations,
-		'bindings': bindings,
-		'definitions': definitions,
+		'thunks': ''.join([generate_engine_method_thunk(class_name, method) for class_name, method in methods]),
+		'entries': ''.join([generate_engine_method_thunk_entry(class_name, method) for class_name, method in methods]),
+		'count': str(len(methods)),
 	})
-	file = open(OUTPUT_FILE, 'w')
-	file.write(output)
+	digest = write_if_changed(ENGINE_OUTPUT_FILE, output)
+	changed = digest != manifest.get('output')
+	save_manifest(ENGINE_MANIFEST_FILE, {'inputs': inputs, 'output': digest})
+	return changed
 
 if __name__ == "__main__":
 	generate_builtin_bindings()
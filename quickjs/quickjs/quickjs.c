@@ -288,6 +288,7 @@ struct JSRuntime {
     JSModuleNormalizeFunc *module_normalize_func;
     JSModuleLoaderFunc *module_loader_func;
     void *module_loader_opaque;
+    JSModulePrefetchFunc *module_prefetch_func;
 
     BOOL can_block : 8; /* TRUE if Atomics.wait can block */
     /* used to allocate, free and clone SharedArrayBuffers */
@@ -1818,6 +1819,16 @@ BOOL JS_IsJobPending(JSRuntime *rt)
     return !list_empty(&rt->job_list);
 }
 
+int JS_GetPendingJobCount(JSRuntime *rt)
+{
+    struct list_head *el;
+    int count = 0;
+    list_for_each(el, &rt->job_list) {
+        count++;
+    }
+    return count;
+}
+
 /* return < 0 if exception, 0 if no job pending, 1 if a job was
    executed successfully. the context of the job is stored in '*pctx' */
 int JS_ExecutePendingJob(JSRuntime *rt, JSContext **pctx)
@@ -4907,6 +4918,47 @@ JSValue JS_NewArray(JSContext *ctx)
                                  JS_CLASS_ARRAY);
 }
 
+/* Create a fast array of 'len' elements from 'tab'. 'tab' must be
+   allocated with js_malloc(). The array takes ownership of both the
+   buffer and the values, which are freed on error. */
+JSValue JS_NewArrayFrom(JSContext *ctx, uint32_t len, JSValue *tab)
+{
+    JSValue obj;
+    JSObject *p;
+    uint32_t i;
+
+    if (len > INT32_MAX) {
+        JS_ThrowRangeError(ctx, "invalid array length");
+        goto fail;
+    }
+    obj = JS_NewArray(ctx);
+    if (JS_IsException(obj))
+        goto fail;
+    if (len == 0) {
+        js_free(ctx, tab);
+        return obj;
+    }
+    p = JS_VALUE_GET_OBJ(obj);
+    p->u.array.u.values = tab;
+    p->u.array.u1.size = len;
+    p->u.array.count = len;
+    p->prop[0].u.value = JS_NewInt32(ctx, len);
+    return obj;
+ fail:
+    for(i = 0; i < len; i++)
+        JS_FreeValue(ctx, tab[i]);
+    js_free(ctx, tab);
+    return JS_EXCEPTION;
+}
+
+/* Access the internal value buffer of a fast array. The buffer is only
+   valid until the array is modified. */
+JS_BOOL JS_GetFastArray(JSContext *ctx, JSValueConst obj,
+                        JSValue **arrpp, uint32_t *countp)
+{
+    return js_get_fast_array(ctx, obj, arrpp, countp);
+}
+
 JSValue JS_NewObject(JSContext *ctx)
 {
     /* inline JS_NewObjectClass(ctx, JS_CLASS_OBJECT); */
@@ -27125,6 +27177,11 @@ void JS_SetModuleLoaderFunc(JSRuntime *rt,
     rt->module_loader_opaque = opaque;
 }
 
+void JS_SetModulePrefetchFunc(JSRuntime *rt, JSModulePrefetchFunc *module_prefetch)
+{
+    rt->module_prefetch_func = module_prefetch;
+}
+
 /* default module filename normalizer */
 static char *js_default_module_normalize_name(JSContext *ctx,
                                               const char *base_name,
@@ -28020,6 +28077,20 @@ JSAtom JS_GetModuleName(JSContext *ctx, JSModuleDef *m)
     return JS_DupAtom(ctx, m->module_name);
 }
 
+/* Number of modules imported by 'm' */
+int JS_GetModuleRequestCount(JSContext *ctx, JSModuleDef *m)
+{
+    return m->req_module_entries_count;
+}
+
+/* Specifier of the 'idx'th module imported by 'm' as written in the source */
+JSAtom JS_GetModuleRequest(JSContext *ctx, JSModuleDef *m, int idx)
+{
+    if (idx < 0 || idx >= m->req_module_entries_count)
+        return JS_ATOM_NULL;
+    return JS_DupAtom(ctx, m->req_module_entries[idx].module_name);
+}
+
 JSValue JS_GetImportMeta(JSContext *ctx, JSModuleDef *m)
 {
     JSValue obj;
@@ -28129,11 +28200,65 @@ static JSValue js_dynamic_import_job(JSContext *ctx,
     return JS_UNDEFINED;
 }
 
+static JSValue js_dynamic_import_resume(JSContext *ctx, JSValueConst this_val,
+                                        int argc, JSValueConst *argv,
+                                        int magic, JSValue *func_data)
+{
+    JS_EnqueueJob(ctx, js_dynamic_import_job, 4, (JSValueConst *)func_data);
+    return JS_UNDEFINED;
+}
+
+/* Let the host load the module before the import job runs. Return
+   TRUE if the host deferred the import, FALSE if the job must be
+   enqueued now and -1 in case of exception. */
+static int js_dynamic_import_prefetch(JSContext *ctx, JSValueConst *args)
+{
+    JSRuntime *rt = ctx->rt;
+    const char *basename, *specifier;
+    char *cname;
+    JSValue resume_func;
+    int ret;
+
+    if (!rt->module_prefetch_func || !JS_IsString(args[2]))
+        return FALSE;
+    basename = JS_ToCString(ctx, args[2]);
+    if (!basename)
+        return -1;
+    specifier = JS_ToCString(ctx, args[3]);
+    if (!specifier) {
+        JS_FreeCString(ctx, basename);
+        return -1;
+    }
+    if (!rt->module_normalize_func) {
+        cname = js_default_module_normalize_name(ctx, basename, specifier);
+    } else {
+        cname = rt->module_normalize_func(ctx, basename, specifier,
+                                          rt->module_loader_opaque);
+    }
+    JS_FreeCString(ctx, basename);
+    JS_FreeCString(ctx, specifier);
+    if (!cname)
+        return -1;
+
+    resume_func = JS_NewCFunctionData(ctx, js_dynamic_import_resume, 0, 0,
+                                      4, (JSValue *)args);
+    if (JS_IsException(resume_func)) {
+        js_free(ctx, cname);
+        return -1;
+    }
+    ret = rt->module_prefetch_func(ctx, cname, resume_func,
+                                   rt->module_loader_opaque);
+    JS_FreeValue(ctx, resume_func);
+    js_free(ctx, cname);
+    return ret;
+}
+
 static JSValue js_dynamic_import(JSContext *ctx, JSValueConst specifier)
 {
     JSAtom basename;
     JSValue promise, resolving_funcs[2], basename_val;
     JSValueConst args[4];
+    int ret;
 
     basename = JS_GetScriptOrModuleName(ctx, 0);
     if (basename == JS_ATOM_NULL)
@@ -28155,7 +28280,15 @@ static JSValue js_dynamic_import(JSContext *ctx, JSValueConst specifier)
     args[2] = basename_val;
     args[3] = specifier;
     
-    JS_EnqueueJob(ctx, js_dynamic_import_job, 4, args);
+    ret = js_dynamic_import_prefetch(ctx, args);
+    if (ret < 0) {
+        JSValue err = JS_GetException(ctx);
+        JS_FreeValue(ctx, JS_Call(ctx, resolving_funcs[1], JS_UNDEFINED,
+                                  1, (JSValueConst *)&err));
+        JS_FreeValue(ctx, err);
+    } else if (!ret) {
+        JS_EnqueueJob(ctx, js_dynamic_import_job, 4, args);
+    }
 
     JS_FreeValue(ctx, basename_val);
     JS_FreeValue(ctx, resolving_funcs[0]);
@@ -50905,6 +51038,50 @@ void JS_DetachArrayBuffer(JSContext *ctx, JSValueConst obj)
     }
 }
 
+/* Detach the ArrayBuffer 'obj' without freeing its data and return the
+   data, its size and its free function. '*pfree_func' is set to NULL if
+   the data was allocated with the runtime allocator. Return NULL with an
+   exception if the buffer cannot be transferred. */
+/* return -1 with an exception if JS_TransferArrayBuffer() would fail */
+int JS_CheckTransferableArrayBuffer(JSContext *ctx, JSValueConst obj)
+{
+    JSArrayBuffer *abuf = JS_GetOpaque(obj, JS_CLASS_ARRAY_BUFFER);
+
+    if (!abuf) {
+        JS_ThrowTypeErrorInvalidClass(ctx, JS_CLASS_ARRAY_BUFFER);
+        return -1;
+    }
+    if (abuf->detached) {
+        JS_ThrowTypeErrorDetachedArrayBuffer(ctx);
+        return -1;
+    }
+    if (!abuf->free_func) {
+        JS_ThrowTypeError(ctx, "the ArrayBuffer does not own its data");
+        return -1;
+    }
+    return 0;
+}
+
+uint8_t *JS_TransferArrayBuffer(JSContext *ctx, size_t *psize, JSValueConst obj,
+                                JSFreeArrayBufferDataFunc **pfree_func,
+                                void **popaque)
+{
+    JSArrayBuffer *abuf;
+    uint8_t *data;
+
+    if (JS_CheckTransferableArrayBuffer(ctx, obj))
+        return NULL;
+    abuf = JS_GetOpaque(obj, JS_CLASS_ARRAY_BUFFER);
+    data = abuf->data;
+    *psize = abuf->byte_length;
+    *pfree_func = (abuf->free_func == js_array_buffer_free) ? NULL : abuf->free_func;
+    *popaque = abuf->opaque;
+    /* the data now belongs to the caller */
+    abuf->free_func = NULL;
+    JS_DetachArrayBuffer(ctx, obj);
+    return data;
+}
+
 /* get an ArrayBuffer or SharedArrayBuffer */
 static JSArrayBuffer *js_get_array_buffer(JSContext *ctx, JSValueConst obj)
 {
@@ -53684,6 +53861,13 @@ int JS_GetRefCount(JSValue v) {
     return 0;
 }
 
+JS_BOOL JS_IsTypedArray(JSValueConst val) {
+    if (JS_VALUE_GET_TAG(val) != JS_TAG_OBJECT)
+        return FALSE;
+    JSClassID class_id = JS_VALUE_GET_OBJ(val)->class_id;
+    return class_id >= JS_CLASS_UINT8C_ARRAY && class_id <= JS_CLASS_FLOAT64_ARRAY;
+}
+
 JS_BOOL JS_IsArrayBuffer(JSValueConst val) {
     JSObject *p;
     if (JS_VALUE_GET_TAG(val) == JS_TAG_OBJECT) {
@@ -53694,6 +53878,16 @@ JS_BOOL JS_IsArrayBuffer(JSValueConst val) {
     }
 }
 
+JS_BOOL JS_IsSharedArrayBuffer(JSValueConst val) {
+    JSObject *p;
+    if (JS_VALUE_GET_TAG(val) == JS_TAG_OBJECT) {
+        p = JS_VALUE_GET_OBJ(val);
+        return p->class_id == JS_CLASS_SHARED_ARRAY_BUFFER;
+    } else {
+        return FALSE;
+    }
+}
+
 JS_BOOL JS_IsDataView(JSValueConst val) {
     JSObject *p;
     if (JS_VALUE_GET_TAG(val) == JS_TAG_OBJECT) {
@@ -714,6 +714,9 @@ JS_BOOL JS_IsConstructor(JSContext* ctx, JSValueConst val);
 JS_BOOL JS_SetConstructorBit(JSContext *ctx, JSValueConst func_obj, JS_BOOL val);
 
 JSValue JS_NewArray(JSContext *ctx);
+JSValue JS_NewArrayFrom(JSContext *ctx, uint32_t len, JSValue *tab);
+JS_BOOL JS_GetFastArray(JSContext *ctx, JSValueConst obj,
+                        JSValue **arrpp, uint32_t *countp);
 int JS_IsArray(JSContext *ctx, JSValueConst val);
 
 JSValue JS_GetPropertyInternal(JSContext *ctx, JSValueConst obj,
@@ -811,6 +814,10 @@ JSValue JS_NewArrayBuffer(JSContext *ctx, uint8_t *buf, size_t len,
 JSValue JS_NewArrayBufferCopy(JSContext *ctx, const uint8_t *buf, size_t len);
 void JS_DetachArrayBuffer(JSContext *ctx, JSValueConst obj);
 uint8_t *JS_GetArrayBuffer(JSContext *ctx, size_t *psize, JSValueConst obj);
+int JS_CheckTransferableArrayBuffer(JSContext *ctx, JSValueConst obj);
+uint8_t *JS_TransferArrayBuffer(JSContext *ctx, size_t *psize, JSValueConst obj,
+                                JSFreeArrayBufferDataFunc **pfree_func,
+                                void **popaque);
 JSValue JS_GetTypedArrayBuffer(JSContext *ctx, JSValueConst obj,
                                size_t *pbyte_offset,
                                size_t *pbyte_length,
@@ -855,9 +862,19 @@ typedef JSModuleDef *JSModuleLoaderFunc(JSContext *ctx,
 void JS_SetModuleLoaderFunc(JSRuntime *rt,
                             JSModuleNormalizeFunc *module_normalize,
                             JSModuleLoaderFunc *module_loader, void *opaque);
+/* Called by import() with the normalized module name before the module
+   is loaded. Return TRUE to defer the import, the host must then call
+   'resume_func' (after duplicating it) once the module can be loaded
+   without blocking. Return FALSE to import the module immediately and -1
+   to reject the import with the pending exception. */
+typedef int JSModulePrefetchFunc(JSContext *ctx, const char *module_name,
+                                 JSValueConst resume_func, void *opaque);
+void JS_SetModulePrefetchFunc(JSRuntime *rt, JSModulePrefetchFunc *module_prefetch);
 /* return the import.meta object of a module */
 JSValue JS_GetImportMeta(JSContext *ctx, JSModuleDef *m);
 JSAtom JS_GetModuleName(JSContext *ctx, JSModuleDef *m);
+int JS_GetModuleRequestCount(JSContext *ctx, JSModuleDef *m);
+JSAtom JS_GetModuleRequest(JSContext *ctx, JSModuleDef *m, int idx);
 
 /* JS Job support */
 
@@ -865,6 +882,7 @@ typedef JSValue JSJobFunc(JSContext *ctx, int argc, JSValueConst *argv);
 int JS_EnqueueJob(JSContext *ctx, JSJobFunc *job_func, int argc, JSValueConst *argv);
 
 JS_BOOL JS_IsJobPending(JSRuntime *rt);
+int JS_GetPendingJobCount(JSRuntime *rt);
 int JS_ExecutePendingJob(JSRuntime *rt, JSContext **pctx);
 
 /* Object Writer/Reader (currently only used to handle precompiled code) */
@@ -1038,6 +1056,8 @@ JS_BOOL JS_IsPureCFunction(JSContext *ctx, JSValue val);
 const JSMallocState *JS_GetMollocState(JSRuntime *rt);
 int JS_GetRefCount(JSValue val);
 JS_BOOL JS_IsArrayBuffer(JSValueConst val);
+JS_BOOL JS_IsTypedArray(JSValueConst val);
+JS_BOOL JS_IsSharedArrayBuffer(JSValueConst val);
 JS_BOOL JS_IsDataView(JSValueConst val);
 
 #undef js_unlikely
@@ -0,0 +1,141 @@
+#include "quickjs_aot_compiler.h"
+#include "../ecmascript.h"
+#include "core/io/dir_access.h"
+#include "core/io/file_access.h"
+#include "core/os/os.h"
+#include "core/os/thread.h"
+#include "quickjs_binder.h"
+
+bool QuickJSAOTCompiler::is_compilable(const String &p_path) {
+	String extension = p_path.get_extension();
+	return extension == EXT_JSMODULE || extension == EXT_JSCLASS;
+}
+
+void QuickJSAOTCompiler::find_scripts(const String &p_dir, Vector<String> &r_files) {
+	DirAccessRef da = DirAccess::open(p_dir);
+	ERR_FAIL_COND(!da);
+	da->list_dir_begin();
+	for (String name = da->get_next(); !name.is_empty(); name = da->get_next()) {
+		// Skips the project data folder and other hidden folders
+		if (name.begins_with(".")) continue;
+		String path = p_dir.plus_file(name);
+		if (da->current_is_dir()) {
+			find_scripts(path, r_files);
+		} else if (is_compilable(path)) {
+			r_files.push_back(path);
+		}
+	}
+	da->list_dir_end();
+}
+
+String QuickJSAOTCompiler::resolve_dependency(const String &p_path, const String &p_specifier) {
+	// Same rule as the default module name normalizer of QuickJS
+	String file = p_specifier.begins_with(".") ? p_path.get_base_dir().plus_file(p_specifier).simplify_path() : p_specifier;
+	String resolved = QuickJSBinder::resolve_module_file(file);
+	return resolved.is_empty() ? file : resolved;
+}
+
+void QuickJSAOTCompiler::compile_file(JSContext *ctx, const String &p_path, Result &r_result) {
+	Error err;
+	String code = FileAccess::get_file_as_string(p_path, &err);
+	if (err != OK) {
+		r_result.error = err;
+		r_result.message = "Cannot read the script file '" + p_path + "'.";
+		return;
+	}
+
+	CharString utf8_code = code.utf8();
+	CharString utf8_path = p_path.utf8();
+	JSValue module = JS_Eval(ctx, utf8_code.get_data(), utf8_code.length(), utf8_path.get_data(), JS_EVAL_TYPE_MODULE | JS_EVAL_FLAG_COMPILE_ONLY);
+	if (JS_IsException(module)) {
+		JSValue e = JS_GetException(ctx);
+		ECMAScriptScriptError script_err;
+		QuickJSBinder::dump_exception(ctx, e, &script_err);
+		JS_FreeValue(ctx, e);
+		r_result.error = ERR_PARSE_ERROR;
+		r_result.message = vformat("%s:%d - %s", p_path, script_err.line, script_err.message);
+		return;
+	}
+
+	// Imports are resolved once every file is compiled
+	JSModuleDef *m = static_cast<JSModuleDef *>(JS_VALUE_GET_PTR(module));
+	int count = JS_GetModuleRequestCount(ctx, m);
+	for (int i = 0; i < count; i++) {
+		JSAtom specifier = JS_GetModuleRequest(ctx, m, i);
+		if (const char *str = JS_AtomToCString(ctx, specifier)) {
+			String dependency;
+			dependency.parse_utf8(str);
+			r_result.dependencies.push_back(dependency);
+			JS_FreeCString(ctx, str);
+		}
+		JS_FreeAtom(ctx, specifier);
+	}
+
+	size_t size;
+	if (uint8_t *buf = JS_WriteObject(ctx, &size, module, JS_WRITE_OBJ_BYTECODE | JS_WRITE_OBJ_REFERENCE | JS_WRITE_OBJ_SAB)) {
+		r_result.bytecode.resize(size);
+		memcpy(r_result.bytecode.ptrw(), buf, size);
+		js_free(ctx, buf);
+		r_result.error = OK;
+	} else {
+		r_result.message = "Cannot write the bytecode of '" + p_path + "'.";
+	}
+	JS_FreeValue(ctx, module);
+}
+
+void QuickJSAOTCompiler::compile_thread(void *p_job) {
+	Job *job = static_cast<Job *>(p_job);
+	JSRuntime *rt = JS_NewRuntime();
+	JSContext *ctx = JS_NewContext(rt);
+	for (uint32_t i = job->next_file.postincrement(); i < uint32_t(job->files.size()); i = job->next_file.postincrement()) {
+		compile_file(ctx, job->files[i], job->results_ptr[i]);
+	}
+	JS_FreeContext(ctx);
+	JS_FreeRuntime(rt);
+}
+
+void QuickJSAOTCompiler::compile(const Vector<String> &p_files, int p_thread_count) {
+	Job job;
+	job.files = p_files;
+	job.results.resize(p_files.size());
+	job.results_ptr = job.results.ptrw();
+	job.next_file.set(0);
+
+	int thread_count = p_thread_count > 0 ? p_thread_count : OS::get_singleton()->get_processor_count();
+	thread_count = CLAMP(thread_count, 1, MAX(p_files.size(), 1));
+	Thread *threads = memnew_arr(Thread, thread_count);
+	for (int i = 0; i < thread_count; i++) {
+		threads[i].start(compile_thread, &job);
+	}
+	for (int i = 0; i < thread_count; i++) {
+		threads[i].wait_to_finish();
+	}
+	memdelete_arr(threads);
+
+	for (int i = 0; i < p_files.size(); i++) {
+		Result &result = job.results.write[i];
+		for (int j = 0; j < result.dependencies.size(); j++) {
+			result.dependencies.write[j] = resolve_dependency(p_files[i], result.dependencies[j]);
+		}
+		results.set(p_files[i], result);
+	}
+}
+
+String QuickJSAOTCompiler::get_dependency_manifest() const {
+	// Written by hand so the manifest does not depend on the JSON API of the engine
+	String manifest = "{";
+	const String *key = NULL;
+	bool first = true;
+	while ((key = results.next(key))) {
+		const Result &result = results.get(*key);
+		manifest += first ? "\n" : ",\n";
+		manifest += "\t\"" + key->json_escape() + "\": [";
+		for (int i = 0; i < result.dependencies.size(); i++) {
+			manifest += (i ? ", \"" : "\"") + result.dependencies[i].json_escape() + "\"";
+		}
+		manifest += "]";
+		first = false;
+	}
+	manifest += "\n}\n";
+	return manifest;
+}
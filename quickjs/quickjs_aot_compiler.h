@@ -0,0 +1,48 @@
+#ifndef QUICKJS_AOT_COMPILER_H
+#define QUICKJS_AOT_COMPILER_H
+
+#include "core/string/ustring.h"
+#include "core/templates/hash_map.h"
+#include "core/templates/safe_refcount.h"
+#include "quickjs/quickjs.h"
+
+// Import graph of the compiled modules, shipped with the exported project
+#define AOT_DEPENDENCY_MANIFEST "res://.godot/ecmascript_dependencies.json"
+
+// Compiles all the script modules of a project to bytecode ahead of time.
+// Files are compiled in parallel, every thread owns a QuickJS runtime.
+class QuickJSAOTCompiler {
+public:
+	struct Result {
+		Error error = FAILED;
+		String message;
+		Vector<uint8_t> bytecode;
+		Vector<String> dependencies;
+	};
+
+private:
+	struct Job {
+		Vector<String> files;
+		Vector<Result> results;
+		// Taken once before the threads start, each thread writes its own elements
+		Result *results_ptr = NULL;
+		SafeNumeric<uint32_t> next_file;
+	};
+
+	HashMap<String, Result> results;
+
+	static void compile_thread(void *p_job);
+	static void compile_file(JSContext *ctx, const String &p_path, Result &r_result);
+	static String resolve_dependency(const String &p_path, const String &p_specifier);
+
+public:
+	static bool is_compilable(const String &p_path);
+	static void find_scripts(const String &p_dir, Vector<String> &r_files);
+
+	void compile(const Vector<String> &p_files, int p_thread_count = 0);
+	_FORCE_INLINE_ const Result *get_result(const String &p_path) const { return results.getptr(p_path); }
+	String get_dependency_manifest() const;
+	void clear() { results.clear(); }
+};
+
+#endif // QUICKJS_AOT_COMPILER_H
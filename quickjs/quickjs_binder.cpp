@@ -1,7 +1,9 @@
 #include "quickjs_binder.h"
 #include "../ecmascript.h"
+#include "../ecmascript_bytecode_cache.h"
 #include "../ecmascript_instance.h"
 #include "../ecmascript_language.h"
+#include "../ecmascript_module_index.h"
 #include "core/core_bind.h"
 #include "core/config/engine.h"
 #include "core/io/json.h"
@@ -11,9 +13,13 @@
 #include "core/core_constants.h"
 #include "core/config/project_settings.h"
 #include "core/object/object.h"
+#include "core/variant/variant_internal.h"
 #include "modules/visual_script/visual_script_builtin_funcs.h"
 #include "quickjs_binder.h"
+#include "quickjs_shared_buffer.h"
+#include "quickjs_transferred_buffer.h"
 #include "quickjs_worker.h"
+#include "quickjs_worker_pool.h"
 #ifdef TOOLS_ENABLED
 #include "editor/editor_settings.h"
 #endif
@@ -22,6 +28,9 @@ SafeNumeric<uint32_t> QuickJSBinder::global_context_id;
 SafeNumeric<uint64_t> QuickJSBinder::global_transfer_id;
 
 HashMap<uint64_t, Variant> QuickJSBinder::transfer_deopot;
+Vector<uint8_t> QuickJSBinder::binding_script_bytecode;
+SafeFlag QuickJSBinder::binding_script_compiled;
+Mutex QuickJSBinder::binding_script_mutex;
 Map<String, const char *> QuickJSBinder::class_remap;
 List<String> compiling_modules;
 
@@ -31,24 +40,41 @@ const GDNativeInstanceBindingCallbacks QuickJSBinder::_instance_binding_callback
 	&QuickJSBinder::_instance_binding_reference_callback
 };
 
+// Arguments of an engine call, taken from the argument stack of the binder.
+// Nested calls take the slots above the ones of their caller, the heap is only used when the stack is full.
 struct GodotMethodArguments {
 	Variant *arguments;
 	const Variant **ptr;
-	GodotMethodArguments(int argc) {
-		if (argc) {
+	QuickJSBinder *binder;
+	int argc;
+	bool on_heap;
+	GodotMethodArguments(QuickJSBinder *p_binder, int p_argc) {
+		binder = p_binder;
+		argc = p_argc;
+		on_heap = binder->argument_stack_top + argc > QuickJSBinder::ARGUMENT_STACK_SIZE;
+		if (likely(!on_heap)) {
+			arguments = binder->argument_stack + binder->argument_stack_top;
+			ptr = binder->argument_pointers + binder->argument_stack_top;
+			binder->argument_stack_top += argc;
+		} else {
 			arguments = memnew_arr(Variant, argc);
 			ptr = memnew_arr(const Variant *, argc);
 			for (int i = 0; i < argc; i++) {
 				ptr[i] = &arguments[i];
 			}
-		} else {
-			arguments = NULL;
-			ptr = NULL;
 		}
 	}
 	~GodotMethodArguments() {
-		if (ptr) memdelete_arr(ptr);
-		if (arguments) memdelete_arr(arguments);
+		if (likely(!on_heap)) {
+			// Releases the referenced values right away
+			for (int i = 0; i < argc; i++) {
+				arguments[i] = Variant();
+			}
+			binder->argument_stack_top -= argc;
+		} else {
+			memdelete_arr(ptr);
+			memdelete_arr(arguments);
+		}
 	}
 };
 
@@ -188,6 +214,17 @@ void QuickJSBinder::add_global_properties() {
 	// globalThis.cancelAnimationFrame
 	JSValue js_func_cancelAnimationFrame = JS_NewCFunction(ctx, global_cancel_animation_frame, "cancelAnimationFrame", 1);
 	JS_DefinePropertyValueStr(ctx, global_object, "cancelAnimationFrame", js_func_cancelAnimationFrame, PROP_DEF_DEFAULT);
+	// globalThis.requestIdleCallback
+	JSValue js_func_requestIdleCallback = JS_NewCFunction(ctx, global_request_idle_callback, "requestIdleCallback", 2);
+	JS_DefinePropertyValueStr(ctx, global_object, "requestIdleCallback", js_func_requestIdleCallback, PROP_DEF_DEFAULT);
+	// globalThis.cancelIdleCallback
+	JSValue js_func_cancelIdleCallback = JS_NewCFunction(ctx, global_cancel_idle_callback, "cancelIdleCallback", 1);
+	JS_DefinePropertyValueStr(ctx, global_object, "cancelIdleCallback", js_func_cancelIdleCallback, PROP_DEF_DEFAULT);
+	// globalThis.scheduler.postTask
+	JSValue scheduler = JS_NewObject(ctx);
+	JSValue js_func_postTask = JS_NewCFunction(ctx, scheduler_post_task, "postTask", 2);
+	JS_DefinePropertyValueStr(ctx, scheduler, "postTask", js_func_postTask, PROP_DEF_DEFAULT);
+	JS_DefinePropertyValueStr(ctx, global_object, "scheduler", scheduler, PROP_DEF_DEFAULT);
 }
 
 JSValue QuickJSBinder::object_method(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int method_id) {
@@ -204,13 +241,43 @@ JSValue QuickJSBinder::object_method(JSContext *ctx, JSValueConst this_val, int
 		argc = MIN(argc, mb->get_argument_count());
 	}
 
-	GodotMethodArguments args(argc);
+	GodotMethodArguments args(binder, argc);
 	for (int i = 0; i < argc; ++i) {
 		args.arguments[i] = var_to_variant(ctx, argv[i]);
 	}
 
+	ECMAScriptProfiler::Function *profile = NULL;
+	if (unlikely(binder->profiler.is_profiling())) {
+		profile = binder->get_godot_method_profile(method_id);
+		binder->profiler.enter(profile);
+	}
 	Callable::CallError call_err;
-	Variant ret_val = mb->call(obj, args.ptr, argc, call_err);
+	Variant ret_val;
+	const PtrcallSignature &signature = binder->godot_ptrcall_signatures[method_id];
+	if (signature.enabled && prepare_ptrcall_arguments(signature, args.arguments, argc)) {
+		// The arguments already have the exact types so the method reads them in place, Variant parameters take the Variant itself
+		const void *ptr_args[MAX_ARGUMENT_COUNT];
+		for (int i = 0; i < argc; ++i) {
+			if (signature.argument_types[i] == Variant::NIL) {
+				ptr_args[i] = &args.arguments[i];
+			} else {
+				ptr_args[i] = VariantInternal::get_opaque_pointer(&args.arguments[i]);
+			}
+		}
+		if (!signature.has_return) {
+			mb->ptrcall(obj, ptr_args, NULL);
+		} else if (signature.return_type == Variant::NIL) {
+			mb->ptrcall(obj, ptr_args, &ret_val);
+		} else {
+			VariantInternal::initialize(&ret_val, signature.return_type);
+			mb->ptrcall(obj, ptr_args, VariantInternal::get_opaque_pointer(&ret_val));
+		}
+	} else {
+		ret_val = mb->call(obj, args.ptr, argc, call_err);
+	}
+	if (profile) {
+		binder->profiler.exit();
+	}
 	JSValue ret = variant_to_var(ctx, ret_val);
 #ifdef DEBUG_METHODS_ENABLED
 	String err_message;
@@ -260,7 +327,7 @@ JSValue QuickJSBinder::object_indexed_property(JSContext *ctx, JSValue this_val,
 	const ClassDB::PropertySetGet *prop = binder->godot_object_indexed_properties[property_id];
 	MethodBind *mb = is_setter ? prop->_setptr : prop->_getptr;
 
-	GodotMethodArguments args(2);
+	GodotMethodArguments args(binder, 2);
 	args.arguments[0] = prop->index;
 	if (is_setter) {
 		args.arguments[1] = var_to_variant(ctx, argv[0]);
@@ -285,6 +352,12 @@ JSValue QuickJSBinder::variant_to_var(JSContext *ctx, const Variant p_var) {
 		case Variant::OBJECT: {
 			Object *obj = p_var;
 			if (obj == NULL) return JS_NULL;
+			if (QuickJSTransferredBuffer *buffer = Object::cast_to<QuickJSTransferredBuffer>(obj)) {
+				return buffer->adopt(ctx);
+			}
+			if (QuickJSSharedBuffer *buffer = Object::cast_to<QuickJSSharedBuffer>(obj)) {
+				return buffer->wrap(ctx);
+			}
 			ECMAScriptGCHandler *data = QuickJSBinder::binding_data_from_gd(ctx, obj);
 			ERR_FAIL_NULL_V(data, JS_UNDEFINED);
 			ERR_FAIL_NULL_V(data->ecma_object, JS_UNDEFINED);
@@ -300,21 +373,25 @@ JSValue QuickJSBinder::variant_to_var(JSContext *ctx, const Variant p_var) {
 		}
 		case Variant::ARRAY: {
 			Array arr = p_var;
-			JSValue js_arr = JS_NewArray(ctx);
-			for (uint32_t i = 0; i < arr.size(); i++) {
-				JS_SetPropertyUint32(ctx, js_arr, i, variant_to_var(ctx, arr[int(i)]));
+			const int size = arr.size();
+			if (size == 0) return JS_NewArray(ctx);
+			// Convert into a preallocated buffer which is then adopted by a fast array
+			JSValue *values = static_cast<JSValue *>(js_malloc(ctx, sizeof(JSValue) * size));
+			if (values == NULL) return JS_EXCEPTION;
+			for (int i = 0; i < size; i++) {
+				values[i] = variant_to_var(ctx, arr[i]);
 			}
-			return js_arr;
+			return JS_NewArrayFrom(ctx, size, values);
 		}
 		case Variant::DICTIONARY: {
 			Dictionary dict = p_var;
 			JSValue obj = JS_NewObject(ctx);
-			Array keys = dict.keys();
-			for (int i = 0; i < keys.size(); i++) {
-				const Variant &key = keys[i];
-				const Variant &value = dict[key];
-				String key_str = keys[i];
-				JS_SetPropertyStr(ctx, obj, key_str.utf8().get_data(), variant_to_var(ctx, value));
+			QuickJSBinder *binder = get_context_binder(ctx);
+			for (const Variant *key = dict.next(NULL); key; key = dict.next(key)) {
+				// Convert the value first as nested dictionaries may flush the key cache
+				JSValue value = variant_to_var(ctx, dict[*key]);
+				JSAtom atom = binder->get_dictionary_key_atom(*key);
+				JS_DefinePropertyValue(ctx, obj, atom, value, JS_PROP_C_W_E);
 			}
 			return obj;
 		}
@@ -338,6 +415,52 @@ Variant QuickJSBinder::var_to_variant(JSContext *ctx, JSValue p_val) {
 			if (JS_VALUE_GET_PTR(p_val) == NULL) {
 				return Variant();
 			}
+			QuickJSBinder *binder = get_context_binder(ctx);
+			if (unlikely(binder->transferred_values.size())) {
+				if (const Variant *ptr = binder->transferred_values.getptr(JS_VALUE_GET_PTR(p_val))) {
+					return *ptr;
+				}
+				if (JS_IsTypedArray(p_val)) {
+					size_t offset, length, bytes_per_element;
+					JSValue buffer = JS_GetTypedArrayBuffer(ctx, p_val, &offset, &length, &bytes_per_element);
+					if (JS_IsException(buffer)) {
+						JS_FreeValue(ctx, JS_GetException(ctx));
+					} else {
+						const Variant *owner = binder->transferred_values.getptr(JS_VALUE_GET_PTR(buffer));
+						JS_FreeValue(ctx, buffer);
+						if (owner) {
+							return QuickJSTransferredBuffer::new_view_of(ctx, *owner, p_val, offset, length / bytes_per_element);
+						}
+					}
+				}
+			}
+			if (JS_IsSharedArrayBuffer(p_val) || JS_IsTypedArray(p_val)) {
+				// Posted to another context without copy
+				Ref<QuickJSSharedBuffer> shared = QuickJSSharedBuffer::share(ctx, p_val);
+				if (shared.is_valid()) {
+					return shared;
+				}
+			}
+			JSValue *values = NULL;
+			uint32_t count = 0;
+			if (JS_GetFastArray(ctx, p_val, &values, &count)) { // Fast array
+				Array arr;
+				arr.resize(count);
+				for (uint32_t i = 0; i < count; i++) {
+					// Converting an element may run script code which modifies the array
+					JSValue *elements = NULL;
+					uint32_t length = 0;
+					JSValue val;
+					if (JS_GetFastArray(ctx, p_val, &elements, &length) && i < length) {
+						val = JS_DupValue(ctx, elements[i]);
+					} else {
+						val = JS_GetPropertyUint32(ctx, p_val, i);
+					}
+					arr[int(i)] = var_to_variant(ctx, val);
+					JS_FreeValue(ctx, val);
+				}
+				return arr;
+			}
 			int length = get_js_array_length(ctx, p_val);
 			if (length != -1) { // Array
 				Array arr;
@@ -395,7 +518,7 @@ JSValue QuickJSBinder::godot_builtin_function(JSContext *ctx, JSValue this_val,
 	}
 
 	QuickJSBinder *binder = get_context_binder(ctx);
-	GodotMethodArguments args(argc);
+	GodotMethodArguments args(binder, argc);
 	for (int i = 0; i < argc; ++i) {
 		args.arguments[i] = var_to_variant(ctx, argv[i]);
 	}
@@ -550,6 +673,28 @@ Dictionary QuickJSBinder::js_to_dictionary(JSContext *ctx, const JSValue &p_val,
 	return dict;
 }
 
+JSAtom QuickJSBinder::get_dictionary_key_atom(const String &p_key) {
+	if (const JSAtom *cached = dictionary_key_atoms.getptr(p_key)) {
+		return *cached;
+	}
+	if (dictionary_key_atoms.size() >= DICTIONARY_KEY_ATOM_CACHE_SIZE) {
+		clear_dictionary_key_atoms();
+	}
+	CharString key_str = p_key.utf8();
+	JSAtom atom = JS_NewAtomLen(ctx, key_str.get_data(), key_str.length());
+	dictionary_key_atoms.set(p_key, atom);
+	return atom;
+}
+
+void QuickJSBinder::clear_dictionary_key_atoms() {
+	const String *key = dictionary_key_atoms.next(NULL);
+	while (key) {
+		JS_FreeAtom(ctx, dictionary_key_atoms.get(*key));
+		key = dictionary_key_atoms.next(key);
+	}
+	dictionary_key_atoms.clear();
+}
+
 JSAtom QuickJSBinder::get_atom(JSContext *ctx, const StringName &p_key) {
 	String name = p_key;
 	CharString name_str = name.ascii();
@@ -628,34 +773,8 @@ void QuickJSBinder::add_debug_binding_info(JSContext *ctx, JSValueConst p_obj, c
 	JS_DefinePropertyValueStr(ctx, p_obj, "__ctx__", ptrctx, PROP_DEF_DEFAULT);
 }
 
-static HashMap<String, String> resolve_path_cache;
-
 String QuickJSBinder::resolve_module_file(const String &file) {
-	if (const String *ptr = resolve_path_cache.getptr(file)) {
-		return *ptr;
-	}
-	String path = file;
-	if (FileAccess::exists(path)) return path;
-	// add extensions to try
-	String extension = file.get_extension();
-	List<String> extensions;
-	ECMAScriptLanguage::get_singleton()->get_recognized_extensions(&extensions);
-	if (extensions.find(extension) == NULL) {
-		for (List<String>::Element *E = extensions.front(); E; E = E->next()) {
-			path = file + "." + E->get();
-			if (FileAccess::exists(path)) {
-				return path;
-			}
-		}
-	}
-	// try index file under the folder
-	for (List<String>::Element *E = extensions.front(); E; E = E->next()) {
-		path = file + "/index." + E->get();
-		if (FileAccess::exists(path)) {
-			return path;
-		}
-	}
-	return "";
+	return ECMAScriptModuleIndex::resolve(file);
 }
 
 JSModuleDef *QuickJSBinder::js_module_loader(JSContext *ctx, const char *module_name, void *opaque) {
@@ -667,42 +786,59 @@ JSModuleDef *QuickJSBinder::js_module_loader(JSContext *ctx, const char *module_
 
 	String file = resolve_module_file(resolving_file);
 	ERR_FAIL_COND_V_MSG(file.is_empty(), NULL, "Failed to resolve module: '" + resolving_file + "'.");
-	resolve_path_cache.set(resolving_file, file);
 
 	QuickJSBinder *binder = QuickJSBinder::get_context_binder(ctx);
 	if (ModuleCache *ptr = binder->module_cache.getptr(file)) {
 		m = ptr->module;
 	}
 
+	// Already read by the threaded resource loader for a dynamic import
+	RES prefetched;
+	if (RES *ptr = binder->prefetched_modules.getptr(file)) {
+		prefetched = *ptr;
+		binder->prefetched_modules.erase(file);
+	}
+
 	if (!m) {
 		List<String> extensions;
 		ECMAScriptLanguage::get_singleton()->get_recognized_extensions(&extensions);
 		if (extensions.find(file.get_extension()) != NULL) {
-			Ref<ECMAScriptModule> em = ResourceFormatLoaderECMAScriptModule::load_static(file, "", &err);
-			if (err != OK || !em.is_valid()) {
-				JS_ThrowReferenceError(ctx, "Could not load module '%s'", file.utf8().get_data());
-				return NULL;
+			String code;
+			Vector<uint8_t> bytecode;
+			Ref<ECMAScript> script = prefetched;
+			if (script.is_valid()) {
+				code = script->get_source_code();
+				bytecode = script->bytecode;
+			} else {
+				Ref<ECMAScriptModule> em = prefetched;
+				if (em.is_null()) {
+					em = ResourceFormatLoaderECMAScriptModule::load_static(file, "", &err);
+				}
+				if (!em.is_valid()) {
+					JS_ThrowReferenceError(ctx, "Could not load module '%s'", file.utf8().get_data());
+					return NULL;
+				}
+				code = em->get_source_code();
+				bytecode = em->get_bytecode();
 			}
 			ECMAScriptScriptError es_err;
 
-			const Vector<uint8_t> &bytecode = em->get_bytecode();
 			if (bytecode.size()) {
 				ECMAScriptGCHandler ecma;
 				if (binder->load_bytecode(bytecode, file, &ecma) == OK) {
 					m = static_cast<JSModuleDef *>(ecma.ecma_object);
 				}
 			} else {
-				String code = em->get_source_code();
 				if (file.ends_with(EXT_JSON)) {
 					code = "export default " + code;
 				}
-				if (ModuleCache *module = binder->js_compile_and_cache_module(ctx, code, file, &es_err)) {
+				if (ModuleCache *module = binder->js_compile_and_cache_module(ctx, code, file, &es_err, !file.ends_with(EXT_JSON))) {
 					m = module->module;
 				}
 			}
 
 		} else { // Try load as Resource
-			RES res = ResourceLoader::load(file);
+			RES res = prefetched.is_valid() ? prefetched : ResourceLoader::load(file);
 			if (res.is_null()) {
 				JS_ThrowReferenceError(ctx, "Could not load module '%s'", file.utf8().get_data());
 				return NULL;
@@ -727,6 +863,44 @@ JSModuleDef *QuickJSBinder::js_module_loader(JSContext *ctx, const char *module_
 	return m;
 }
 
+int QuickJSBinder::js_module_prefetch(JSContext *ctx, const char *module_name, JSValueConst resume_func, void *opaque) {
+	String resolving_file;
+	resolving_file.parse_utf8(module_name);
+	String file = resolve_module_file(resolving_file);
+	// Let the import fail or succeed right away
+	if (file.is_empty() || file.ends_with("." EXT_JSON)) return false;
+
+	QuickJSBinder *binder = QuickJSBinder::get_context_binder(ctx);
+	if (binder->module_cache.has(file) || binder->prefetched_modules.has(file)) return false;
+	if (ResourceLoader::load_threaded_request(file) != OK) return false;
+
+	PendingImport pending;
+	pending.file = file;
+	pending.resume_func = JS_DupValue(ctx, resume_func);
+	binder->pending_imports.push_back(pending);
+	return true;
+}
+
+void QuickJSBinder::poll_pending_imports() {
+	List<PendingImport>::Element *E = pending_imports.front();
+	while (E) {
+		List<PendingImport>::Element *next = E->next();
+		const PendingImport &pending = E->get();
+		if (ResourceLoader::load_threaded_get_status(pending.file) != ResourceLoader::THREAD_LOAD_IN_PROGRESS) {
+			// A failed load is retried synchronously by the module loader so it reports the error
+			RES res = ResourceLoader::load_threaded_get(pending.file);
+			if (res.is_valid()) {
+				prefetched_modules.set(pending.file, res);
+			}
+			JSValue ret = JS_Call(ctx, pending.resume_func, JS_UNDEFINED, 0, NULL);
+			JS_FreeValue(ctx, ret);
+			JS_FreeValue(ctx, pending.resume_func);
+			pending_imports.erase(E);
+		}
+		E = next;
+	}
+}
+
 JSModuleDef *QuickJSBinder::js_make_module(JSContext *ctx, const String &p_id, const JSValue &p_value) {
 	JSModuleDef *m = JS_NewCModule(ctx, p_id.utf8().get_data(), resource_module_initializer);
 	JS_AddModuleExport(ctx, m, "default");
@@ -777,7 +951,7 @@ QuickJSBinder::ModuleCache QuickJSBinder::js_compile_module(JSContext *ctx, cons
 	return module;
 }
 
-QuickJSBinder::ModuleCache *QuickJSBinder::js_compile_and_cache_module(JSContext *ctx, const String &p_code, const String &p_filename, ECMAScriptScriptError *r_error) {
+QuickJSBinder::ModuleCache *QuickJSBinder::js_compile_and_cache_module(JSContext *ctx, const String &p_code, const String &p_filename, ECMAScriptScriptError *r_error, bool p_persist) {
 
 	QuickJSBinder *binder = QuickJSBinder::get_context_binder(ctx);
 	ModuleCache *last_module = binder->module_cache.getptr(p_filename);
@@ -805,6 +979,18 @@ QuickJSBinder::ModuleCache *QuickJSBinder::js_compile_and_cache_module(JSContext
 	mc.hash = p_code.hash();
 	if (mc.module) {
 		binder->module_cache.set(p_filename, mc);
+		if (p_persist) {
+			// Save the bytecode so the next launch can skip compiling the source
+			size_t size;
+			JSValue module = JS_MKPTR(JS_TAG_MODULE, mc.module);
+			if (uint8_t *buf = JS_WriteObject(ctx, &size, module, JS_WRITE_OBJ_BYTECODE | JS_WRITE_OBJ_REFERENCE | JS_WRITE_OBJ_SAB)) {
+				Vector<uint8_t> bytecode;
+				bytecode.resize(size);
+				memcpy(bytecode.ptrw(), buf, size);
+				js_free(ctx, buf);
+				ECMAScriptBytecodeCache::store(p_filename, p_code, bytecode);
+			}
+		}
 	}
 	return binder->module_cache.getptr(p_filename);
 }
@@ -878,13 +1064,20 @@ JSClassID QuickJSBinder::register_class(const ClassDB::ClassInfo *p_cls) {
 	Map<StringName, JSValue> methods;
 	{
 		godot_methods.resize(internal_godot_method_id + p_cls->method_map.size());
+		CharString gdclass_name = String(p_cls->name).ascii();
 		const StringName *key = p_cls->method_map.next(NULL);
 		while (key) {
 			MethodBind *mb = p_cls->method_map.get(*key);
 			godot_methods.write[internal_godot_method_id] = mb;
 
 			CharString name = String(*key).ascii();
-			JSValue method = JS_NewCFunctionMagic(ctx, &QuickJSBinder::object_method, name.get_data(), mb->get_argument_count(), JS_CFUNC_generic_magic, internal_godot_method_id);
+			// Methods of the hot engine classes convert their arguments without Variants
+			JSCFunctionMagic *function = &QuickJSBinder::object_method;
+			const EngineMethodThunk *thunk = find_engine_method_thunk(gdclass_name.get_data(), name.get_data());
+			if (thunk && thunk->matches(mb)) {
+				function = thunk->function;
+			}
+			JSValue method = JS_NewCFunctionMagic(ctx, function, name.get_data(), mb->get_argument_count(), JS_CFUNC_generic_magic, internal_godot_method_id);
 			JS_DefinePropertyValueStr(ctx, data.prototype, name.get_data(), method, PROP_DEF_DEFAULT);
 
 			methods.insert(*key, method);
@@ -959,6 +1152,11 @@ JSClassID QuickJSBinder::register_class(const ClassDB::ClassInfo *p_cls) {
 		}
 	}
 
+	// Signatures of the methods bound above
+	for (int i = godot_ptrcall_signatures.size(); i < internal_godot_method_id; i++) {
+		godot_ptrcall_signatures.push_back(get_ptrcall_signature(godot_methods[i]));
+	}
+
 	JS_NewClassID(&data.class_id);
 	JS_NewClass(JS_GetRuntime(ctx), data.class_id, &data.jsclass);
 	JS_SetClassProto(ctx, data.class_id, data.prototype);
@@ -1043,52 +1241,85 @@ void QuickJSBinder::add_godot_origin() {
 	JS_DefinePropertyValueStr(ctx, godot_object, godot_origin_class.class_name, godot_origin_class.constructor, PROP_DEF_DEFAULT);
 }
 
-void QuickJSBinder::add_godot_classes() {
+const QuickJSBinder::ClassBindData *QuickJSBinder::bind_class(const ClassDB::ClassInfo *p_cls) {
+	if (const ClassBindData **bound = classname_bindings.getptr(p_cls->name)) {
+		return *bound;
+	}
+	// The base classes are required to setup the prototype chain
+	const ClassBindData *base_class = p_cls->inherits_ptr ? bind_class(p_cls->inherits_ptr) : NULL;
+	JSClassID id = register_class(p_cls);
+	if (!id) return NULL;
 
-	Map<const ClassDB::ClassInfo *, JSClassID> gdclass_jsmap;
-	// register classes
-	const StringName *key = ClassDB::classes.next(NULL);
-	while (key) {
-		const ClassDB::ClassInfo *cls = ClassDB::classes.getptr(*key);
-		if (JSClassID id = register_class(cls)) {
-			gdclass_jsmap.insert(cls, id);
-		}
-		key = ClassDB::classes.next(key);
+	ClassBindData &data = class_bindings.get(id);
+	data.base_class = base_class;
+	JS_SetPrototype(ctx, data.prototype, base_class ? base_class->prototype : godot_origin_class.prototype);
+
+	int flags = PROP_DEF_DEFAULT;
+	// Allows redefine as to global object
+	if (Engine::get_singleton()->has_singleton(data.gdclass->name)) {
+		flags |= JS_PROP_CONFIGURABLE;
 	}
+	// Replaces the lazy accessor if there is one
+	JS_DefinePropertyValueStr(ctx, godot_object, data.jsclass.class_name, data.constructor, flags);
+	return &data;
+}
 
-	// Setup inherits chain
-	for (Map<const ClassDB::ClassInfo *, JSClassID>::Element *E = gdclass_jsmap.front(); E; E = E->next()) {
-		const ClassDB::ClassInfo *gdcls = E->key();
-		ClassBindData &bind = class_bindings.get(E->get());
-		if (gdcls->inherits_ptr) {
-			if (Map<const ClassDB::ClassInfo *, JSClassID>::Element *base = gdclass_jsmap.find(gdcls->inherits_ptr)) {
-				bind.base_class = class_bindings.getptr(base->get());
-			}
-		}
+const QuickJSBinder::ClassBindData *QuickJSBinder::get_class_binding(const StringName &p_class) {
+	if (const ClassBindData **bound = classname_bindings.getptr(p_class)) {
+		return *bound;
 	}
+	if (const ClassDB::ClassInfo *cls = ClassDB::classes.getptr(p_class)) {
+		return bind_class(cls);
+	}
+	return NULL;
+}
 
-	// Setup the prototype chain
-	const JSClassID *id = class_bindings.next(NULL);
-	while (id) {
+JSValue QuickJSBinder::godot_lazy_class_getter(JSContext *ctx, JSValue this_val, int magic) {
+	QuickJSBinder *binder = get_context_binder(ctx);
+	ERR_FAIL_INDEX_V(magic, binder->lazy_classes.size(), JS_UNDEFINED);
+	const ClassBindData *data = binder->bind_class(binder->lazy_classes[magic]);
+	ERR_FAIL_NULL_V(data, JS_UNDEFINED);
+	return JS_DupValue(ctx, data->constructor);
+}
 
-		const ClassBindData &data = class_bindings.get(*id);
+void QuickJSBinder::add_godot_classes() {
 
-		int flags = PROP_DEF_DEFAULT;
-		// Allows redefine as to global object
-		if (Engine::get_singleton()->has_singleton(data.gdclass->name)) {
-			flags |= JS_PROP_CONFIGURABLE;
-		}
-		JS_DefinePropertyValueStr(ctx, godot_object, data.jsclass.class_name, data.constructor, flags);
-		if (data.base_class) {
-			JS_SetPrototype(ctx, data.prototype, data.base_class->prototype);
-		} else {
-			JS_SetPrototype(ctx, data.prototype, godot_origin_class.prototype);
+	const StringName *key = ClassDB::classes.next(NULL);
+	if (lazy_class_binding) {
+		// Define an accessor for each class and bind the class on its first access
+		for (; key; key = ClassDB::classes.next(key)) {
+			const ClassDB::ClassInfo *cls = ClassDB::classes.getptr(*key);
+			CharString name;
+			if (class_remap.has(cls->name)) {
+				name = class_remap[cls->name];
+				if (name.length() == 0) continue;
+			} else {
+				name = String(cls->name).ascii();
+			}
+			lazy_classes.push_back(cls);
+			lazy_class_names.push_back(name);
+		}
+		ERR_FAIL_COND_MSG(lazy_classes.size() > INT16_MAX, "Too many classes to bind lazily");
+
+		lazy_class_entries.resize(lazy_classes.size());
+		JSCFunctionListEntry *entries = lazy_class_entries.ptrw();
+		for (int i = 0; i < lazy_classes.size(); i++) {
+			JSCFunctionListEntry &entry = entries[i];
+			entry.name = lazy_class_names[i].get_data();
+			entry.prop_flags = PROP_DEF_DEFAULT;
+			entry.def_type = JS_DEF_CGETSET_MAGIC;
+			entry.magic = i;
+			entry.u.getset.get.getter_magic = godot_lazy_class_getter;
+			entry.u.getset.set.setter_magic = NULL;
+		}
+		JS_SetPropertyFunctionList(ctx, godot_object, entries, lazy_class_entries.size());
+	} else {
+		for (; key; key = ClassDB::classes.next(key)) {
+			bind_class(ClassDB::classes.getptr(*key));
 		}
-
-		id = class_bindings.next(id);
 	}
-	godot_object_class = *classname_bindings.getptr("Object");
-	godot_reference_class = *classname_bindings.getptr("RefCounted");
+	godot_object_class = get_class_binding("Object");
+	godot_reference_class = get_class_binding("RefCounted");
 }
 
 void QuickJSBinder::add_godot_globals() {
@@ -1100,9 +1331,8 @@ void QuickJSBinder::add_godot_globals() {
 
 		ERR_CONTINUE(s.ptr == NULL);
 
-		const ClassBindData **cls_ptr = classname_bindings.getptr(s.ptr->get_class_name());
-		ERR_CONTINUE(cls_ptr == NULL);
-		const ClassBindData *cls = *cls_ptr;
+		const ClassBindData *cls = get_class_binding(s.ptr->get_class_name());
+		ERR_CONTINUE(cls == NULL);
 
 		JSValue obj = JS_NewObjectProtoClass(ctx, cls->prototype, get_origin_class_id());
 		ECMAScriptGCHandler *data = new_gc_handler(ctx);
@@ -1251,6 +1481,15 @@ void QuickJSBinder::add_godot_globals() {
 	// godot.adopt_value
 	JSValue adopt_value_func = JS_NewCFunction(ctx, godot_adopt_value, "adopt_value", 1);
 	JS_DefinePropertyValueStr(ctx, godot_object, "adopt_value", adopt_value_func, PROP_DEF_DEFAULT);
+	// godot.get_builtin_pool_stats
+	JSValue get_builtin_pool_stats_func = JS_NewCFunction(ctx, godot_get_builtin_pool_stats, "get_builtin_pool_stats", 0);
+	JS_DefinePropertyValueStr(ctx, godot_object, "get_builtin_pool_stats", get_builtin_pool_stats_func, PROP_DEF_DEFAULT);
+	// godot.get_call_cache_stats
+	JSValue get_call_cache_stats_func = JS_NewCFunction(ctx, godot_get_call_cache_stats, "get_call_cache_stats", 0);
+	JS_DefinePropertyValueStr(ctx, godot_object, "get_call_cache_stats", get_call_cache_stats_func, PROP_DEF_DEFAULT);
+	// godot.get_scheduler_stats
+	JSValue get_scheduler_stats_func = JS_NewCFunction(ctx, godot_get_scheduler_stats, "get_scheduler_stats", 0);
+	JS_DefinePropertyValueStr(ctx, godot_object, "get_scheduler_stats", get_scheduler_stats_func, PROP_DEF_DEFAULT);
 
 	{
 		// godot.DEBUG_ENABLED
@@ -1278,6 +1517,9 @@ QuickJSBinder::QuickJSBinder() {
 	godot_allocator.js_malloc_usable_size = NULL;
 	godot_object_class = NULL;
 	godot_reference_class = NULL;
+	for (int i = 0; i < ARGUMENT_STACK_SIZE; i++) {
+		argument_pointers[i] = &argument_stack[i];
+	}
 
 	if (class_remap.is_empty()) {
 		//class_remap.insert(File::get_class_static(), "File");
@@ -1298,13 +1540,19 @@ void QuickJSBinder::initialize() {
 		GLOBAL_LOCK_FUNCTION
 		ECMAScriptLanguage::get_singleton()->thread_binder_map.set(thread_id, this);
 	}
+	const uint64_t initialize_start = OS::get_singleton()->get_ticks_usec();
+	lazy_class_binding = GLOBAL_DEF("JavaScript/binding/lazy_class_binding", true);
+	frame_budget_usec = MAX(int64_t(GLOBAL_DEF("JavaScript/scheduler/frame_budget_usec", 8000)), 0);
 
 	// create runtime and context for the binder
 	runtime = JS_NewRuntime2(&godot_allocator, this);
+	// SharedArrayBuffers may outlive the runtime which created them
+	JS_SetSharedArrayBufferFunctions(runtime, QuickJSSharedBuffer::get_functions());
 	ctx = JS_NewContext(runtime);
 	JS_AddIntrinsicOperators(ctx);
 
 	JS_SetModuleLoaderFunc(runtime, /*js_module_resolve*/ NULL, js_module_loader, this);
+	JS_SetModulePrefetchFunc(runtime, js_module_prefetch);
 	JS_SetContextOpaque(ctx, this);
 
 	empty_function = JS_NewCFunction(ctx, js_empty_func, "virtual_function", 0);
@@ -1332,6 +1580,8 @@ void QuickJSBinder::initialize() {
 	add_godot_globals();
 	// globalThis.Worker
 	add_global_worker();
+	// godot.WorkerPool
+	add_godot_worker_pool();
 	// Other global properties
 	add_global_properties();
 	// globalThis.console
@@ -1339,7 +1589,7 @@ void QuickJSBinder::initialize() {
 	// binding script
 	String script_binding_error;
 	ECMAScriptGCHandler eval_ret;
-	if (OK == safe_eval_text(ECMAScriptBinder::BINDING_SCRIPT_CONTENT, ECMAScriptBinder::EVAL_TYPE_GLOBAL, "<internal: binding_script.js>", script_binding_error, eval_ret)) {
+	if (OK == eval_binding_script(script_binding_error, eval_ret)) {
 #ifdef TOOLS_ENABLED
 		JSValue ret = JS_MKPTR(JS_TAG_OBJECT, eval_ret.ecma_object);
 		modified_api = var_to_variant(ctx, ret);
@@ -1349,6 +1599,13 @@ void QuickJSBinder::initialize() {
 		CRASH_NOW_MSG("Execute script binding failed:" ENDL + script_binding_error);
 	}
 
+	if (OS::get_singleton()->is_stdout_verbose()) {
+		JSMemoryUsage usage;
+		JS_ComputeMemoryUsage(runtime, &usage);
+		const double initialize_time = (OS::get_singleton()->get_ticks_usec() - initialize_start) / 1000.0;
+		print_verbose(vformat("JavaScript context #%d initialized in %.2f ms with %d bytes allocated, %d of %d engine classes bound", context_id, initialize_time, usage.malloc_size, class_bindings.size(), ClassDB::classes.size()));
+	}
+
 #ifdef QUICKJS_WITH_DEBUGGER
 	debugger.instantiate();
 	bool is_editor_hint = false;
@@ -1434,6 +1691,16 @@ void QuickJSBinder::uninitialize() {
 	}
 	frame_callbacks.clear();
 
+	// Free tasks and idle callbacks
+	clear_scheduled_tasks();
+
+	// Free dynamic imports still waiting for their module
+	for (List<PendingImport>::Element *E = pending_imports.front(); E; E = E->next()) {
+		JS_FreeValue(ctx, E->get().resume_func);
+	}
+	pending_imports.clear();
+	prefetched_modules.clear();
+
 	List<RES> module_resources;
 	{ // modules
 		const String *file = module_cache.next(NULL);
@@ -1466,6 +1733,8 @@ void QuickJSBinder::uninitialize() {
 		commonjs_module_cache.clear();
 	}
 
+	clear_dictionary_key_atoms();
+	clear_atom_cache();
 	JS_FreeAtom(ctx, js_key_godot_classid);
 	JS_FreeAtom(ctx, js_key_godot_classname);
 	JS_FreeAtom(ctx, js_key_godot_tooled);
@@ -1481,6 +1750,10 @@ void QuickJSBinder::uninitialize() {
 	JS_SetContextOpaque(ctx, NULL);
 	JS_FreeContext(ctx);
 	JS_FreeRuntime(runtime);
+	builtin_binder.clear_handle_pools();
+	lazy_classes.clear();
+	lazy_class_names.clear();
+	lazy_class_entries.clear();
 
 	for (List<RES>::Element *E = module_resources.front(); E; E = E->next()) {
 		E->get()->unreference(); // Avoid imported resource leaking
@@ -1503,24 +1776,20 @@ void QuickJSBinder::language_finalize() {
 
 	GLOBAL_LOCK_FUNCTION
 	transfer_deopot.clear();
+	binding_script_compiled.clear();
+	binding_script_bytecode.clear();
 }
 
 void QuickJSBinder::frame() {
-	JSContext *ctx1;
-	int err;
-	for (;;) {
-		err = JS_ExecutePendingJob(JS_GetRuntime(ctx), &ctx1);
-		if (err <= 0) {
-			if (err < 0) {
-				ECMAScriptScriptError script_err;
-				JSValue e = JS_GetException(ctx1);
-				dump_exception(ctx1, e, &script_err);
-				ERR_PRINT(error_to_string(script_err));
-				JS_FreeValue(ctx1, e);
-			}
-			break;
-		}
-	}
+	const uint64_t frame_start = OS::get_singleton()->get_ticks_usec();
+	// Jobs and tasks left when the budget is spent are carried over to the next frame
+	const uint64_t deadline = frame_budget_usec ? frame_start + frame_budget_usec : UINT64_MAX;
+	scheduler_stats = SchedulerStats();
+
+	poll_pending_imports();
+
+	run_scheduled_tasks(TASK_PRIORITY_USER_BLOCKING, UINT64_MAX);
+	execute_pending_jobs(deadline);
 
 	for (List<ECMAScriptGCHandler *>::Element *E = workers.front(); E; E = E->next()) {
 		ECMAScriptGCHandler *bind = E->get();
@@ -1529,14 +1798,27 @@ void QuickJSBinder::frame() {
 		worker->frame_of_host(this, object);
 	}
 
+	for (List<ECMAScriptGCHandler *>::Element *E = worker_pools.front(); E; E = E->next()) {
+		static_cast<QuickJSWorkerPool *>(E->get()->native_ptr)->poll(ctx);
+	}
+
+	// The callbacks of a frame share its time stamp
+	JSValue argv[] = { JS_NewFloat64(ctx, OS::get_singleton()->get_ticks_usec() / 1000.0) };
+	const bool profiling = profiler.is_profiling();
 	const int64_t *id = frame_callbacks.next(NULL);
 	while (id) {
 		const ECMAScriptGCHandler &func = frame_callbacks.get(*id);
 		JSValueConst js_func = JS_MKPTR(JS_TAG_OBJECT, func.ecma_object);
-		double timestamp = OS::get_singleton()->get_ticks_usec() / 1000.0;
-		JSValue argv[] = { JS_NewFloat64(ctx, timestamp) };
+		if (unlikely(profiling)) {
+			JSValue name = JS_GetProperty(ctx, js_func, JS_ATOM_name);
+			String function_name = JS_IsString(name) ? js_to_string(ctx, name) : String();
+			JS_FreeValue(ctx, name);
+			profiler.enter(profiler.get_function("requestAnimationFrame::0::" + (function_name.is_empty() ? String("<anonymous>") : function_name)));
+		}
 		JSValue ret = JS_Call(ctx, js_func, global_object, 1, argv);
-		JS_FreeValue(ctx, argv[0]);
+		if (unlikely(profiling)) {
+			profiler.exit();
+		}
 		if (JS_IsException(ret)) {
 			JSValue e = JS_GetException(ctx);
 			ECMAScriptScriptError err;
@@ -1546,12 +1828,145 @@ void QuickJSBinder::frame() {
 		}
 		id = frame_callbacks.next(id);
 	}
+	JS_FreeValue(ctx, argv[0]);
+
+	run_scheduled_tasks(TASK_PRIORITY_USER_VISIBLE, deadline);
+	run_scheduled_tasks(TASK_PRIORITY_BACKGROUND, deadline);
+
+	scheduler_stats.frame_usec = OS::get_singleton()->get_ticks_usec() - frame_start;
+	total_deferred_jobs += scheduler_stats.deferred_jobs;
+	total_deferred_tasks += scheduler_stats.deferred_tasks;
 
 #ifdef QUICKJS_WITH_DEBUGGER
 	debugger->poll();
 #endif
 }
 
+void QuickJSBinder::execute_pending_jobs(uint64_t p_deadline) {
+	JSContext *ctx1;
+	for (int executed = 1;; executed++) {
+		if (p_deadline != UINT64_MAX && executed % JOB_BATCH_SIZE == 0 && OS::get_singleton()->get_ticks_usec() >= p_deadline) {
+			scheduler_stats.deferred_jobs = JS_GetPendingJobCount(runtime);
+			break;
+		}
+		int err = JS_ExecutePendingJob(runtime, &ctx1);
+		if (err == 0) {
+			break;
+		}
+		scheduler_stats.executed_jobs++;
+		if (err < 0) {
+			ECMAScriptScriptError script_err;
+			JSValue e = JS_GetException(ctx1);
+			dump_exception(ctx1, e, &script_err);
+			ERR_PRINT(error_to_string(script_err));
+			JS_FreeValue(ctx1, e);
+		}
+	}
+}
+
+void QuickJSBinder::run_scheduled_tasks(TaskPriority p_priority, uint64_t p_deadline) {
+	List<ScheduledTask> &lane = task_lanes[p_priority];
+	if (lane.is_empty()) return;
+	// The tasks queued by these ones wait for the next frame
+	List<ScheduledTask> tasks = lane;
+	lane.clear();
+	running_tasks = &tasks;
+
+	uint64_t now = OS::get_singleton()->get_ticks_usec();
+	if (p_priority == TASK_PRIORITY_BACKGROUND) {
+		idle_deadline = MIN(p_deadline, now + MAX_IDLE_PERIOD_USEC);
+	}
+	for (List<ScheduledTask>::Element *E = tasks.front(); E; E = E->next()) {
+		ScheduledTask &task = E->get();
+		if (JS_IsUndefined(task.callback)) continue; // cancelled
+		const bool did_timeout = task.timeout && now >= task.timeout;
+		if (now >= p_deadline && !did_timeout) continue;
+		run_scheduled_task(task, did_timeout);
+		scheduler_stats.executed_tasks++;
+		if (p_deadline != UINT64_MAX) {
+			now = OS::get_singleton()->get_ticks_usec();
+		}
+	}
+	running_tasks = NULL;
+
+	// The deferred tasks keep their place before the tasks queued meanwhile
+	for (List<ScheduledTask>::Element *E = tasks.back(); E; E = E->prev()) {
+		if (!JS_IsUndefined(E->get().callback)) {
+			lane.push_front(E->get());
+			scheduler_stats.deferred_tasks++;
+		}
+	}
+}
+
+void QuickJSBinder::run_scheduled_task(ScheduledTask &p_task, bool p_did_timeout) {
+	// Taken from the task first so the callback can cancel itself
+	JSValue callback = p_task.callback;
+	p_task.callback = JS_UNDEFINED;
+
+	JSValue ret;
+	if (p_task.id) {
+		JSValue deadline = JS_NewObject(ctx);
+		JS_DefinePropertyValueStr(ctx, deadline, "didTimeout", JS_NewBool(ctx, p_did_timeout), PROP_DEF_DEFAULT);
+		JS_DefinePropertyValueStr(ctx, deadline, "timeRemaining", JS_NewCFunction(ctx, idle_deadline_time_remaining, "timeRemaining", 0), PROP_DEF_DEFAULT);
+		ret = JS_Call(ctx, callback, global_object, 1, &deadline);
+		JS_FreeValue(ctx, deadline);
+	} else {
+		ret = JS_Call(ctx, callback, global_object, 0, NULL);
+	}
+	JS_FreeValue(ctx, callback);
+
+	const bool failed = JS_IsException(ret);
+	if (JS_IsUndefined(p_task.resolving_funcs[0])) {
+		if (failed) {
+			JSValue e = JS_GetException(ctx);
+			ECMAScriptScriptError err;
+			dump_exception(ctx, e, &err);
+			ERR_PRINT("Error in requestIdleCallback:" ENDL + error_to_string(err));
+			JS_FreeValue(ctx, e);
+		}
+	} else {
+		JSValue result = failed ? JS_GetException(ctx) : JS_DupValue(ctx, ret);
+		JSValue settled = JS_Call(ctx, p_task.resolving_funcs[failed ? 1 : 0], JS_UNDEFINED, 1, &result);
+		JS_FreeValue(ctx, settled);
+		JS_FreeValue(ctx, result);
+		JS_FreeValue(ctx, p_task.resolving_funcs[0]);
+		JS_FreeValue(ctx, p_task.resolving_funcs[1]);
+		p_task.resolving_funcs[0] = JS_UNDEFINED;
+		p_task.resolving_funcs[1] = JS_UNDEFINED;
+	}
+	JS_FreeValue(ctx, ret);
+}
+
+void QuickJSBinder::clear_scheduled_tasks() {
+	for (int i = 0; i < TASK_PRIORITY_MAX; i++) {
+		for (List<ScheduledTask>::Element *E = task_lanes[i].front(); E; E = E->next()) {
+			const ScheduledTask &task = E->get();
+			JS_FreeValue(ctx, task.callback);
+			JS_FreeValue(ctx, task.resolving_funcs[0]);
+			JS_FreeValue(ctx, task.resolving_funcs[1]);
+		}
+		task_lanes[i].clear();
+	}
+}
+
+Dictionary QuickJSBinder::get_scheduler_stats() const {
+	Dictionary queued;
+	queued["user-blocking"] = task_lanes[TASK_PRIORITY_USER_BLOCKING].size();
+	queued["user-visible"] = task_lanes[TASK_PRIORITY_USER_VISIBLE].size();
+	queued["background"] = task_lanes[TASK_PRIORITY_BACKGROUND].size();
+	Dictionary stats;
+	stats["frame_budget_usec"] = frame_budget_usec;
+	stats["frame_usec"] = scheduler_stats.frame_usec;
+	stats["executed_jobs"] = scheduler_stats.executed_jobs;
+	stats["deferred_jobs"] = scheduler_stats.deferred_jobs;
+	stats["executed_tasks"] = scheduler_stats.executed_tasks;
+	stats["deferred_tasks"] = scheduler_stats.deferred_tasks;
+	stats["total_deferred_jobs"] = total_deferred_jobs;
+	stats["total_deferred_tasks"] = total_deferred_tasks;
+	stats["queued"] = queued;
+	return stats;
+}
+
 Error QuickJSBinder::eval_string(const String &p_source, EvalType type, const String &p_path, ECMAScriptGCHandler &r_ret) {
 	String error;
 	Error err = safe_eval_text(p_source, type, p_path, error, r_ret);
@@ -1585,6 +2000,46 @@ Error QuickJSBinder::safe_eval_text(const String &p_source, EvalType type, const
 	}
 	return OK;
 }
+
+Error QuickJSBinder::eval_binding_script(String &r_error, ECMAScriptGCHandler &r_ret) {
+	const char *filename = "<internal: binding_script.js>";
+	JSValue func = JS_UNDEFINED;
+	if (!binding_script_compiled.is_set()) {
+		MutexLock lock(binding_script_mutex);
+		if (!binding_script_compiled.is_set()) {
+			// Parse the script once and keep its bytecode for the contexts created later
+			CharString utf8_str = ECMAScriptBinder::BINDING_SCRIPT_CONTENT.utf8();
+			func = JS_Eval(ctx, utf8_str.get_data(), utf8_str.length(), filename, JS_EVAL_TYPE_GLOBAL | JS_EVAL_FLAG_STRICT | JS_EVAL_FLAG_COMPILE_ONLY);
+			size_t size;
+			if (!JS_IsException(func)) {
+				if (uint8_t *buf = JS_WriteObject(ctx, &size, func, JS_WRITE_OBJ_BYTECODE)) {
+					binding_script_bytecode.resize(size);
+					memcpy(binding_script_bytecode.ptrw(), buf, size);
+					js_free(ctx, buf);
+					binding_script_compiled.set();
+				}
+			}
+		}
+	}
+	if (JS_IsUndefined(func)) {
+		// The bytecode is immutable once compiled so every context reads it concurrently
+		func = JS_ReadObject(ctx, binding_script_bytecode.ptr(), binding_script_bytecode.size(), JS_READ_OBJ_BYTECODE);
+	}
+	// JS_EvalFunction takes the ownership of the function
+	JSValue ret = JS_IsException(func) ? func : JS_EvalFunction(ctx, func);
+	r_ret.context = ctx;
+	r_ret.ecma_object = JS_VALUE_GET_PTR(ret);
+	if (JS_IsException(ret)) {
+		JSValue e = JS_GetException(ctx);
+		ECMAScriptScriptError err;
+		dump_exception(ctx, e, &err);
+		r_error = error_to_string(err);
+		JS_Throw(ctx, e);
+		return ERR_PARSE_ERROR;
+	}
+	return OK;
+}
+
 Error QuickJSBinder::compile_to_bytecode(const String &p_code, const String &p_file, Vector<uint8_t> &r_bytecode) {
 	ECMAScriptScriptError script_err;
 	ModuleCache mc = js_compile_module(ctx, p_code, p_file, &script_err);
@@ -1656,18 +2111,18 @@ void QuickJSBinder::free_object_binding_data(void *p_gc_handle) {
 
 Error QuickJSBinder::bind_gc_object(JSContext *ctx, ECMAScriptGCHandler *data, Object *p_object) {
 	QuickJSBinder *binder = get_context_binder(ctx);
-	const ClassBindData **bind_ptr = binder->classname_bindings.getptr(p_object->get_class_name());
-	if (!bind_ptr) {
-		bind_ptr = binder->classname_bindings.getptr(p_object->get_parent_class_static());
+	const ClassBindData *bind = binder->get_class_binding(p_object->get_class_name());
+	if (!bind) {
+		bind = binder->get_class_binding(p_object->get_parent_class_static());
 	}
-	if (!bind_ptr) {
-		bind_ptr = Object::cast_to<RefCounted>(p_object) == NULL ? &binder->godot_object_class : &binder->godot_reference_class;
+	if (!bind) {
+		bind = Object::cast_to<RefCounted>(p_object) == NULL ? binder->godot_object_class : binder->godot_reference_class;
 #ifdef DEBUG_ENABLED
 		WARN_PRINT("Class " + p_object->get_class_name() + " is not registed to ClassDB");
 #endif
 	}
-	if (bind_ptr) {
-		JSValue obj = JS_NewObjectProtoClass(ctx, (*bind_ptr)->prototype, binder->get_origin_class_id());
+	if (bind) {
+		JSValue obj = JS_NewObjectProtoClass(ctx, bind->prototype, binder->get_origin_class_id());
 		data->ecma_object = JS_VALUE_GET_PTR(obj);
 		data->context = ctx;
 		data->godot_object = p_object;
@@ -1895,6 +2350,7 @@ const ECMAClassInfo *QuickJSBinder::register_ecma_class(const JSValue &p_constru
 		ecma_class.tool = false;
 		ecma_class.native_class = bind->gdclass;
 		ecma_class.class_name = class_name;
+		ecma_class.path = p_path;
 		ecma_class.prototype.context = ctx;
 		ecma_class.prototype.ecma_object = JS_VALUE_GET_PTR(prototype);
 		ecma_class.constructor.context = ctx;
@@ -2126,6 +2582,94 @@ JSValue QuickJSBinder::global_cancel_animation_frame(JSContext *ctx, JSValue thi
 	return JS_UNDEFINED;
 }
 
+JSValue QuickJSBinder::global_request_idle_callback(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	ERR_FAIL_COND_V(argc < 1 || !JS_IsFunction(ctx, argv[0]), JS_ThrowTypeError(ctx, "Function expected for argument #0"));
+	QuickJSBinder *binder = get_context_binder(ctx);
+	ScheduledTask task;
+	if (argc > 1 && JS_IsObject(argv[1])) {
+		JSValue timeout = JS_GetPropertyStr(ctx, argv[1], "timeout");
+		double timeout_msec = 0;
+		if (JS_IsNumber(timeout)) {
+			JS_ToFloat64(ctx, &timeout_msec, timeout);
+		}
+		JS_FreeValue(ctx, timeout);
+		if (timeout_msec > 0) {
+			task.timeout = OS::get_singleton()->get_ticks_usec() + uint64_t(timeout_msec * 1000);
+		}
+	}
+	task.id = ++binder->last_idle_callback_id;
+	task.callback = JS_DupValue(ctx, argv[0]);
+	binder->task_lanes[TASK_PRIORITY_BACKGROUND].push_back(task);
+	return JS_NewInt64(ctx, task.id);
+}
+
+JSValue QuickJSBinder::global_cancel_idle_callback(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	ERR_FAIL_COND_V(argc < 1 || !JS_IsNumber(argv[0]), JS_ThrowTypeError(ctx, "Request ID expected for argument #0"));
+	int64_t id = js_to_int64(ctx, argv[0]);
+	// The postTask tasks of the same lane have no ID
+	if (id <= 0) return JS_UNDEFINED;
+	QuickJSBinder *binder = get_context_binder(ctx);
+	List<ScheduledTask> &lane = binder->task_lanes[TASK_PRIORITY_BACKGROUND];
+	for (List<ScheduledTask>::Element *E = lane.front(); E; E = E->next()) {
+		ScheduledTask &task = E->get();
+		if (task.id == id) {
+			JS_FreeValue(ctx, task.callback);
+			JS_FreeValue(ctx, task.resolving_funcs[0]);
+			JS_FreeValue(ctx, task.resolving_funcs[1]);
+			lane.erase(E);
+			return JS_UNDEFINED;
+		}
+	}
+	// Still waiting in the frame running the idle callbacks
+	if (binder->running_tasks) {
+		for (List<ScheduledTask>::Element *E = binder->running_tasks->front(); E; E = E->next()) {
+			ScheduledTask &task = E->get();
+			if (task.id == id) {
+				JS_FreeValue(ctx, task.callback);
+				JS_FreeValue(ctx, task.resolving_funcs[0]);
+				JS_FreeValue(ctx, task.resolving_funcs[1]);
+				task.callback = JS_UNDEFINED;
+				task.resolving_funcs[0] = JS_UNDEFINED;
+				task.resolving_funcs[1] = JS_UNDEFINED;
+				break;
+			}
+		}
+	}
+	return JS_UNDEFINED;
+}
+
+JSValue QuickJSBinder::idle_deadline_time_remaining(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	QuickJSBinder *binder = get_context_binder(ctx);
+	const uint64_t now = OS::get_singleton()->get_ticks_usec();
+	return JS_NewFloat64(ctx, binder->idle_deadline > now ? (binder->idle_deadline - now) / 1000.0 : 0.0);
+}
+
+JSValue QuickJSBinder::scheduler_post_task(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	ERR_FAIL_COND_V(argc < 1 || !JS_IsFunction(ctx, argv[0]), JS_ThrowTypeError(ctx, "Function expected for argument #0"));
+	TaskPriority priority = TASK_PRIORITY_USER_VISIBLE;
+	if (argc > 1 && JS_IsObject(argv[1])) {
+		JSValue value = JS_GetPropertyStr(ctx, argv[1], "priority");
+		if (!JS_IsUndefined(value)) {
+			String name = js_to_string(ctx, value);
+			if (name == "user-blocking") {
+				priority = TASK_PRIORITY_USER_BLOCKING;
+			} else if (name == "background") {
+				priority = TASK_PRIORITY_BACKGROUND;
+			} else if (name != "user-visible") {
+				JS_FreeValue(ctx, value);
+				return JS_ThrowTypeError(ctx, "Unknown task priority '%s'", name.utf8().get_data());
+			}
+		}
+		JS_FreeValue(ctx, value);
+	}
+	ScheduledTask task;
+	JSValue promise = JS_NewPromiseCapability(ctx, task.resolving_funcs);
+	if (JS_IsException(promise)) return promise;
+	task.callback = JS_DupValue(ctx, argv[0]);
+	get_context_binder(ctx)->task_lanes[priority].push_back(task);
+	return promise;
+}
+
 int QuickJSBinder::get_js_array_length(JSContext *ctx, JSValue p_val) {
 	if (!JS_IsArray(ctx, p_val)) return -1;
 	JSValue ret = JS_GetProperty(ctx, p_val, JS_ATOM_length);
@@ -2172,26 +2716,161 @@ ECMAScriptGCHandler QuickJSBinder::create_ecma_instance_for_godot_object(const E
 	return *bind;
 }
 
-Variant QuickJSBinder::call_method(const ECMAScriptGCHandler &p_object, const StringName &p_method, const Variant **p_args, int p_argcount, Callable::CallError &r_error) {
+JSAtom QuickJSBinder::get_cached_atom(const StringName &p_name) {
+	if (const JSAtom *cached = atom_cache.getptr(p_name)) {
+		++atom_cache_hits;
+		return *cached;
+	}
+	++atom_cache_misses;
+	if (atom_cache.size() >= ATOM_CACHE_SIZE) {
+		clear_atom_cache();
+	}
+	JSAtom atom = get_atom(ctx, p_name);
+	atom_cache.set(p_name, atom);
+	return atom;
+}
+
+void QuickJSBinder::clear_atom_cache() {
+	const StringName *key = atom_cache.next(NULL);
+	while (key) {
+		JS_FreeAtom(ctx, atom_cache.get(*key));
+		key = atom_cache.next(key);
+	}
+	atom_cache.clear();
+}
+
+ECMAScriptProfiler::Function *QuickJSBinder::get_method_profile(const ECMAClassInfo *p_class, const StringName &p_method) {
+	if (ECMAScriptProfiler::Function **ptr = p_class->method_profiles.getptr(p_method)) {
+		return *ptr;
+	}
+	ECMAScriptProfiler::Function *profile = profiler.get_function(p_class->path + "::0::" + p_method);
+	p_class->method_profiles.set(p_method, profile);
+	return profile;
+}
+
+ECMAScriptProfiler::Function *QuickJSBinder::get_godot_method_profile(int p_method_id) {
+	if (p_method_id >= godot_method_profiles.size()) {
+		int size = godot_method_profiles.size();
+		godot_method_profiles.resize(godot_methods.size());
+		for (int i = size; i < godot_method_profiles.size(); i++) {
+			godot_method_profiles.write[i] = NULL;
+		}
+	}
+	ECMAScriptProfiler::Function *profile = godot_method_profiles[p_method_id];
+	if (profile == NULL) {
+		const MethodBind *mb = godot_methods[p_method_id];
+		profile = profiler.get_function(String(mb->get_instance_class()) + "::0::" + mb->get_name());
+		godot_method_profiles.write[p_method_id] = profile;
+	}
+	return profile;
+}
+
+QuickJSBinder::PtrcallSignature QuickJSBinder::get_ptrcall_signature(const MethodBind *p_method) {
+	PtrcallSignature signature;
+	if (p_method->is_vararg() || p_method->get_argument_count() > MAX_ARGUMENT_COUNT) {
+		return signature;
+	}
+	signature.has_return = p_method->has_return();
+	signature.return_type = p_method->get_argument_type(-1);
+	// Object returns keep the Variant call which handles the reference counting
+	if (signature.return_type == Variant::OBJECT) {
+		return signature;
+	}
+	for (int i = 0; i < p_method->get_argument_count(); i++) {
+		Variant::Type type = p_method->get_argument_type(i);
+		// Object parameters are read as Object ** or Ref<T> * depending on the method, the Variant call handles both
+		if (type == Variant::OBJECT) {
+			return signature;
+		}
+		signature.argument_types.push_back(type);
+	}
+	signature.enabled = true;
+	return signature;
+}
+
+bool QuickJSBinder::EngineMethodThunk::matches(const MethodBind *p_method) const {
+	if (p_method->is_vararg() || p_method->get_argument_count() != argument_count || p_method->has_return() != has_return) {
+		return false;
+	}
+	if (has_return && p_method->get_argument_type(-1) != return_type) {
+		return false;
+	}
+	for (int i = 0; i < argument_count; i++) {
+		if (p_method->get_argument_type(i) != argument_types[i]) {
+			return false;
+		}
+	}
+	return true;
+}
+
+bool QuickJSBinder::prepare_ptrcall_arguments(const PtrcallSignature &p_signature, Variant *p_arguments, int p_argc) {
+	// Omitted arguments take their default values in the Variant call
+	if (p_argc != p_signature.argument_types.size()) {
+		return false;
+	}
+	for (int i = 0; i < p_argc; i++) {
+		const Variant::Type expected = p_signature.argument_types[i];
+		Variant &arg = p_arguments[i];
+		if (expected == Variant::NIL) continue;
+		const Variant::Type type = arg.get_type();
+		if (type != expected) {
+			// Conversions of the values coming from scripts, the others are left to the Variant call
+			if (expected == Variant::FLOAT && type == Variant::INT) {
+				arg = double(int64_t(arg));
+			} else if (expected == Variant::INT && type == Variant::FLOAT) {
+				arg = int64_t(double(arg));
+			} else if (expected == Variant::STRING_NAME && type == Variant::STRING) {
+				arg = StringName(String(arg));
+			} else if (expected == Variant::NODE_PATH && type == Variant::STRING) {
+				arg = NodePath(String(arg));
+			} else {
+				return false;
+			}
+		}
+	}
+	return true;
+}
+
+Dictionary QuickJSBinder::get_call_cache_stats() const {
+	Dictionary atoms;
+	atoms["hits"] = atom_cache_hits;
+	atoms["misses"] = atom_cache_misses;
+	atoms["hit_rate"] = (atom_cache_hits + atom_cache_misses) ? double(atom_cache_hits) / (atom_cache_hits + atom_cache_misses) : 0.0;
+	atoms["size"] = atom_cache.size();
+	Dictionary stats;
+	stats["atoms"] = atoms;
+	return stats;
+}
+
+Variant QuickJSBinder::call_method(const ECMAScriptGCHandler &p_object, const ECMAClassInfo *p_class, const StringName &p_method, const Variant **p_args, int p_argcount, Callable::CallError &r_error) {
 
 	JSValue object = GET_JSVALUE(p_object);
-	JSAtom atom = get_atom(ctx, p_method);
+	JSAtom atom = get_cached_atom(p_method);
+	// Resolved on every call so methods added to or replaced on the prototype later are seen
 	JSValue method = JS_GetProperty(ctx, object, atom);
-	JS_FreeAtom(ctx, atom);
 
 	JSValue return_val = JS_UNDEFINED;
 	JSValue *argv = NULL;
+	JSValue argv_buffer[MAX_ARGUMENT_COUNT];
+	ECMAScriptProfiler::Function *profile = NULL;
 
 	if (!JS_IsFunction(ctx, method) || JS_IsPureCFunction(ctx, method)) {
 		r_error.error = Callable::CallError::CALL_ERROR_INVALID_METHOD;
 		goto finish;
 	}
 
-	argv = memnew_arr(JSValue, p_argcount);
+	argv = likely(p_argcount <= MAX_ARGUMENT_COUNT) ? argv_buffer : memnew_arr(JSValue, p_argcount);
 	for (int i = 0; i < p_argcount; ++i) {
 		argv[i] = variant_to_var(ctx, *p_args[i]);
 	}
+	if (unlikely(profiler.is_profiling()) && p_class) {
+		profile = get_method_profile(p_class, p_method);
+		profiler.enter(profile);
+	}
 	return_val = JS_Call(ctx, method, object, p_argcount, argv);
+	if (profile) {
+		profiler.exit();
+	}
 
 	if (JS_IsException(return_val)) {
 		r_error.error = Callable::CallError::CALL_ERROR_INVALID_METHOD;
@@ -2209,7 +2888,9 @@ finish:
 		for (int i = 0; i < p_argcount; i++) {
 			JS_FreeValue(ctx, argv[i]);
 		}
-		memdelete_arr(argv);
+		if (argv != argv_buffer) {
+			memdelete_arr(argv);
+		}
 	}
 	JS_FreeValue(ctx, return_val);
 	JS_FreeValue(ctx, method);
@@ -2219,9 +2900,8 @@ finish:
 bool QuickJSBinder::get_instance_property(const ECMAScriptGCHandler &p_object, const StringName &p_name, Variant &r_ret) {
 	bool success = false;
 	JSValue obj = GET_JSVALUE(p_object);
-	JSAtom atom = get_atom(ctx, p_name);
+	JSAtom atom = get_cached_atom(p_name);
 	JSValue ret = JS_GetProperty(ctx, obj, atom);
-	JS_FreeAtom(ctx, atom);
 	r_ret = var_to_variant(ctx, ret);
 	success = !JS_IsUndefined(ret);
 	JS_FreeValue(ctx, ret);
@@ -2230,19 +2910,19 @@ bool QuickJSBinder::get_instance_property(const ECMAScriptGCHandler &p_object, c
 
 bool QuickJSBinder::set_instance_property(const ECMAScriptGCHandler &p_object, const StringName &p_name, const Variant &p_value) {
 	JSValue obj = GET_JSVALUE(p_object);
-	JSAtom atom = get_atom(ctx, p_name);
-	bool success = JS_SetProperty(ctx, obj, atom, variant_to_var(ctx, p_value));
-	JS_FreeAtom(ctx, atom);
+	// Converted first, the conversion must not run while the atom is held
+	JSValue value = variant_to_var(ctx, p_value);
+	JSAtom atom = get_cached_atom(p_name);
+	bool success = JS_SetProperty(ctx, obj, atom, value);
 	return success;
 }
 
 bool QuickJSBinder::has_method(const ECMAScriptGCHandler &p_object, const StringName &p_name) {
 	JSValue obj = GET_JSVALUE(p_object);
 	ERR_FAIL_COND_V(!JS_IsObject(obj), false);
-	JSAtom atom = get_atom(ctx, p_name);
+	JSAtom atom = get_cached_atom(p_name);
 	JSValue value = JS_GetProperty(ctx, GET_JSVALUE(p_object), atom);
 	bool success = JS_IsFunction(ctx, value);
-	JS_FreeAtom(ctx, atom);
 	JS_FreeValue(ctx, value);
 	return success;
 }
@@ -2254,7 +2934,7 @@ const ECMAClassInfo *QuickJSBinder::parse_ecma_class(const String &p_code, const
 		}
 	}
 	ECMAScriptScriptError err;
-	ModuleCache *mc = js_compile_and_cache_module(ctx, p_code, p_path, r_error);
+	ModuleCache *mc = js_compile_and_cache_module(ctx, p_code, p_path, r_error, true);
 	return parse_ecma_class_from_module(mc, p_path, r_error);
 }
 
@@ -2353,11 +3033,149 @@ JSValue QuickJSBinder::worker_post_message(JSContext *ctx, JSValue this_val, int
 	QuickJSBinder *host = QuickJSBinder::get_context_binder(ctx);
 	if (ECMAScriptGCHandler *bind = static_cast<ECMAScriptGCHandler *>(JS_GetOpaque(this_val, host->worker_class_data.class_id))) {
 		QuickJSWorker *worker = static_cast<QuickJSWorker *>(bind->native_ptr);
-		worker->post_message_from_host(var_to_variant(ctx, argv[0]));
+		Variant message;
+		if (!transfer_message(ctx, argv[0], argc > 1 ? argv[1] : JS_UNDEFINED, message)) {
+			return JS_EXCEPTION;
+		}
+		worker->post_message_from_host(message);
 	}
 	return JS_UNDEFINED;
 }
 
+bool QuickJSBinder::transfer_message(JSContext *ctx, JSValueConst p_message, JSValueConst p_transfer_list, Variant &r_message) {
+	if (JS_IsUndefined(p_transfer_list)) {
+		r_message = var_to_variant(ctx, p_message);
+		return true;
+	}
+
+	int length = get_js_array_length(ctx, p_transfer_list);
+	if (length < 0) {
+		JS_ThrowTypeError(ctx, "transfer list must be an array");
+		return false;
+	}
+	Vector<JSValue> values;
+	values.resize(length);
+	for (int i = 0; i < length; i++) {
+		values.write[i] = JS_GetPropertyUint32(ctx, p_transfer_list, i);
+	}
+
+	// Check every value before detaching anything, a typed array owns the same storage as its buffer
+	bool valid = true;
+	Set<const void *> owners;
+	Vector<JSValue> buffers;
+	for (int i = 0; i < length && valid; i++) {
+		const JSValue &value = values[i];
+		const void *owner = NULL;
+		if (JS_IsArrayBuffer(value) || JS_IsTypedArray(value)) {
+			JSValue buffer = JS_IsTypedArray(value) ? JS_GetTypedArrayBuffer(ctx, value, NULL, NULL, NULL) : JS_DupValue(ctx, value);
+			if (JS_IsException(buffer)) {
+				valid = false;
+				break;
+			}
+			buffers.push_back(buffer);
+			if (JS_IsSharedArrayBuffer(buffer)) {
+				JS_ThrowTypeError(ctx, "a SharedArrayBuffer is shared, it cannot be transferred");
+				valid = false;
+				break;
+			}
+			// Throws for detached buffers and the ones which do not own their data
+			valid = JS_CheckTransferableArrayBuffer(ctx, buffer) == 0;
+			if (!valid) break;
+			owner = JS_VALUE_GET_PTR(buffer);
+		} else {
+			ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, value);
+			valid = bind && bind->type >= Variant::PACKED_BYTE_ARRAY && bind->type < Variant::VARIANT_MAX;
+			if (!valid) {
+				JS_ThrowTypeError(ctx, "only ArrayBuffers, typed arrays and packed arrays can be transferred");
+				break;
+			}
+			owner = bind;
+		}
+		if (owners.has(owner)) {
+			JS_ThrowTypeError(ctx, "the transfer list contains the same value more than once");
+			valid = false;
+		} else {
+			owners.insert(owner);
+		}
+	}
+
+	QuickJSBinder *binder = get_context_binder(ctx);
+	List<ECMAScriptGCHandler *> packed_arrays;
+	Vector<Ref<QuickJSTransferredBuffer> > transferred;
+	if (valid) {
+		for (int i = 0; i < length; i++) {
+			if (ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, values[i])) {
+				packed_arrays.push_back(bind);
+			}
+		}
+		// The message is converted before the buffers are detached so its typed arrays still know their buffer
+		for (int i = 0; i < buffers.size(); i++) {
+			Ref<QuickJSTransferredBuffer> buffer;
+			buffer.instantiate();
+			transferred.push_back(buffer);
+			binder->transferred_values.set(JS_VALUE_GET_PTR(buffers[i]), buffer);
+		}
+		r_message = var_to_variant(ctx, p_message);
+		// Converting the message may run script code, nothing is detached unless every buffer can still be
+		for (int i = 0; i < buffers.size() && valid; i++) {
+			valid = JS_CheckTransferableArrayBuffer(ctx, buffers[i]) == 0;
+		}
+		for (int i = 0; i < buffers.size() && valid; i++) {
+			valid = transferred.write[i]->detach(ctx, buffers[i]);
+		}
+		if (!valid) {
+			r_message = Variant();
+		}
+	}
+
+	if (valid) {
+		// The message holds the only other reference to the storage, the receiver can then use it without copy
+		for (List<ECMAScriptGCHandler *>::Element *E = packed_arrays.front(); E; E = E->next()) {
+			ECMAScriptGCHandler *bind = E->get();
+			switch (bind->type) {
+				case Variant::PACKED_BYTE_ARRAY:
+					*bind->getPackedByteArray() = PackedByteArray();
+					break;
+				case Variant::PACKED_INT32_ARRAY:
+					*bind->getPackedInt32Array() = PackedInt32Array();
+					break;
+				case Variant::PACKED_INT64_ARRAY:
+					*bind->getPackedInt64Array() = PackedInt64Array();
+					break;
+				case Variant::PACKED_FLOAT32_ARRAY:
+					*bind->getPackedFloat32Array() = PackedFloat32Array();
+					break;
+				case Variant::PACKED_FLOAT64_ARRAY:
+					*bind->getPackedFloat64Array() = PackedFloat64Array();
+					break;
+				case Variant::PACKED_STRING_ARRAY:
+					*bind->getPackedStringArray() = PackedStringArray();
+					break;
+				case Variant::PACKED_VECTOR2_ARRAY:
+					*bind->getPackedVector2Array() = PackedVector2Array();
+					break;
+				case Variant::PACKED_VECTOR3_ARRAY:
+					*bind->getPackedVector3Array() = PackedVector3Array();
+					break;
+				case Variant::PACKED_COLOR_ARRAY:
+					*bind->getPackedColorArray() = PackedColorArray();
+					break;
+				default:
+					break;
+			}
+		}
+	}
+
+	binder->transferred_values.clear();
+	for (int i = 0; i < length; i++) {
+		JS_FreeValue(ctx, values[i]);
+	}
+	for (int i = 0; i < buffers.size(); i++) {
+		JS_FreeValue(ctx, buffers[i]);
+	}
+	return valid;
+}
+
 JSValue QuickJSBinder::worker_terminate(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
 	QuickJSBinder *host = QuickJSBinder::get_context_binder(ctx);
 	if (ECMAScriptGCHandler *bind = static_cast<ECMAScriptGCHandler *>(JS_GetOpaque(this_val, host->worker_class_data.class_id))) {
@@ -2403,6 +3221,21 @@ JSValue QuickJSBinder::godot_abandon_value(JSContext *ctx, JSValue this_val, int
 	return JS_NewInt64(ctx, id);
 }
 
+JSValue QuickJSBinder::godot_get_builtin_pool_stats(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	QuickJSBinder *binder = get_context_binder(ctx);
+	return variant_to_var(ctx, binder->builtin_binder.get_handle_pool_stats());
+}
+
+JSValue QuickJSBinder::godot_get_scheduler_stats(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	QuickJSBinder *binder = get_context_binder(ctx);
+	return variant_to_var(ctx, binder->get_scheduler_stats());
+}
+
+JSValue QuickJSBinder::godot_get_call_cache_stats(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	QuickJSBinder *binder = get_context_binder(ctx);
+	return variant_to_var(ctx, binder->get_call_cache_stats());
+}
+
 JSValue QuickJSBinder::godot_adopt_value(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
 	ERR_FAIL_COND_V(argc != 1 || !JS_IsNumber(argv[0]), JS_ThrowTypeError(ctx, "value id expected"));
 	int64_t id = js_to_int64(ctx, argv[0]);
@@ -2452,6 +3285,112 @@ void QuickJSBinder::add_global_worker() {
 	JS_DefinePropertyValueStr(ctx, global_object, "Worker", worker_class_data.constructor, PROP_DEF_DEFAULT);
 }
 
+JSValue QuickJSBinder::worker_pool_constructor(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	ERR_FAIL_COND_V(argc > 0 && !JS_IsUndefined(argv[0]) && !JS_IsNumber(argv[0]), JS_ThrowTypeError(ctx, "thread count expected for argument #0"));
+	QuickJSBinder *host = QuickJSBinder::get_context_binder(ctx);
+
+	// One thread per processor unless specified
+	int thread_count = argc > 0 && JS_IsNumber(argv[0]) ? int(js_to_int64(ctx, argv[0])) : 0;
+	QuickJSWorkerPool *pool = memnew(QuickJSWorkerPool);
+	pool->start(thread_count);
+	JSValue obj = JS_NewObjectProtoClass(ctx, host->worker_pool_class_data.prototype, host->worker_pool_class_data.class_id);
+
+	ECMAScriptGCHandler *data = host->new_gc_handler(ctx);
+	data->native_ptr = pool;
+	data->ecma_object = JS_VALUE_GET_PTR(obj);
+	JS_SetOpaque(obj, data);
+	host->worker_pools.push_back(data);
+
+	return obj;
+}
+
+void QuickJSBinder::worker_pool_finalizer(JSRuntime *rt, JSValue val) {
+	QuickJSBinder *host = QuickJSBinder::get_runtime_binder(rt);
+	if (ECMAScriptGCHandler *bind = static_cast<ECMAScriptGCHandler *>(JS_GetOpaque(val, host->worker_pool_class_data.class_id))) {
+		QuickJSWorkerPool *pool = static_cast<QuickJSWorkerPool *>(bind->native_ptr);
+		pool->stop();
+		pool->clear_pending_tasks(rt);
+		if (List<ECMAScriptGCHandler *>::Element *E = host->worker_pools.find(bind)) {
+			host->worker_pools.erase(E);
+		}
+		memdelete(pool);
+		memdelete(bind);
+	}
+}
+
+JSValue QuickJSBinder::worker_pool_run(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	ERR_FAIL_COND_V(argc < 2 || !JS_IsString(argv[0]) || !JS_IsString(argv[1]), JS_ThrowTypeError(ctx, "module path and export name expected for argument #0 and #1"));
+	QuickJSBinder *host = QuickJSBinder::get_context_binder(ctx);
+	ECMAScriptGCHandler *bind = static_cast<ECMAScriptGCHandler *>(JS_GetOpaque(this_val, host->worker_pool_class_data.class_id));
+	ERR_FAIL_NULL_V(bind, JS_ThrowTypeError(ctx, "WorkerPool expected for this"));
+	QuickJSWorkerPool *pool = static_cast<QuickJSWorkerPool *>(bind->native_ptr);
+	ERR_FAIL_COND_V(!pool->is_running(), JS_ThrowTypeError(ctx, "the worker pool is terminated"));
+
+	Array arguments;
+	if (argc > 2 && !JS_IsUndefined(argv[2])) {
+		ERR_FAIL_COND_V(get_js_array_length(ctx, argv[2]) < 0, JS_ThrowTypeError(ctx, "array expected for argument #2"));
+		arguments = var_to_variant(ctx, argv[2]);
+	}
+	// Resolved by the host so the pool threads load the module by its file
+	String module = resolve_module_file(js_to_string(ctx, argv[0]));
+	if (module.is_empty()) {
+		return JS_ThrowReferenceError(ctx, "Failed to resolve module: '%s'", js_to_string(ctx, argv[0]).utf8().get_data());
+	}
+	return pool->run(ctx, module, js_to_string(ctx, argv[1]), arguments);
+}
+
+JSValue QuickJSBinder::worker_pool_terminate(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	QuickJSBinder *host = QuickJSBinder::get_context_binder(ctx);
+	if (ECMAScriptGCHandler *bind = static_cast<ECMAScriptGCHandler *>(JS_GetOpaque(this_val, host->worker_pool_class_data.class_id))) {
+		QuickJSWorkerPool *pool = static_cast<QuickJSWorkerPool *>(bind->native_ptr);
+		if (List<ECMAScriptGCHandler *>::Element *E = host->worker_pools.find(bind)) {
+			host->worker_pools.erase(E);
+		}
+		pool->stop();
+		// Settles the tasks finished before the threads stopped, the others are rejected
+		pool->poll(ctx);
+		pool->reject_pending_tasks(ctx, "WorkerPool terminated");
+	}
+	return JS_UNDEFINED;
+}
+
+JSValue QuickJSBinder::worker_pool_get_metrics(JSContext *ctx, JSValue this_val, int argc, JSValue *argv) {
+	QuickJSBinder *host = QuickJSBinder::get_context_binder(ctx);
+	ECMAScriptGCHandler *bind = static_cast<ECMAScriptGCHandler *>(JS_GetOpaque(this_val, host->worker_pool_class_data.class_id));
+	ERR_FAIL_NULL_V(bind, JS_ThrowTypeError(ctx, "WorkerPool expected for this"));
+	return variant_to_var(ctx, static_cast<QuickJSWorkerPool *>(bind->native_ptr)->get_metrics());
+}
+
+void QuickJSBinder::add_godot_worker_pool() {
+	worker_pool_class_data.gdclass = NULL;
+	worker_pool_class_data.class_id = 0;
+	worker_pool_class_data.base_class = NULL;
+	worker_pool_class_data.class_name = "WorkerPool";
+	worker_pool_class_data.jsclass.class_name = "WorkerPool";
+	worker_pool_class_data.jsclass.finalizer = worker_pool_finalizer;
+	worker_pool_class_data.jsclass.exotic = NULL;
+	worker_pool_class_data.jsclass.gc_mark = NULL;
+	worker_pool_class_data.jsclass.call = NULL;
+	worker_pool_class_data.prototype = JS_NewObject(ctx);
+	worker_pool_class_data.constructor = JS_NewCFunction2(ctx, worker_pool_constructor, worker_pool_class_data.jsclass.class_name, 1, JS_CFUNC_constructor, 0);
+
+	// WorkerPool.prototype.run
+	JSValue run_func = JS_NewCFunction(ctx, worker_pool_run, "run", 3);
+	JS_DefinePropertyValueStr(ctx, worker_pool_class_data.prototype, "run", run_func, PROP_DEF_DEFAULT);
+	// WorkerPool.prototype.terminate
+	JSValue terminate_func = JS_NewCFunction(ctx, worker_pool_terminate, "terminate", 0);
+	JS_DefinePropertyValueStr(ctx, worker_pool_class_data.prototype, "terminate", terminate_func, PROP_DEF_DEFAULT);
+	// WorkerPool.prototype.get_metrics
+	JSValue get_metrics_func = JS_NewCFunction(ctx, worker_pool_get_metrics, "get_metrics", 0);
+	JS_DefinePropertyValueStr(ctx, worker_pool_class_data.prototype, "get_metrics", get_metrics_func, PROP_DEF_DEFAULT);
+
+	JS_NewClassID(&worker_pool_class_data.class_id);
+	JS_NewClass(JS_GetRuntime(ctx), worker_pool_class_data.class_id, &worker_pool_class_data.jsclass);
+	JS_SetClassProto(ctx, worker_pool_class_data.class_id, worker_pool_class_data.prototype);
+	JS_SetConstructor(ctx, worker_pool_class_data.constructor, worker_pool_class_data.prototype);
+	JS_DefinePropertyValueStr(ctx, godot_object, "WorkerPool", worker_pool_class_data.constructor, PROP_DEF_DEFAULT);
+}
+
 /********************************* END Worker **********************************/
 
 bool QuickJSBinder::validate(const String &p_code, const String &p_path, ECMAScriptScriptError *r_error) {
@@ -9,6 +9,7 @@
 #endif
 
 #include "core/os/memory.h"
+#include "core/os/mutex.h"
 #include "core/os/thread.h"
 #include "core/io/resource.h"
 #include "quickjs_builtin_binder.h"
@@ -29,6 +30,8 @@ class QuickJSBinder : public ECMAScriptBinder {
 
 	friend class QuickJSBuiltinBinder;
 	friend class QuickJSWorker;
+	friend class QuickJSAOTCompiler;
+	friend struct GodotMethodArguments;
 	QuickJSBuiltinBinder builtin_binder;
 
 private:
@@ -133,8 +136,9 @@ protected:
 
 	static String resolve_module_file(const String &file);
 	static JSModuleDef *js_module_loader(JSContext *ctx, const char *module_name, void *opaque);
+	static int js_module_prefetch(JSContext *ctx, const char *module_name, JSValueConst resume_func, void *opaque);
 	static JSModuleDef *js_make_module(JSContext *ctx, const String &p_id, const JSValueConst &p_value);
-	ModuleCache *js_compile_and_cache_module(JSContext *ctx, const String &p_code, const String &p_filename, ECMAScriptScriptError *r_error);
+	ModuleCache *js_compile_and_cache_module(JSContext *ctx, const String &p_code, const String &p_filename, ECMAScriptScriptError *r_error, bool p_persist = false);
 	ModuleCache *js_compile_and_cache_module(JSContext *ctx, const Vector<uint8_t> &p_bytecode, const String &p_filename, ECMAScriptScriptError *r_error);
 	ModuleCache js_compile_module(JSContext *ctx, const String &p_code, const String &p_filename, ECMAScriptScriptError *r_error);
 	static Error js_evalute_module(JSContext *ctx, ModuleCache *p_module, ECMAScriptScriptError *r_error);
@@ -156,25 +160,135 @@ protected:
 	HashMap<StringName, const ClassBindData *> classname_bindings;
 	HashMap<String, ModuleCache> module_cache;
 	HashMap<String, CommonJSModule> commonjs_module_cache;
+	// Dynamic imports waiting for the threaded resource loader
+	struct PendingImport {
+		String file;
+		JSValue resume_func;
+	};
+	List<PendingImport> pending_imports;
+	HashMap<String, RES> prefetched_modules;
+	void poll_pending_imports();
 	ClassBindData worker_class_data;
 	List<ECMAScriptGCHandler *> workers;
+	ClassBindData worker_pool_class_data;
+	List<ECMAScriptGCHandler *> worker_pools;
+
+	// Lanes of the callbacks queued with scheduler.postTask and requestIdleCallback
+	enum TaskPriority {
+		TASK_PRIORITY_USER_BLOCKING, // Run every frame whatever the budget
+		TASK_PRIORITY_USER_VISIBLE, // Run within the frame budget, carried over to the next frame otherwise
+		TASK_PRIORITY_BACKGROUND, // Run with the budget left after the animation frame callbacks
+		TASK_PRIORITY_MAX,
+	};
+	enum {
+		// The clock is read once per batch of jobs
+		JOB_BATCH_SIZE = 32,
+		// Longest idle period given to the idle callbacks, as in browsers
+		MAX_IDLE_PERIOD_USEC = 50000,
+	};
+	struct ScheduledTask {
+		int64_t id = 0;
+		JSValue callback;
+		// Settled with the result of the postTask callbacks, undefined for the idle callbacks
+		JSValue resolving_funcs[2] = { JS_UNDEFINED, JS_UNDEFINED };
+		// Time after which an idle callback runs even without budget left, 0 without timeout
+		uint64_t timeout = 0;
+	};
+	List<ScheduledTask> task_lanes[TASK_PRIORITY_MAX];
+	// Tasks taken from a lane by the running frame, cancelled idle callbacks are only marked there
+	List<ScheduledTask> *running_tasks = NULL;
+	int64_t last_idle_callback_id = 0;
+	// 0 runs every pending job in the frame which queued it
+	uint64_t frame_budget_usec = 0;
+	uint64_t idle_deadline = 0;
+	struct SchedulerStats {
+		uint64_t frame_usec = 0;
+		uint64_t executed_jobs = 0;
+		uint64_t deferred_jobs = 0;
+		uint64_t executed_tasks = 0;
+		uint64_t deferred_tasks = 0;
+	};
+	SchedulerStats scheduler_stats;
+	uint64_t total_deferred_jobs = 0;
+	uint64_t total_deferred_tasks = 0;
+	void execute_pending_jobs(uint64_t p_deadline);
+	void run_scheduled_tasks(TaskPriority p_priority, uint64_t p_deadline);
+	void run_scheduled_task(ScheduledTask &p_task, bool p_did_timeout);
+	void clear_scheduled_tasks();
+	_FORCE_INLINE_ bool has_scheduled_tasks() const {
+		for (int i = 0; i < TASK_PRIORITY_MAX; i++) {
+			if (!task_lanes[i].is_empty()) return true;
+		}
+		return false;
+	}
+	Dictionary get_scheduler_stats() const;
 	Vector<MethodBind *> godot_methods;
+	// Argument and return types of the methods which can be called with ptrcall, indexed like godot_methods
+	struct PtrcallSignature {
+		bool enabled = false;
+		bool has_return = false;
+		Variant::Type return_type = Variant::NIL; // NIL for Variant
+		Vector<Variant::Type> argument_types; // NIL for Variant
+	};
+	Vector<PtrcallSignature> godot_ptrcall_signatures;
+	static PtrcallSignature get_ptrcall_signature(const MethodBind *p_method);
+	static bool prepare_ptrcall_arguments(const PtrcallSignature &p_signature, Variant *p_arguments, int p_argc);
 	int internal_godot_method_id;
 	Vector<const ClassDB::PropertySetGet *> godot_object_indexed_properties;
 	int internal_godot_indexed_property_id;
 	const ECMAScriptGCHandler *lastest_allocated_object = NULL;
 
+	enum {
+		DICTIONARY_KEY_ATOM_CACHE_SIZE = 4096,
+	};
+	HashMap<String, JSAtom> dictionary_key_atoms;
+	JSAtom get_dictionary_key_atom(const String &p_key);
+	void clear_dictionary_key_atoms();
+
+	enum {
+		ATOM_CACHE_SIZE = 4096,
+	};
+	HashMap<StringName, JSAtom> atom_cache;
+	uint64_t atom_cache_hits = 0;
+	uint64_t atom_cache_misses = 0;
+	JSAtom get_cached_atom(const StringName &p_name);
+	void clear_atom_cache();
+
+	enum {
+		// Enough for calls with the maximum argument count nested 8 times
+		ARGUMENT_STACK_SIZE = MAX_ARGUMENT_COUNT * 8,
+	};
+	// Arguments of the engine calls made from scripts
+	Variant argument_stack[ARGUMENT_STACK_SIZE];
+	const Variant *argument_pointers[ARGUMENT_STACK_SIZE];
+	int argument_stack_top = 0;
+
+	// Profiler entries of the engine methods, indexed like godot_methods
+	Vector<ECMAScriptProfiler::Function *> godot_method_profiles;
+	ECMAScriptProfiler::Function *get_method_profile(const ECMAClassInfo *p_class, const StringName &p_method);
+	ECMAScriptProfiler::Function *get_godot_method_profile(int p_method_id);
+
 #if NO_MODULE_EXPORT_SUPPORT
 	String parsing_script_file;
 #endif
 
 	JSClassID register_class(const ClassDB::ClassInfo *p_cls);
+	const ClassBindData *bind_class(const ClassDB::ClassInfo *p_cls);
+	const ClassBindData *get_class_binding(const StringName &p_class);
+	static JSValue godot_lazy_class_getter(JSContext *ctx, JSValueConst this_val, int magic);
+
+	// Classes bound on the first access of godot.<Class> in lazy class binding mode
+	bool lazy_class_binding;
+	Vector<const ClassDB::ClassInfo *> lazy_classes;
+	Vector<CharString> lazy_class_names;
+	Vector<JSCFunctionListEntry> lazy_class_entries;
 	void add_godot_origin();
 	void add_godot_classes();
 	void add_godot_globals();
 	void add_global_console();
 	void add_global_properties();
 	void add_global_worker();
+	void add_godot_worker_pool();
 
 	static JSValue object_constructor(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int class_id);
 	static void initialize_properties(JSContext *ctx, const ECMAClassInfo *p_class, JSValue p_object);
@@ -183,7 +297,6 @@ protected:
 	static void origin_finalizer(JSRuntime *rt, JSValue val);
 
 	static JSValue object_free(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
-	static JSValue object_method(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int method_id);
 	static JSValue object_indexed_property(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int property_id);
 	static JSValue godot_to_string(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
 	static JSValue godot_get_type(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
@@ -207,13 +320,29 @@ protected:
 	static JSValue console_functions(JSContext *ctx, JSValue this_val, int argc, JSValue *argv, int magic);
 	static JSValue global_request_animation_frame(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
 	static JSValue global_cancel_animation_frame(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue global_request_idle_callback(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue global_cancel_idle_callback(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue idle_deadline_time_remaining(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue scheduler_post_task(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
 
 	static JSValue worker_constructor(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
 	static void worker_finializer(JSRuntime *rt, JSValue val);
 	static JSValue worker_post_message(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
 	static JSValue worker_terminate(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue worker_pool_constructor(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static void worker_pool_finalizer(JSRuntime *rt, JSValue val);
+	static JSValue worker_pool_run(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue worker_pool_terminate(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue worker_pool_get_metrics(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	// Converts a worker message, the values of the transfer list are moved to the receiver instead of copied
+	static bool transfer_message(JSContext *ctx, JSValueConst p_message, JSValueConst p_transfer_list, Variant &r_message);
+	// Transferred values of the message being converted, keyed by their JavaScript object
+	HashMap<const void *, Variant, PtrHasher> transferred_values;
 	static JSValue godot_abandon_value(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
 	static JSValue godot_adopt_value(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue godot_get_builtin_pool_stats(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue godot_get_call_cache_stats(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
+	static JSValue godot_get_scheduler_stats(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
 
 	_FORCE_INLINE_ static JSValue js_empty_func(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) { return JS_UNDEFINED; }
 	_FORCE_INLINE_ static JSValue js_empty_consturctor(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) { return JS_NewObject(ctx); }
@@ -224,6 +353,12 @@ protected:
 
 	static JSAtom get_atom(JSContext *ctx, const StringName &p_key);
 	static HashMap<uint64_t, Variant> transfer_deopot;
+	// Bytecode of the binding script compiled by the first context and shared by the others
+	// Written once under binding_script_mutex, then only read without locking
+	static Vector<uint8_t> binding_script_bytecode;
+	static SafeFlag binding_script_compiled;
+	static Mutex binding_script_mutex;
+	Error eval_binding_script(String &r_error, ECMAScriptGCHandler &r_ret);
 	static Map<String, const char *> class_remap;
 #ifdef TOOLS_ENABLED
 	Dictionary modified_api;
@@ -246,6 +381,17 @@ public:
 
 	static Dictionary js_to_dictionary(JSContext *ctx, const JSValueConst &p_val, List<void *> &stack);
 
+	_FORCE_INLINE_ static bool js_to_number_fast(const JSValueConst &p_val, real_t &r_val) {
+		const int32_t tag = JS_VALUE_GET_TAG(p_val);
+		if (tag == JS_TAG_INT) {
+			r_val = real_t(JS_VALUE_GET_INT(p_val));
+			return true;
+		} else if (JS_TAG_IS_FLOAT64(tag)) {
+			r_val = real_t(JS_VALUE_GET_FLOAT64(p_val));
+			return true;
+		}
+		return false;
+	}
 	_FORCE_INLINE_ static real_t js_to_number(JSContext *ctx, const JSValueConst &p_val) {
 		double_t v = 0;
 		JS_ToFloat64(ctx, &v, p_val);
@@ -323,6 +469,34 @@ public:
 	_FORCE_INLINE_ const ClassBindData get_origin_class() const { return godot_origin_class; }
 	_FORCE_INLINE_ static JSClassID get_origin_class_id(JSContext *ctx) { return get_context_binder(ctx)->godot_origin_class.class_id; }
 
+	// Typed method of a hot engine class generated from the engine documentation by builtin_binding_generator.py
+	struct EngineMethodThunk {
+		enum {
+			MAX_ARGUMENT_COUNT = 8,
+		};
+		const char *class_name;
+		const char *method;
+		JSCFunctionMagic *function;
+		bool has_return;
+		Variant::Type return_type;
+		int argument_count;
+		Variant::Type argument_types[MAX_ARGUMENT_COUNT];
+
+		// The documentation may come from another engine version than the one running
+		bool matches(const MethodBind *p_method) const;
+	};
+	static const EngineMethodThunk *find_engine_method_thunk(const char *p_class, const char *p_method);
+	static JSValue object_method(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int method_id);
+	_FORCE_INLINE_ MethodBind *get_godot_method(int p_method_id) const { return godot_methods[p_method_id]; }
+	// Object called by a thunk, NULL when the call must go through object_method
+	_FORCE_INLINE_ static Object *get_thunk_receiver(JSContext *ctx, JSValueConst p_this) {
+		ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, p_this);
+		if (bind == NULL || bind->godot_object == NULL || unlikely(get_context_binder(ctx)->get_profiler().is_profiling())) {
+			return NULL;
+		}
+		return bind->get_godot_object();
+	}
+
 	virtual void initialize() override;
 	virtual void uninitialize() override;
 	virtual void language_finalize() override;
@@ -350,13 +524,15 @@ public:
 	const ECMAClassInfo *parse_ecma_class_from_module(ModuleCache *p_module, const String &p_path, ECMAScriptScriptError *r_error);
 
 	virtual ECMAScriptGCHandler create_ecma_instance_for_godot_object(const ECMAClassInfo *p_class, Object *p_object) override;
-	virtual Variant call_method(const ECMAScriptGCHandler &p_object, const StringName &p_method, const Variant **p_args, int p_argcount, Callable::CallError &r_error) override;
+	virtual Variant call_method(const ECMAScriptGCHandler &p_object, const ECMAClassInfo *p_class, const StringName &p_method, const Variant **p_args, int p_argcount, Callable::CallError &r_error) override;
 	virtual bool get_instance_property(const ECMAScriptGCHandler &p_object, const StringName &p_name, Variant &r_ret) override;
 	virtual bool set_instance_property(const ECMAScriptGCHandler &p_object, const StringName &p_name, const Variant &p_value) override;
 	virtual bool has_method(const ECMAScriptGCHandler &p_object, const StringName &p_name) override;
 	virtual bool has_signal(const ECMAClassInfo *p_class, const StringName &p_signal) override;
 	virtual bool validate(const String &p_code, const String &p_path, ECMAScriptScriptError *r_error) override;
 
+	Dictionary get_call_cache_stats() const;
+
 #ifdef TOOLS_ENABLED
 	virtual const Dictionary &get_modified_api() const override { return modified_api; }
 #endif
@@ -4,112 +4,168 @@
 #include "quickjs_binder.h"
 #include <core/io/compression.h>
 #include <core/os/memory.h>
+#include <core/os/os.h>
 
 QuickJSBuiltinBinder::QuickJSBuiltinBinder() {
 	ctx = NULL;
 	builtin_class_map = memnew_arr(BuiltinClass, Variant::VARIANT_MAX);
+	handle_pools = memnew_arr(HandlePool, Variant::VARIANT_MAX);
+	for (int i = 0; i < Variant::VARIANT_MAX; i++) {
+		HandlePool &pool = handle_pools[i];
+		pool.element_size = 0;
+		pool.free_list = NULL;
+		pool.live_count = 0;
+		pool.allocation_count = 0;
+	}
+	last_stats_ticks = 0;
+	last_stats_allocations = 0;
 }
 
 QuickJSBuiltinBinder::~QuickJSBuiltinBinder() {
+	clear_handle_pools();
+	memdelete_arr(handle_pools);
 	memdelete_arr(builtin_class_map);
 }
 
+void QuickJSBuiltinBinder::setup_handle_pool(Variant::Type p_type, size_t p_payload_size) {
+	HandlePool &pool = handle_pools[p_type];
+	// keep every payload in the slab aligned as memalloc would do
+	const size_t align = 16;
+	pool.element_size = (sizeof(ECMAScriptGCHandler) + p_payload_size + align - 1) & ~(align - 1);
+}
+
+void *QuickJSBuiltinBinder::alloc_handle(Variant::Type p_type) {
+	HandlePool &pool = handle_pools[p_type];
+	ERR_FAIL_COND_V(pool.element_size == 0, NULL);
+	if (pool.free_list == NULL) {
+		uint8_t *slab = static_cast<uint8_t *>(memalloc(pool.element_size * HandlePool::ELEMENTS_PER_SLAB));
+		ERR_FAIL_NULL_V(slab, NULL);
+		pool.slabs.push_back(slab);
+		for (int i = HandlePool::ELEMENTS_PER_SLAB - 1; i >= 0; i--) {
+			HandlePool::FreeNode *node = reinterpret_cast<HandlePool::FreeNode *>(slab + i * pool.element_size);
+			node->next = pool.free_list;
+			pool.free_list = node;
+		}
+	}
+	HandlePool::FreeNode *node = pool.free_list;
+	pool.free_list = node->next;
+	pool.live_count++;
+	pool.allocation_count++;
+	return node;
+}
+
+void QuickJSBuiltinBinder::free_handle(Variant::Type p_type, void *p_handle) {
+	HandlePool &pool = handle_pools[p_type];
+	HandlePool::FreeNode *node = static_cast<HandlePool::FreeNode *>(p_handle);
+	node->next = pool.free_list;
+	pool.free_list = node;
+	pool.live_count--;
+}
+
+void QuickJSBuiltinBinder::clear_handle_pools() {
+	for (int i = 0; i < Variant::VARIANT_MAX; i++) {
+		HandlePool &pool = handle_pools[i];
+		for (int j = 0; j < pool.slabs.size(); j++) {
+			memfree(pool.slabs[j]);
+		}
+		pool.slabs.clear();
+		pool.free_list = NULL;
+		pool.live_count = 0;
+	}
+}
+
+Dictionary QuickJSBuiltinBinder::get_handle_pool_stats() {
+	const uint64_t now = OS::get_singleton()->get_ticks_usec();
+	uint64_t allocations = 0;
+	Dictionary types;
+	for (int i = 0; i < Variant::VARIANT_MAX; i++) {
+		const HandlePool &pool = handle_pools[i];
+		allocations += pool.allocation_count;
+		if (pool.slabs.is_empty()) continue;
+		const uint64_t capacity = uint64_t(pool.slabs.size()) * HandlePool::ELEMENTS_PER_SLAB;
+		Dictionary stats;
+		stats["live"] = pool.live_count;
+		stats["slabs"] = pool.slabs.size();
+		stats["capacity"] = capacity;
+		stats["occupancy"] = double(pool.live_count) / double(capacity);
+		stats["allocations"] = pool.allocation_count;
+		types[Variant::get_type_name(Variant::Type(i))] = stats;
+	}
+	Dictionary ret;
+	ret["types"] = types;
+	ret["allocations"] = allocations;
+	// allocations per second since the previous query
+	const double elapsed = last_stats_ticks ? (now - last_stats_ticks) / 1000000.0 : 0.0;
+	ret["allocation_rate"] = elapsed > 0 ? (allocations - last_stats_allocations) / elapsed : 0.0;
+	last_stats_ticks = now;
+	last_stats_allocations = allocations;
+	return ret;
+}
+
 void QuickJSBuiltinBinder::bind_builtin_object(JSContext *ctx, JSValue target, Variant::Type p_type, const void *p_object) {
 
-	void *ptr = NULL;
-	ECMAScriptGCHandler *bind = NULL;
+	QuickJSBuiltinBinder &builtin_binder = QuickJSBinder::get_context_binder(ctx)->get_builtin_binder();
+	void *ptr = builtin_binder.alloc_handle(p_type);
+	ERR_FAIL_NULL(ptr);
+	ECMAScriptGCHandler *bind = memnew_placement(ptr, ECMAScriptGCHandler);
 	switch (p_type) {
 		case Variant::VECTOR2:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Vector2));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Vector2(*static_cast<const Vector2 *>(p_object)));
 			break;
 		case Variant::RECT2:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Rect2));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Rect2(*static_cast<const Rect2 *>(p_object)));
 			break;
 		case Variant::COLOR:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Color));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Color(*static_cast<const Color *>(p_object)));
 			break;
 		case Variant::VECTOR3:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Vector3));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Vector3(*static_cast<const Vector3 *>(p_object)));
 			break;
 		case Variant::BASIS:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Basis));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Basis(*static_cast<const Basis *>(p_object)));
 			break;
 		case Variant::QUATERNION:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Quaternion));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Quaternion(*static_cast<const Quaternion *>(p_object)));
 			break;
 		case Variant::PLANE:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Plane));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Plane(*static_cast<const Plane *>(p_object)));
 			break;
 		case Variant::TRANSFORM2D:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Transform2D));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Transform2D(*static_cast<const Transform2D *>(p_object)));
 			break;
 		case Variant::RID:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(RID));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, RID(*static_cast<const RID *>(p_object)));
 			break;
 		case Variant::TRANSFORM3D:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(Transform3D));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, Transform3D(*static_cast<const Transform3D *>(p_object)));
 			break;
 		case Variant::AABB:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(AABB));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, AABB(*static_cast<const AABB *>(p_object)));
 			break;
 		case Variant::PACKED_INT32_ARRAY:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(PackedInt32Array));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, PackedInt32Array(*static_cast<const PackedInt32Array *>(p_object)));
 			break;
 		case Variant::PACKED_BYTE_ARRAY:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(PackedByteArray));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, PackedByteArray(*static_cast<const PackedByteArray *>(p_object)));
 			break;
 		case Variant::PACKED_FLOAT32_ARRAY:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(PackedFloat32Array));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, PackedFloat32Array(*static_cast<const PackedFloat32Array *>(p_object)));
 			break;
 		case Variant::PACKED_COLOR_ARRAY:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(PackedColorArray));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, PackedColorArray(*static_cast<const PackedColorArray *>(p_object)));
 			break;
 		case Variant::PACKED_STRING_ARRAY:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(PackedStringArray));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, PackedStringArray(*static_cast<const PackedStringArray *>(p_object)));
 			break;
 		case Variant::PACKED_VECTOR2_ARRAY:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(PackedVector2Array));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, PackedVector2Array(*static_cast<const PackedVector2Array *>(p_object)));
 			break;
 		case Variant::PACKED_VECTOR3_ARRAY:
-			ptr = memalloc(sizeof(ECMAScriptGCHandler) + sizeof(PackedVector3Array));
-			bind = memnew_placement(ptr, ECMAScriptGCHandler);
 			memnew_placement(bind + 1, PackedVector3Array(*static_cast<const PackedVector3Array *>(p_object)));
 			break;
 		default:
+			builtin_binder.free_handle(p_type, ptr);
+			bind = NULL;
 			break;
 	}
 	ERR_FAIL_NULL(bind);
@@ -159,7 +215,9 @@ void QuickJSBuiltinBinder::builtin_finalizer(ECMAScriptGCHandler *p_bind) {
 		default:
 			break;
 	}
-	memdelete(p_bind);
+	const Variant::Type type = p_bind->type;
+	p_bind->~ECMAScriptGCHandler();
+	free_handle(type, p_bind);
 }
 
 void QuickJSBuiltinBinder::register_builtin_class(Variant::Type p_type, const char *p_name, JSConstructorFunc p_constructor, int argc) {
@@ -628,6 +686,39 @@ JSValue QuickJSBuiltinBinder::new_object_from(JSContext *ctx, const PackedVector
 	return create_builtin_value(ctx, Variant::PACKED_VECTOR3_ARRAY, &p_val);
 }
 
+// Returns a typed array over the storage of the packed array, which is moved to the view and leaves the packed array empty.
+// The view is the only owner of the storage: it is copied first if the engine still holds a reference to it,
+// so writes through the view are never seen by another array.
+template <class T>
+static JSValue packed_array_as_typed_array(JSContext *ctx, Vector<T> *p_array, JSAtom p_typed_array_class) {
+	JSValue global = JS_GetGlobalObject(ctx);
+	JSValue constructor = JS_GetProperty(ctx, global, p_typed_array_class);
+	JS_FreeValue(ctx, global);
+	JSValue buffer;
+	if (p_array->size()) {
+		Vector<T> *storage = memnew(Vector<T>(*p_array));
+		p_array->clear();
+		storage->ptrw();
+		buffer = JS_NewArrayBuffer(
+				ctx, (uint8_t *)(storage->ptr()), storage->size() * sizeof(T), [](JSRuntime *rt, void *opaque, void *ptr) {
+					memdelete(static_cast<Vector<T> *>(opaque));
+				},
+				storage, false);
+	} else {
+		buffer = JS_NewArrayBufferCopy(ctx, NULL, 0);
+	}
+	JSValue view = JS_CallConstructor(ctx, constructor, 1, &buffer);
+	JS_FreeValue(ctx, buffer);
+	JS_FreeValue(ctx, constructor);
+	return view;
+}
+
+#ifdef REAL_T_IS_DOUBLE
+#define JS_ATOM_RealArray QuickJSBinder::JS_ATOM_Float64Array
+#else
+#define JS_ATOM_RealArray QuickJSBinder::JS_ATOM_Float32Array
+#endif
+
 void QuickJSBuiltinBinder::bind_builtin_propties_manually() {
 
 	{ // Color
@@ -1133,4 +1224,72 @@ void QuickJSBuiltinBinder::bind_builtin_propties_manually() {
 				},
 				0);
 	}
+
+	{ // Packed*Array.prototype.asTypedArray
+		binder->get_builtin_binder().register_method(
+				Variant::PACKED_BYTE_ARRAY,
+				"asTypedArray",
+				[](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) {
+					ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+					return packed_array_as_typed_array(ctx, bind->getPackedByteArray(), QuickJSBinder::JS_ATOM_Uint8Array);
+				},
+				0);
+		binder->get_builtin_binder().register_method(
+				Variant::PACKED_INT32_ARRAY,
+				"asTypedArray",
+				[](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) {
+					ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+					return packed_array_as_typed_array(ctx, bind->getPackedInt32Array(), QuickJSBinder::JS_ATOM_Int32Array);
+				},
+				0);
+		binder->get_builtin_binder().register_method(
+				Variant::PACKED_INT64_ARRAY,
+				"asTypedArray",
+				[](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) {
+					ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+					return packed_array_as_typed_array(ctx, bind->getPackedInt64Array(), QuickJSBinder::JS_ATOM_BigInt64Array);
+				},
+				0);
+		binder->get_builtin_binder().register_method(
+				Variant::PACKED_FLOAT32_ARRAY,
+				"asTypedArray",
+				[](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) {
+					ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+					return packed_array_as_typed_array(ctx, bind->getPackedFloat32Array(), QuickJSBinder::JS_ATOM_Float32Array);
+				},
+				0);
+		binder->get_builtin_binder().register_method(
+				Variant::PACKED_FLOAT64_ARRAY,
+				"asTypedArray",
+				[](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) {
+					ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+					return packed_array_as_typed_array(ctx, bind->getPackedFloat64Array(), QuickJSBinder::JS_ATOM_Float64Array);
+				},
+				0);
+		// vectors and colors are viewed as interleaved components
+		binder->get_builtin_binder().register_method(
+				Variant::PACKED_VECTOR2_ARRAY,
+				"asTypedArray",
+				[](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) {
+					ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+					return packed_array_as_typed_array(ctx, bind->getPackedVector2Array(), JS_ATOM_RealArray);
+				},
+				0);
+		binder->get_builtin_binder().register_method(
+				Variant::PACKED_VECTOR3_ARRAY,
+				"asTypedArray",
+				[](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) {
+					ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+					return packed_array_as_typed_array(ctx, bind->getPackedVector3Array(), JS_ATOM_RealArray);
+				},
+				0);
+		binder->get_builtin_binder().register_method(
+				Variant::PACKED_COLOR_ARRAY,
+				"asTypedArray",
+				[](JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv) {
+					ECMAScriptGCHandler *bind = BINDING_DATA_FROM_JS(ctx, this_val);
+					return packed_array_as_typed_array(ctx, bind->getPackedColorArray(), QuickJSBinder::JS_ATOM_Float32Array);
+				},
+				0);
+	}
 }
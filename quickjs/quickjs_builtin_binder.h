@@ -19,15 +19,39 @@ public:
 		JSClassDef js_class;
 	};
 
+	// Free-list slabs for the handles of one builtin type, the payload is stored right after the handle
+	struct HandlePool {
+		struct FreeNode {
+			FreeNode *next;
+		};
+		enum {
+			ELEMENTS_PER_SLAB = 256,
+		};
+		size_t element_size;
+		FreeNode *free_list;
+		Vector<void *> slabs;
+		uint64_t live_count;
+		uint64_t allocation_count;
+	};
+
 private:
 	QuickJSBinder *binder;
 	JSContext *ctx;
 	BuiltinClass *builtin_class_map;
+	HandlePool *handle_pools;
+	uint64_t last_stats_ticks;
+	uint64_t last_stats_allocations;
 	JSValue to_string_function;
 	JSAtom js_key_to_string;
 
+	void setup_handle_pool(Variant::Type p_type, size_t p_payload_size);
+	void *alloc_handle(Variant::Type p_type);
+	void free_handle(Variant::Type p_type, void *p_handle);
+
 public:
 	void builtin_finalizer(ECMAScriptGCHandler *p_bind);
+	void clear_handle_pools();
+	Dictionary get_handle_pool_stats();
 
 	void register_builtin_class(Variant::Type p_type, const char *p_name, JSConstructorFunc p_constructor, int argc);
 	void register_property(Variant::Type p_type, const char *p_name, JSCFunctionMagic *p_getter, JSCFunctionMagic *p_setter, int magic);
@@ -0,0 +1,64 @@
+#ifndef QUICKJS_MESSAGE_CHANNEL_H
+#define QUICKJS_MESSAGE_CHANNEL_H
+
+#include "core/templates/list.h"
+#include "core/templates/safe_refcount.h"
+
+// Single producer single consumer queue used to move messages between a worker and its host.
+// Messages that do not fit in the ring buffer wait in a list owned by the producer thread
+// until the consumer makes room, so pushing never blocks and never drops a message.
+template <class T, int SIZE_SHIFT = 8>
+class QuickJSMessageChannel {
+	enum {
+		CAPACITY = 1 << SIZE_SHIFT,
+		MASK = CAPACITY - 1,
+	};
+
+	T buffer[CAPACITY];
+	SafeNumeric<uint32_t> read_index; // only written by the consumer
+	SafeNumeric<uint32_t> write_index; // only written by the producer
+	List<T> overflow;
+
+	_FORCE_INLINE_ bool push_ring(const T &p_value) {
+		uint32_t write = write_index.get();
+		if (write - read_index.get() == CAPACITY) return false;
+		buffer[write & MASK] = p_value;
+		write_index.set(write + 1);
+		return true;
+	}
+
+public:
+	// Producer thread only
+	void push(const T &p_value) {
+		if (!flush() || !push_ring(p_value)) {
+			overflow.push_back(p_value);
+		}
+	}
+
+	// Producer thread only, returns false if some messages still wait for room in the ring buffer
+	bool flush() {
+		while (overflow.size()) {
+			if (!push_ring(overflow.front()->get())) return false;
+			overflow.pop_front();
+		}
+		return true;
+	}
+
+	// Producer thread only
+	_FORCE_INLINE_ bool has_overflow() const { return !overflow.is_empty(); }
+
+	// Consumer thread only
+	bool pop(T &r_value) {
+		uint32_t read = read_index.get();
+		if (read == write_index.get()) return false;
+		r_value = buffer[read & MASK];
+		buffer[read & MASK] = T();
+		read_index.set(read + 1);
+		return true;
+	}
+
+	// Consumer thread only
+	_FORCE_INLINE_ bool is_empty() const { return read_index.get() == write_index.get(); }
+};
+
+#endif // QUICKJS_MESSAGE_CHANNEL_H
@@ -0,0 +1,104 @@
+#ifndef QUICKJS_SHARED_BUFFER_H
+#define QUICKJS_SHARED_BUFFER_H
+
+#include "core/object/ref_counted.h"
+#include "core/templates/safe_refcount.h"
+#include "quickjs/quickjs.h"
+#include "quickjs_transferred_buffer.h"
+
+// Backing store of a SharedArrayBuffer posted to another context.
+// Every binder runtime allocates the shared buffers with the reference counted store below,
+// so the receiving context wraps the same memory instead of a copy.
+class QuickJSSharedBuffer : public RefCounted {
+	GDCLASS(QuickJSSharedBuffer, RefCounted);
+
+	// The reference count is stored before the data, the data stays aligned for 64 bits atomics
+	enum {
+		HEADER_SIZE = 16,
+	};
+
+	uint8_t *data = NULL;
+	size_t size = 0;
+	// Name of the typed array constructor when a typed array was posted instead of its buffer
+	String view_class;
+	uint32_t view_offset = 0;
+	uint32_t view_length = 0;
+
+	_FORCE_INLINE_ static SafeNumeric<uint32_t> *get_refcount(void *p_data) {
+		static_assert(sizeof(SafeNumeric<uint32_t>) <= HEADER_SIZE, "The reference count does not fit the header");
+		return reinterpret_cast<SafeNumeric<uint32_t> *>(static_cast<uint8_t *>(p_data) - HEADER_SIZE);
+	}
+
+public:
+	static void *sab_alloc(void *opaque, size_t p_size) {
+		uint8_t *mem = static_cast<uint8_t *>(memalloc(HEADER_SIZE + p_size));
+		ERR_FAIL_NULL_V(mem, NULL);
+		memnew_placement(mem, SafeNumeric<uint32_t>(1));
+		return mem + HEADER_SIZE;
+	}
+
+	static void sab_dup(void *opaque, void *ptr) {
+		get_refcount(ptr)->increment();
+	}
+
+	static void sab_free(void *opaque, void *ptr) {
+		if (get_refcount(ptr)->decrement() == 0) {
+			memfree(static_cast<uint8_t *>(ptr) - HEADER_SIZE);
+		}
+	}
+
+	static const JSSharedArrayBufferFunctions *get_functions() {
+		static const JSSharedArrayBufferFunctions functions = { sab_alloc, sab_free, sab_dup, NULL };
+		return &functions;
+	}
+
+	// Keeps the store of a SharedArrayBuffer or of a typed array over one alive, returns NULL for other values
+	static Ref<QuickJSSharedBuffer> share(JSContext *ctx, JSValueConst p_value) {
+		Ref<QuickJSSharedBuffer> ret;
+		JSValue buffer = JS_UNDEFINED;
+		size_t offset = 0, length = 0, bytes_per_element = 1;
+		if (JS_IsTypedArray(p_value)) {
+			buffer = JS_GetTypedArrayBuffer(ctx, p_value, &offset, &length, &bytes_per_element);
+			if (JS_IsException(buffer)) {
+				JS_FreeValue(ctx, JS_GetException(ctx));
+				return ret;
+			}
+		} else {
+			buffer = JS_DupValue(ctx, p_value);
+		}
+
+		if (JS_IsSharedArrayBuffer(buffer)) {
+			size_t size;
+			uint8_t *data = JS_GetArrayBuffer(ctx, &size, buffer);
+			ret.instantiate();
+			ret->data = data;
+			ret->size = size;
+			sab_dup(NULL, data);
+			if (JS_IsTypedArray(p_value)) {
+				ret->view_class = QuickJSTransferredBuffer::get_view_class(ctx, p_value);
+				ret->view_offset = offset;
+				ret->view_length = length / bytes_per_element;
+			}
+		}
+		JS_FreeValue(ctx, buffer);
+		return ret;
+	}
+
+	// Creates a SharedArrayBuffer or a typed array over the same memory in the receiving context
+	JSValue wrap(JSContext *ctx) const {
+		// The buffer takes its own reference to the store
+		JSValue buffer = JS_NewArrayBuffer(ctx, data, size, NULL, NULL, true);
+		if (view_class.is_empty() || JS_IsException(buffer)) {
+			return buffer;
+		}
+		return QuickJSTransferredBuffer::new_view(ctx, buffer, view_class, view_offset, view_length);
+	}
+
+	~QuickJSSharedBuffer() {
+		if (data) {
+			sab_free(NULL, data);
+		}
+	}
+};
+
+#endif // QUICKJS_SHARED_BUFFER_H
@@ -0,0 +1,112 @@
+#ifndef QUICKJS_TRANSFERRED_BUFFER_H
+#define QUICKJS_TRANSFERRED_BUFFER_H
+
+#include "core/object/ref_counted.h"
+#include "quickjs/quickjs.h"
+
+// Data of an ArrayBuffer detached by `postMessage` with a transfer list, or a typed array of the message viewing it.
+// The receiving context adopts the data as a new ArrayBuffer without copying it.
+class QuickJSTransferredBuffer : public RefCounted {
+	GDCLASS(QuickJSTransferredBuffer, RefCounted);
+
+	uint8_t *data = NULL;
+	size_t size = 0;
+	// NULL if the data was allocated by the runtime allocator, which is memalloc for every binder
+	JSFreeArrayBufferDataFunc *free_func = NULL;
+	void *opaque = NULL;
+	// Set for a typed array of the message, the data belongs to the transferred buffer it views
+	Ref<QuickJSTransferredBuffer> owner;
+	String view_class;
+	uint32_t view_offset = 0;
+	uint32_t view_length = 0;
+	// ArrayBuffer created by the receiving context, shared by the views of the same message
+	JSContext *adopted_context = NULL;
+	JSValue adopted = JS_UNDEFINED;
+
+	static void free_runtime_data(JSRuntime *rt, void *opaque, void *ptr) {
+		memfree(ptr);
+	}
+
+public:
+	// Name of the constructor of a typed array
+	static String get_view_class(JSContext *ctx, JSValueConst p_view) {
+		String view_class;
+		JSValue constructor = JS_GetPropertyStr(ctx, p_view, "constructor");
+		JSValue name = JS_GetPropertyStr(ctx, constructor, "name");
+		if (const char *str = JS_ToCString(ctx, name)) {
+			view_class.parse_utf8(str);
+			JS_FreeCString(ctx, str);
+		}
+		JS_FreeValue(ctx, name);
+		JS_FreeValue(ctx, constructor);
+		return view_class;
+	}
+
+	// Creates a typed array over the buffer, the reference to the buffer is consumed
+	static JSValue new_view(JSContext *ctx, JSValue p_buffer, const String &p_view_class, uint32_t p_offset, uint32_t p_length) {
+		JSValue global = JS_GetGlobalObject(ctx);
+		JSValue constructor = JS_GetPropertyStr(ctx, global, p_view_class.utf8().get_data());
+		JSValue argv[] = { p_buffer, JS_NewUint32(ctx, p_offset), JS_NewUint32(ctx, p_length) };
+		JSValue view = JS_CallConstructor(ctx, constructor, 3, argv);
+		JS_FreeValue(ctx, constructor);
+		JS_FreeValue(ctx, global);
+		JS_FreeValue(ctx, p_buffer);
+		return view;
+	}
+
+	// Takes the data of the ArrayBuffer, which must have been checked with JS_CheckTransferableArrayBuffer
+	bool detach(JSContext *ctx, JSValueConst p_buffer) {
+		data = JS_TransferArrayBuffer(ctx, &size, p_buffer, &free_func, &opaque);
+		return data != NULL;
+	}
+
+	// A typed array of the message whose buffer is transferred, created again over the buffer by the receiver
+	static Ref<QuickJSTransferredBuffer> new_view_of(JSContext *ctx, const Ref<QuickJSTransferredBuffer> &p_owner, JSValueConst p_view, size_t p_offset, size_t p_length) {
+		Ref<QuickJSTransferredBuffer> ret;
+		ret.instantiate();
+		ret->owner = p_owner;
+		ret->view_class = get_view_class(ctx, p_view);
+		ret->view_offset = p_offset;
+		ret->view_length = p_length;
+		return ret;
+	}
+
+	// Creates the ArrayBuffer or the typed array in the receiving context, the data can only be adopted by one context
+	JSValue adopt(JSContext *ctx) {
+		if (owner.is_valid()) {
+			JSValue buffer = owner->adopt(ctx);
+			if (JS_IsException(buffer) || JS_IsUndefined(buffer)) {
+				return buffer;
+			}
+			return new_view(ctx, buffer, view_class, view_offset, view_length);
+		}
+		if (adopted_context == ctx) {
+			return JS_DupValue(ctx, adopted);
+		}
+		ERR_FAIL_NULL_V_MSG(data, JS_UNDEFINED, "The transferred buffer was already adopted.");
+		JSValue buffer = JS_NewArrayBuffer(ctx, data, size, free_func ? free_func : free_runtime_data, opaque, false);
+		data = NULL;
+		if (!JS_IsException(buffer)) {
+			adopted_context = ctx;
+			adopted = JS_DupValue(ctx, buffer);
+		}
+		return buffer;
+	}
+
+	~QuickJSTransferredBuffer() {
+		// Released by the receiving thread once the message is converted
+		if (adopted_context) {
+			JS_FreeValue(adopted_context, adopted);
+		}
+		// The message was never delivered
+		if (data) {
+			if (free_func) {
+				free_func(NULL, opaque, data);
+			} else {
+				memfree(data);
+			}
+		}
+	}
+};
+
+#endif // QUICKJS_TRANSFERRED_BUFFER_H
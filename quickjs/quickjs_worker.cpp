@@ -5,7 +5,6 @@ void QuickJSWorker::thread_main(void *p_this) {
 	QuickJSWorker *self = static_cast<QuickJSWorker *>(p_this);
 
 	self->initialize();
-	self->running = true;
 
 	Error err;
 	String text = FileAccess::get_file_as_string(self->entry_script, &err);
@@ -21,28 +20,15 @@ void QuickJSWorker::thread_main(void *p_this) {
 				self->frame();
 
 				if (onmessage_valid) {
-					List<Variant> messages;
-					{
-						GLOBAL_LOCK_FUNCTION
-						for (List<Variant>::Element *E = self->input_message_queue.front(); E; E = E->next()) {
-							messages.push_back(E->get());
-						}
-						self->input_message_queue.clear();
-					}
-					for (List<Variant>::Element *E = messages.front(); E; E = E->next()) {
-						JSValue argv[] = { variant_to_var(self->ctx, E->get()) };
-						JSValue ret = JS_Call(self->ctx, onmessage_callback, self->global_object, 1, argv);
-						if (JS_IsException(ret)) {
-							JSValue e = JS_GetException(self->ctx);
-							ECMAScriptScriptError err;
-							dump_exception(self->ctx, e, &err);
-							ERR_PRINT(String("Error in worker onmessage callback") + ENDL + self->error_to_string(err));
-							JS_FreeValue(self->ctx, e);
-						}
-						JS_FreeValue(self->ctx, argv[0]);
-					}
+					dispatch_messages(self, onmessage_callback, self->global_object, self->input_channel, self->batch_messages);
+				}
+
+				if (self->output_channel.flush() && self->is_idle()) {
+					// Sleep until the host posts a message or stops the worker
+					self->semaphore.wait();
+				} else {
+					OS::get_singleton()->delay_usec(1000);
 				}
-				OS::get_singleton()->delay_usec(1000);
 			}
 			JS_FreeValue(self->ctx, onmessage_callback);
 		} else {
@@ -67,8 +53,11 @@ JSValue QuickJSWorker::global_worker_post_message(JSContext *ctx, JSValue this_v
 	ERR_FAIL_COND_V(argc < 1, JS_ThrowTypeError(ctx, "message value expected of argument #0"));
 	QuickJSWorker *worker = static_cast<QuickJSWorker *>(get_context_binder(ctx));
 	if (worker) {
-		GLOBAL_LOCK_FUNCTION
-		worker->output_message_queue.push_back(var_to_variant(ctx, argv[0]));
+		Variant message;
+		if (!transfer_message(ctx, argv[0], argc > 1 ? argv[1] : JS_UNDEFINED, message)) {
+			return JS_EXCEPTION;
+		}
+		worker->output_channel.push(message);
 	}
 	return JS_UNDEFINED;
 }
@@ -91,6 +80,7 @@ QuickJSWorker::QuickJSWorker(const QuickJSBinder *p_host_context) :
 		QuickJSBinder() {
 	running = false;
 	host_context = p_host_context;
+	batch_messages = GLOBAL_DEF("JavaScript/worker/batch_messages", false);
 }
 
 QuickJSWorker::~QuickJSWorker() {
@@ -99,6 +89,8 @@ QuickJSWorker::~QuickJSWorker() {
 
 void QuickJSWorker::initialize() {
 	QuickJSBinder::initialize();
+	// Atomics.wait is only allowed in workers so the main thread never blocks
+	JS_SetCanBlock(runtime, true);
 	// onmessage
 	JS_SetPropertyStr(ctx, global_object, "onmessage", JS_NULL);
 	// close
@@ -117,52 +109,80 @@ void QuickJSWorker::uninitialize() {
 	QuickJSBinder::uninitialize();
 }
 
-bool QuickJSWorker::frame_of_host(QuickJSBinder *host, const JSValueConst &value) {
-
-	JSValue onmessage_callback = JS_GetPropertyStr(host->ctx, value, "onmessage");
-	if (JS_IsFunction(host->ctx, onmessage_callback)) {
+bool QuickJSWorker::is_idle() const {
+	if (!input_channel.is_empty() || !frame_callbacks.is_empty() || has_scheduled_tasks() || !workers.is_empty() || !pending_imports.is_empty()) {
+		return false;
+	}
+	return !JS_IsJobPending(runtime);
+}
 
-		List<Variant> messages;
-		{
-			GLOBAL_LOCK_FUNCTION
-			for (List<Variant>::Element *E = output_message_queue.front(); E; E = E->next()) {
-				messages.push_back(E->get());
-			}
-			output_message_queue.clear();
+void QuickJSWorker::dispatch_messages(QuickJSBinder *p_binder, const JSValueConst &p_callback, const JSValueConst &p_this, QuickJSMessageChannel<Variant> &p_channel, bool p_batch) {
+	JSContext *ctx = p_binder->ctx;
+	Variant message;
+	Array batch;
+	while (p_channel.pop(message)) {
+		if (p_batch) {
+			batch.push_back(message);
+			continue;
 		}
+		JSValue argv[] = { variant_to_var(ctx, message) };
+		JSValue ret = JS_Call(ctx, p_callback, p_this, 1, argv);
+		if (JS_IsException(ret)) {
+			JSValue e = JS_GetException(ctx);
+			ECMAScriptScriptError err;
+			dump_exception(ctx, e, &err);
+			ERR_PRINT(String("Error in worker onmessage callback") + ENDL + p_binder->error_to_string(err));
+			JS_FreeValue(ctx, e);
+		}
+		JS_FreeValue(ctx, argv[0]);
+	}
 
-		for (List<Variant>::Element *E = messages.front(); E; E = E->next()) {
-			JSValue argv[] = { variant_to_var(host->ctx, E->get()) };
-			JSValue ret = JS_Call(host->ctx, onmessage_callback, JS_NULL, 1, argv);
-			if (JS_IsException(ret)) {
-				JSValue e = JS_GetException(host->ctx);
-				ECMAScriptScriptError err;
-				dump_exception(host->ctx, e, &err);
-				ERR_PRINT(String("Error in worker onmessage callback") + ENDL + error_to_string(err));
-				JS_FreeValue(host->ctx, e);
-			}
-			JS_FreeValue(host->ctx, argv[0]);
+	if (batch.size()) {
+		// One call for all the messages received since the last dispatch
+		JSValue argv[] = { variant_to_var(ctx, batch) };
+		JSValue ret = JS_Call(ctx, p_callback, p_this, 1, argv);
+		if (JS_IsException(ret)) {
+			JSValue e = JS_GetException(ctx);
+			ECMAScriptScriptError err;
+			dump_exception(ctx, e, &err);
+			ERR_PRINT(String("Error in worker onmessage callback") + ENDL + p_binder->error_to_string(err));
+			JS_FreeValue(ctx, e);
 		}
+		JS_FreeValue(ctx, argv[0]);
+	}
+}
+
+bool QuickJSWorker::frame_of_host(QuickJSBinder *host, const JSValueConst &value) {
+	if (input_channel.has_overflow()) {
+		input_channel.flush();
+		semaphore.post();
 	}
 
+	JSValue onmessage_callback = JS_GetPropertyStr(host->ctx, value, "onmessage");
+	if (JS_IsFunction(host->ctx, onmessage_callback)) {
+		dispatch_messages(host, onmessage_callback, JS_NULL, output_channel, batch_messages);
+	}
 	JS_FreeValue(host->ctx, onmessage_callback);
 	return running;
 }
 
 void QuickJSWorker::post_message_from_host(const Variant &p_message) {
-	GLOBAL_LOCK_FUNCTION
-	input_message_queue.push_back(p_message);
+	input_channel.push(p_message);
+	semaphore.post();
 }
 
 void QuickJSWorker::start(const String &p_path) {
 	ERR_FAIL_COND(running || thread.is_started());
 	entry_script = p_path;
+	// Set before the thread starts so that a stop() issued right away is not lost
+	running = true;
 	thread.start(thread_main, this);
 }
 
 void QuickJSWorker::stop() {
 	if (thread.is_started()) {
 		running = false;
+		semaphore.post();
 		thread.wait_to_finish();
 	}
 }
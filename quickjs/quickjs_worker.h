@@ -1,8 +1,10 @@
 #ifndef QUICKJS_WORKER_H
 #define QUICKJS_WORKER_H
 
+#include "core/os/semaphore.h"
 #include "core/os/thread.h"
 #include "quickjs_binder.h"
+#include "quickjs_message_channel.h"
 
 class QuickJSWorker : public QuickJSBinder {
 	Thread thread;
@@ -11,8 +13,14 @@ class QuickJSWorker : public QuickJSBinder {
 	String entry_script;
 
 	const QuickJSBinder *host_context;
-	List<Variant> input_message_queue;
-	List<Variant> output_message_queue;
+	// Wakes up the worker thread when it has nothing else to do than waiting for messages
+	Semaphore semaphore;
+	bool batch_messages = false;
+	QuickJSMessageChannel<Variant> input_channel; // from the host to the worker
+	QuickJSMessageChannel<Variant> output_channel; // from the worker to the host
+
+	bool is_idle() const;
+	static void dispatch_messages(QuickJSBinder *p_binder, const JSValueConst &p_callback, const JSValueConst &p_this, QuickJSMessageChannel<Variant> &p_channel, bool p_batch);
 
 	static JSValue global_worker_close(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
 	static JSValue global_worker_post_message(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv);
@@ -0,0 +1,328 @@
+#include "quickjs_worker_pool.h"
+#include "core/os/os.h"
+
+void QuickJSWorkerPool::start(int p_thread_count) {
+	ERR_FAIL_COND(running);
+	int thread_count = p_thread_count > 0 ? p_thread_count : OS::get_singleton()->get_processor_count();
+	running = true;
+	threads.resize(thread_count);
+	for (int i = 0; i < thread_count; i++) {
+		threads.write[i] = memnew(QuickJSPoolWorker(this));
+	}
+	// Every queue must exist before a thread tries to steal from it
+	for (int i = 0; i < thread_count; i++) {
+		threads[i]->thread.start(QuickJSPoolWorker::thread_main, threads[i]);
+	}
+}
+
+void QuickJSWorkerPool::stop() {
+	if (!running) return;
+	running = false;
+	for (int i = 0; i < threads.size(); i++) {
+		semaphore.post();
+	}
+	for (int i = 0; i < threads.size(); i++) {
+		threads[i]->thread.wait_to_finish();
+	}
+	for (int i = 0; i < threads.size(); i++) {
+		memdelete(threads[i]);
+	}
+	threads.clear();
+	// The tasks left in the queues or still awaiting are dropped with the threads
+	queued_tasks.set(0);
+	running_tasks.set(0);
+}
+
+QuickJSWorkerPool::~QuickJSWorkerPool() {
+	stop();
+}
+
+bool QuickJSWorkerPool::steal_task(const QuickJSPoolWorker *p_thief, Task &r_task) {
+	for (int i = 0; i < threads.size(); i++) {
+		QuickJSPoolWorker *victim = threads[i];
+		if (victim == p_thief) continue;
+		MutexLock lock(victim->queue_mutex);
+		if (!victim->queue.is_empty()) {
+			r_task = victim->queue.back()->get();
+			victim->queue.pop_back();
+			stolen_tasks.increment();
+			return true;
+		}
+	}
+	return false;
+}
+
+void QuickJSWorkerPool::push_result(const Result &p_result) {
+	running_tasks.decrement();
+	MutexLock lock(result_mutex);
+	results.push_back(p_result);
+}
+
+JSValue QuickJSWorkerPool::run(JSContext *ctx, const String &p_module, const String &p_function, const Array &p_arguments) {
+	JSValue resolving_funcs[2];
+	JSValue promise = JS_NewPromiseCapability(ctx, resolving_funcs);
+	if (JS_IsException(promise)) return promise;
+
+	Task task;
+	task.id = ++next_task_id;
+	task.module = p_module;
+	task.function = p_function;
+	task.arguments = p_arguments;
+	task.submit_time = OS::get_singleton()->get_ticks_usec();
+
+	PendingTask pending;
+	pending.resolving_funcs[0] = resolving_funcs[0];
+	pending.resolving_funcs[1] = resolving_funcs[1];
+	pending.submit_time = task.submit_time;
+	pending_tasks.set(task.id, pending);
+
+	// Round robin, the idle threads take the tasks left behind by the busy ones
+	// Counted before it is visible to the threads so the counter never wraps below zero
+	queued_tasks.increment();
+	QuickJSPoolWorker *thread = threads[next_queue++ % threads.size()];
+	{
+		MutexLock lock(thread->queue_mutex);
+		thread->queue.push_back(task);
+	}
+	semaphore.post();
+	return promise;
+}
+
+void QuickJSWorkerPool::poll(JSContext *ctx) {
+	List<Result> finished;
+	{
+		MutexLock lock(result_mutex);
+		if (results.is_empty()) return;
+		finished = results;
+		results.clear();
+	}
+
+	const uint64_t now = OS::get_singleton()->get_ticks_usec();
+	for (List<Result>::Element *E = finished.front(); E; E = E->next()) {
+		const Result &result = E->get();
+		PendingTask *pending = pending_tasks.getptr(result.id);
+		ERR_CONTINUE(pending == NULL);
+
+		const uint64_t latency = now - pending->submit_time;
+		total_wait_usec += result.start_time - pending->submit_time;
+		total_latency_usec += latency;
+		max_latency_usec = MAX(max_latency_usec, latency);
+
+		JSValue argv[1];
+		JSValue callback;
+		if (result.succeeded) {
+			completed_tasks++;
+			argv[0] = QuickJSBinder::variant_to_var(ctx, result.value);
+			callback = pending->resolving_funcs[0];
+		} else {
+			failed_tasks++;
+			argv[0] = JS_NewError(ctx);
+			JS_DefinePropertyValueStr(ctx, argv[0], "message", QuickJSBinder::to_js_string(ctx, result.error), JS_PROP_WRITABLE | JS_PROP_CONFIGURABLE);
+			callback = pending->resolving_funcs[1];
+		}
+		JSValue ret = JS_Call(ctx, callback, JS_UNDEFINED, 1, argv);
+		JS_FreeValue(ctx, ret);
+		JS_FreeValue(ctx, argv[0]);
+		JS_FreeValue(ctx, pending->resolving_funcs[0]);
+		JS_FreeValue(ctx, pending->resolving_funcs[1]);
+		pending_tasks.erase(result.id);
+	}
+}
+
+void QuickJSWorkerPool::reject_pending_tasks(JSContext *ctx, const String &p_reason) {
+	ERR_FAIL_COND(running);
+	const uint64_t *id = NULL;
+	while ((id = pending_tasks.next(id))) {
+		const PendingTask &pending = pending_tasks.get(*id);
+		failed_tasks++;
+		JSValue argv[1];
+		argv[0] = JS_NewError(ctx);
+		JS_DefinePropertyValueStr(ctx, argv[0], "message", QuickJSBinder::to_js_string(ctx, p_reason), JS_PROP_WRITABLE | JS_PROP_CONFIGURABLE);
+		JSValue ret = JS_Call(ctx, pending.resolving_funcs[1], JS_UNDEFINED, 1, argv);
+		JS_FreeValue(ctx, ret);
+		JS_FreeValue(ctx, argv[0]);
+		JS_FreeValue(ctx, pending.resolving_funcs[0]);
+		JS_FreeValue(ctx, pending.resolving_funcs[1]);
+	}
+	pending_tasks.clear();
+}
+
+void QuickJSWorkerPool::clear_pending_tasks(JSRuntime *rt) {
+	const uint64_t *id = NULL;
+	while ((id = pending_tasks.next(id))) {
+		const PendingTask &pending = pending_tasks.get(*id);
+		JS_FreeValueRT(rt, pending.resolving_funcs[0]);
+		JS_FreeValueRT(rt, pending.resolving_funcs[1]);
+	}
+	pending_tasks.clear();
+}
+
+Dictionary QuickJSWorkerPool::get_metrics() const {
+	const uint64_t settled = completed_tasks + failed_tasks;
+	Dictionary metrics;
+	metrics["threads"] = threads.size();
+	metrics["queued"] = queued_tasks.get();
+	metrics["running"] = running_tasks.get();
+	metrics["completed"] = completed_tasks;
+	metrics["failed"] = failed_tasks;
+	metrics["stolen"] = stolen_tasks.get();
+	metrics["average_wait_usec"] = settled ? double(total_wait_usec) / settled : 0.0;
+	metrics["average_latency_usec"] = settled ? double(total_latency_usec) / settled : 0.0;
+	metrics["max_latency_usec"] = max_latency_usec;
+	return metrics;
+}
+
+QuickJSPoolWorker::QuickJSPoolWorker(QuickJSWorkerPool *p_pool) :
+		QuickJSBinder() {
+	pool = p_pool;
+}
+
+void QuickJSPoolWorker::initialize() {
+	QuickJSBinder::initialize();
+	JS_SetCanBlock(runtime, true);
+	JS_DefinePropertyValueStr(ctx, global_object, "INSIDE_WORKER", JS_TRUE, JS_PROP_ENUMERABLE);
+}
+
+void QuickJSPoolWorker::thread_main(void *p_self) {
+	QuickJSPoolWorker *self = static_cast<QuickJSPoolWorker *>(p_self);
+	QuickJSWorkerPool *pool = self->pool;
+	self->initialize();
+	while (pool->running) {
+		QuickJSWorkerPool::Task task;
+		bool found = self->pop_task(task) || pool->steal_task(self, task);
+		if (found) {
+			pool->queued_tasks.decrement();
+			pool->running_tasks.increment();
+			self->run_task(task);
+		}
+		// Runs the jobs which settle the asynchronous tasks
+		self->frame();
+
+		if (found) continue;
+		if (self->is_idle()) {
+			// Sleep until a task is submitted or the pool stops
+			pool->semaphore.wait();
+		} else {
+			OS::get_singleton()->delay_usec(1000);
+		}
+	}
+	self->uninitialize();
+}
+
+bool QuickJSPoolWorker::pop_task(QuickJSWorkerPool::Task &r_task) {
+	MutexLock lock(queue_mutex);
+	if (queue.is_empty()) return false;
+	r_task = queue.front()->get();
+	queue.pop_front();
+	return true;
+}
+
+bool QuickJSPoolWorker::is_idle() const {
+	if (async_tasks || !frame_callbacks.is_empty() || has_scheduled_tasks() || !workers.is_empty() || !pending_imports.is_empty()) {
+		return false;
+	}
+	return !JS_IsJobPending(runtime);
+}
+
+void QuickJSPoolWorker::run_task(const QuickJSWorkerPool::Task &p_task) {
+	const uint64_t start_time = OS::get_singleton()->get_ticks_usec();
+	JSValue ret = JS_EXCEPTION;
+	JSValue function = JS_UNDEFINED;
+
+	ModuleCache *module = NULL;
+	if (js_module_loader(ctx, p_task.module.utf8().get_data(), this)) {
+		module = module_cache.getptr(p_task.module);
+	}
+	ECMAScriptScriptError script_err;
+	if (module == NULL) {
+		JS_ThrowReferenceError(ctx, "Could not load module '%s'", p_task.module.utf8().get_data());
+	} else if (js_evalute_module(ctx, module, &script_err) == OK) {
+		JSAtom name = get_atom(ctx, p_task.function);
+		for (int i = 0; i < JS_GetModuleExportEntriesCount(module->module); i++) {
+			JSAtom entry = JS_GetModuleExportEntryName(ctx, module->module, i);
+			if (entry == name) {
+				function = JS_GetModuleExportEntry(ctx, module->module, i);
+			}
+			JS_FreeAtom(ctx, entry);
+			if (!JS_IsUndefined(function)) break;
+		}
+		JS_FreeAtom(ctx, name);
+
+		if (JS_IsFunction(ctx, function)) {
+			const int argc = p_task.arguments.size();
+			Vector<JSValue> argv;
+			argv.resize(argc);
+			for (int i = 0; i < argc; i++) {
+				argv.write[i] = variant_to_var(ctx, p_task.arguments[i]);
+			}
+			ret = JS_Call(ctx, function, JS_UNDEFINED, argc, argv.ptrw());
+			for (int i = 0; i < argc; i++) {
+				JS_FreeValue(ctx, argv[i]);
+			}
+		} else {
+			JS_ThrowTypeError(ctx, "'%s' is not a function exported by '%s'", p_task.function.utf8().get_data(), p_task.module.utf8().get_data());
+		}
+		JS_FreeValue(ctx, function);
+	}
+
+	JSValue then = JS_UNDEFINED;
+	if (JS_IsObject(ret)) {
+		then = JS_GetPropertyStr(ctx, ret, "then");
+	}
+	if (JS_IsFunction(ctx, then)) {
+		// Settled once the returned promise is
+		JSValue data[] = { JS_NewInt64(ctx, p_task.id), JS_NewInt64(ctx, start_time) };
+		JSValue callbacks[] = {
+			JS_NewCFunctionData(ctx, task_settled, 1, true, 2, data),
+			JS_NewCFunctionData(ctx, task_settled, 1, false, 2, data),
+		};
+		JSValue chained = JS_Call(ctx, then, ret, 2, callbacks);
+		JS_FreeValue(ctx, callbacks[0]);
+		JS_FreeValue(ctx, callbacks[1]);
+		JS_FreeValue(ctx, ret);
+		ret = chained;
+		if (!JS_IsException(chained)) {
+			async_tasks++;
+		}
+	} else if (JS_IsException(then)) {
+		JS_FreeValue(ctx, ret);
+		ret = JS_EXCEPTION;
+	} else if (!JS_IsException(ret)) {
+		finish_task(p_task.id, start_time, true, ret);
+	}
+	JS_FreeValue(ctx, then);
+
+	if (JS_IsException(ret)) {
+		JSValue e = JS_GetException(ctx);
+		finish_task(p_task.id, start_time, false, e);
+		JS_FreeValue(ctx, e);
+	}
+	JS_FreeValue(ctx, ret);
+}
+
+JSValue QuickJSPoolWorker::task_settled(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int magic, JSValue *func_data) {
+	QuickJSPoolWorker *self = static_cast<QuickJSPoolWorker *>(get_context_binder(ctx));
+	int64_t id, start_time;
+	JS_ToInt64(ctx, &id, func_data[0]);
+	JS_ToInt64(ctx, &start_time, func_data[1]);
+	self->async_tasks--;
+	self->finish_task(id, start_time, magic, argc > 0 ? argv[0] : JS_UNDEFINED);
+	return JS_UNDEFINED;
+}
+
+void QuickJSPoolWorker::finish_task(uint64_t p_id, uint64_t p_start_time, bool p_succeeded, JSValueConst p_value) {
+	QuickJSWorkerPool::Result result;
+	result.id = p_id;
+	result.start_time = p_start_time;
+	result.succeeded = p_succeeded;
+	if (p_succeeded) {
+		result.value = var_to_variant(ctx, p_value);
+	} else if (JS_IsError(ctx, p_value)) {
+		ECMAScriptScriptError err;
+		dump_exception(ctx, p_value, &err);
+		result.error = error_to_string(err);
+	} else {
+		result.error = js_to_string(ctx, p_value);
+	}
+	pool->push_result(result);
+}
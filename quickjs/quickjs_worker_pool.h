@@ -0,0 +1,109 @@
+#ifndef QUICKJS_WORKER_POOL_H
+#define QUICKJS_WORKER_POOL_H
+
+#include "core/os/mutex.h"
+#include "core/os/semaphore.h"
+#include "core/os/thread.h"
+#include "core/templates/safe_refcount.h"
+#include "quickjs_binder.h"
+
+class QuickJSPoolWorker;
+
+// Runs exported functions of modules on a set of warm worker runtimes.
+// Tasks are queued per thread, idle threads steal the tasks queued for the busy ones.
+// The host context owns the pool and settles the promises of the tasks in its frame.
+class QuickJSWorkerPool {
+	friend class QuickJSPoolWorker;
+
+public:
+	struct Task {
+		uint64_t id = 0;
+		String module;
+		String function;
+		Array arguments;
+		uint64_t submit_time = 0;
+	};
+
+	struct Result {
+		uint64_t id = 0;
+		bool succeeded = false;
+		Variant value;
+		String error;
+		uint64_t start_time = 0;
+	};
+
+private:
+	Vector<QuickJSPoolWorker *> threads;
+	bool running = false;
+	// Posted once per submitted task
+	Semaphore semaphore;
+	uint32_t next_queue = 0;
+	uint64_t next_task_id = 0;
+
+	// Filled by the pool threads, drained by the host
+	Mutex result_mutex;
+	List<Result> results;
+
+	struct PendingTask {
+		JSValue resolving_funcs[2];
+		uint64_t submit_time = 0;
+	};
+	HashMap<uint64_t, PendingTask> pending_tasks;
+
+	SafeNumeric<uint32_t> queued_tasks;
+	SafeNumeric<uint32_t> running_tasks;
+	SafeNumeric<uint64_t> stolen_tasks;
+	uint64_t completed_tasks = 0;
+	uint64_t failed_tasks = 0;
+	uint64_t total_wait_usec = 0;
+	uint64_t total_latency_usec = 0;
+	uint64_t max_latency_usec = 0;
+
+	bool steal_task(const QuickJSPoolWorker *p_thief, Task &r_task);
+	void push_result(const Result &p_result);
+
+public:
+	void start(int p_thread_count);
+	void stop();
+	_FORCE_INLINE_ bool is_running() const { return running; }
+	_FORCE_INLINE_ int get_thread_count() const { return threads.size(); }
+
+	// Queues the task and returns the promise of its result
+	JSValue run(JSContext *ctx, const String &p_module, const String &p_function, const Array &p_arguments);
+	// Settles the promises of the finished tasks, called by the host every frame
+	void poll(JSContext *ctx);
+	// Rejects the promises of the unfinished tasks once the pool is stopped
+	void reject_pending_tasks(JSContext *ctx, const String &p_reason);
+	// Releases the promises of the unfinished tasks
+	void clear_pending_tasks(JSRuntime *rt);
+	Dictionary get_metrics() const;
+
+	~QuickJSWorkerPool();
+};
+
+class QuickJSPoolWorker : public QuickJSBinder {
+	friend class QuickJSWorkerPool;
+
+	QuickJSWorkerPool *pool;
+	Thread thread;
+	// The owner thread takes the tasks from the front and the thieves from the back
+	Mutex queue_mutex;
+	List<QuickJSWorkerPool::Task> queue;
+	// Tasks which returned a promise that is not settled yet
+	int async_tasks = 0;
+
+	static void thread_main(void *p_self);
+	bool pop_task(QuickJSWorkerPool::Task &r_task);
+	void run_task(const QuickJSWorkerPool::Task &p_task);
+	void finish_task(uint64_t p_id, uint64_t p_start_time, bool p_succeeded, JSValueConst p_value);
+	bool is_idle() const;
+
+	static JSValue task_settled(JSContext *ctx, JSValueConst this_val, int argc, JSValueConst *argv, int magic, JSValue *func_data);
+
+public:
+	QuickJSPoolWorker(QuickJSWorkerPool *p_pool);
+
+	virtual void initialize();
+};
+
+#endif // QUICKJS_WORKER_POOL_H
@@ -36,6 +36,7 @@
 #include "core/io/file_access_encrypted.h"
 #include "editor/editor_export.h"
 #include "editor/editor_node.h"
+#include "quickjs/quickjs_aot_compiler.h"
 #include "tools/editor_tools.h"
 void editor_init_callback();
 
@@ -43,7 +44,41 @@ class EditorExportECMAScript : public EditorExportPlugin {
 
 	GDCLASS(EditorExportECMAScript, EditorExportPlugin);
 
+	QuickJSAOTCompiler compiler;
+
+	// Bytecode export is not battle tested on all platforms yet, the project opts in
+	static bool is_bytecode_export_enabled() {
+		return GLOBAL_DEF("JavaScript/export/compile_to_bytecode", false);
+	}
+
 public:
+	virtual void _export_begin(const Set<String> &p_features, bool p_debug, const String &p_path, int p_flags) {
+		int script_mode = EditorExportPreset::MODE_SCRIPT_COMPILED;
+		const Ref<EditorExportPreset> &preset = get_export_preset();
+		if (preset.is_valid()) {
+			script_mode = preset->get_script_export_mode();
+		}
+		if (script_mode == EditorExportPreset::MODE_SCRIPT_TEXT || script_mode == EditorExportPreset::MODE_SCRIPT_COMPILED || !is_bytecode_export_enabled())
+			return;
+
+		// Compile every script of the project at once instead of one by one in _export_file
+		Vector<String> files;
+		QuickJSAOTCompiler::find_scripts("res://", files);
+		uint64_t begin_time = OS::get_singleton()->get_ticks_msec();
+		compiler.compile(files);
+		print_verbose(vformat("ECMAScript: %d scripts compiled to bytecode in %d ms", files.size(), OS::get_singleton()->get_ticks_msec() - begin_time));
+
+		CharString manifest = compiler.get_dependency_manifest().utf8();
+		Vector<uint8_t> data;
+		data.resize(manifest.length());
+		memcpy(data.ptrw(), manifest.get_data(), manifest.length());
+		add_file(AOT_DEPENDENCY_MANIFEST, data, false);
+	}
+
+	virtual void _export_end() {
+		compiler.clear();
+	}
+
 	virtual void _export_file(const String &p_path, const String &p_type, const Set<String> &p_features) {
 		int script_mode = EditorExportPreset::MODE_SCRIPT_COMPILED;
 		const Ref<EditorExportPreset> &preset = get_export_preset();
@@ -106,16 +141,11 @@ public:
 			// Clean up temporary file.
 			DirAccess::remove_file_or_error(tmp_path);
 
-		} else {
-#if 0 // Disable compile to bytecode as it is not battle tested on all platform
-			Error err;
-			String code = FileAccess::get_file_as_string(p_path, &err);
-			ERR_FAIL_COND(err != OK);
-
-			Vector<uint8_t> file;
-			ERR_FAIL_COND(ECMAScriptLanguage::get_singleton()->get_main_binder()->compile_to_bytecode(code, p_path, file) != OK);
-			add_file(p_path.get_basename() + "." + extension + "b", file, true);
-#endif
+		} else if (is_bytecode_export_enabled()) {
+			const QuickJSAOTCompiler::Result *result = compiler.get_result(p_path);
+			ERR_FAIL_COND_MSG(!result, "Script '" + p_path + "' was not compiled.");
+			ERR_FAIL_COND_MSG(result->error != OK, result->message);
+			add_file(p_path.get_basename() + "." + extension + "b", result->bytecode, true);
 		}
 	}
 };
@@ -1,6 +1,8 @@
 #include "editor_tools.h"
 #include "../ecmascript_language.h"
+#include "../ecmascript_module_index.h"
 #include "core/math/expression.h"
+#include "editor/editor_file_system.h"
 #include "editor/filesystem_dock.h"
 
 #define TS_IGNORE "//@ts-ignore\n"
@@ -47,6 +49,11 @@ void ECMAScriptPlugin::_notification(int p_what) {
 	}
 }
 
+void ECMAScriptPlugin::_on_filesystem_changed() {
+	// Scripts may have been added, moved or removed
+	ECMAScriptModuleIndex::invalidate();
+}
+
 void ECMAScriptPlugin::_on_menu_item_pressed(int item) {
 	switch (item) {
 		case MenuItem::ITEM_GEN_DECLARE_FILE:
@@ -88,6 +95,8 @@ ECMAScriptPlugin::ECMAScriptPlugin(EditorNode *p_node) {
 	enumberation_file_dialog->connect("file_selected", callable_mp(this, &ECMAScriptPlugin::_export_enumeration_binding_file));
 	EditorNode::get_singleton()->get_gui_base()->add_child(enumberation_file_dialog);
 
+	EditorFileSystem::get_singleton()->connect("filesystem_changed", callable_mp(this, &ECMAScriptPlugin::_on_filesystem_changed));
+
 	ts_ignore_errors.clear();
 	Set<String> ts_ignore_error_members;
 	ts_ignore_errors.insert("ArrayMesh", ts_ignore_error_members);
@@ -27,6 +27,7 @@ protected:
 
 	void _notification(int p_what);
 	void _on_menu_item_pressed(int item);
+	void _on_filesystem_changed();
 	void _export_typescript_declare_file(const String &p_path);
 	void _export_enumeration_binding_file(const String &p_path);
 	void _generate_typescript_project();